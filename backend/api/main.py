@@ -1,44 +1,159 @@
 """
 FastAPI 기반 RAG API 서버
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles  # <--- 추가
-from fastapi.responses import FileResponse   # <--- 추가
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from fastapi.staticfiles import StaticFiles
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Optional, List, Dict, Any, Type, Annotated
 from loguru import logger
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import partial
+from pathlib import Path
+import asyncio
+import base64
+import hashlib
+import msgspec
+import orjson
+import time
 import sys
 import os
 
+from rag.config import CHROMA_PERSIST_DIRECTORY
 from rag.pipeline import RAGPipeline
-from rag.step_by_step import StepByStepRAGPipeline, CATEGORY_INFO
+from rag.genai_client import get_genai_client
+from rag.semantic_cache import SemanticResponseCache
+from rag.session_store import SessionConflictError
+from rag.step_by_step import StepByStepRAGPipeline, CandidateComponent, CATEGORY_INFO
 from modules.multi_agent.orchestrator import AgentOrchestrator, RecommendationResult
 from modules.genai.image_generator import ImageGenerator
 from langchain_google_genai import ChatGoogleGenerativeAI
 
 # 로깅 설정
-logger.remove()
-logger.add(
-    sys.stdout,
-    level="INFO",
-    format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>",
-)
+# 요청 경로의 로그는 f-string 대신 인자로 넘겨, 레벨이 꺼져 있으면 포맷팅 자체를 건너뜀
+LOG_FORMAT = "{time:HH:mm:ss} | {level: <8} | {message}"
+
+
+def configure_logging() -> None:
+    """stdout 로그 싱크 설정 (색상 태그 없이, 중복 등록되지 않도록 기존 싱크 제거 후 추가)"""
+    logger.remove()
+    logger.add(sys.stdout, level=os.getenv("LOG_LEVEL", "INFO"), format=LOG_FORMAT)
+
+# 빌드된 프론트엔드 경로 (Docker 이미지에서는 /app/dist), 존재 여부는 임포트 시 한 번만 확인
+DIST_DIR = Path(__file__).resolve().parent.parent.parent / "dist"
+HAS_DIST = DIST_DIR.is_dir()
+
+# 해시가 붙은 빌드 산출물(dist/assets)은 내용이 바뀌면 파일명도 바뀌므로 재검증 없이 캐시
+ASSETS_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class StrKeyORJSONResponse(ORJSONResponse):
+    """
+    키가 모두 문자열인 응답 전용 ORJSONResponse
+
+    기본 ORJSONResponse는 OPT_NON_STR_KEYS로 모든 dict 키의 타입을 확인하므로
+    약 10% 느리다. 후보 목록처럼 키가 항상 문자열인 응답에만 사용한다
+    (NumPy 값은 기본과 같이 OPT_SERIALIZE_NUMPY로 그대로 직렬화).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+class CachedStaticFiles(StaticFiles):
+    """모든 응답에 장기 Cache-Control 헤더를 붙이는 StaticFiles"""
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = ASSETS_CACHE_CONTROL
+        return response
+
+
+# RAG 파이프라인이 필요한 경로 (미초기화 시 미들웨어에서 바로 503)
+PIPELINE_PATHS = frozenset({"/health", "/stats", "/query", "/query-by-specs", "/retrieve", "/compare"})
+STEP_PIPELINE_PREFIX = "/step/"
+# 멀티 에이전트 오케스트레이터가 필요한 경로
+AGENT_PATHS = frozenset({"/agent/chat"})
+
+
+class PipelineReadyMiddleware:
+    """
+    파이프라인 미초기화 시 라우팅/본문 파싱 전에 본문 없는 503 반환
+
+    각 핸들러의 초기화 확인을 대신하며, 헬스 체크가 몰려도 예외 처리와
+    JSON 본문 생성 비용이 들지 않는다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            path = scope["path"]
+            if (
+                (path in PIPELINE_PATHS and pipeline is None)
+                or (path.startswith(STEP_PIPELINE_PREFIX) and step_pipeline is None)
+                or (path in AGENT_PATHS and orchestrator is None)
+            ):
+                await Response(status_code=503)(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    앱 수명 주기: 시작 시 파이프라인 초기화, 종료 시 스레드 풀 정리
+
+    벡터 DB 자동 초기화가 필요하면 백그라운드 태스크로 실행하여 포트 바인딩을
+    막지 않고, 완료될 때까지 /ready는 503을 반환한다.
+    """
+    configure_logging()
+    app.state.ready = False
+    needs_rebuild = initialize_pipelines()
+    _warm_request_schemas(app)
+
+    if needs_rebuild:
+        app.state.rebuild_task = asyncio.create_task(_background_rebuild(app))
+    else:
+        if WARMUP_ON_STARTUP:
+            await _run_blocking(pipeline.warmup)
+        app.state.ready = True
+        _start_step_preload(app)
+    yield
+    executor.shutdown(wait=False)
+
 
 # FastAPI 앱 생성
 app = FastAPI(
     title="Spckit AI - PC 부품 추천 API",
     description="RAG 기반 PC 부품 추천 시스템",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
-# CORS 설정
+# 파이프라인 초기화 확인 (CORS보다 먼저 등록하여 503 응답에도 CORS 헤더가 붙도록 함)
+app.add_middleware(PipelineReadyMiddleware)
+
+# CORS 설정 (허용 오리진은 CORS_ORIGINS, 쉼표로 구분)
+# 프리플라이트 응답은 CORS_MAX_AGE초 동안 브라우저에 캐시됨
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:5173").split(",")
+    if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # 프로덕션에서는 특정 도메인만 허용
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Content-Type", "Authorization", "If-None-Match"],
+    expose_headers=["ETag"],
+    max_age=int(os.getenv("CORS_MAX_AGE", "600")),
 )
 
 # RAG 파이프라인 전역 인스턴스
@@ -47,59 +162,145 @@ step_pipeline: Optional[StepByStepRAGPipeline] = None
 orchestrator: Optional[AgentOrchestrator] = None
 image_generator: Optional[ImageGenerator] = None
 
+# 동기 파이프라인 호출(임베딩, 벡터 검색, LLM, 에이전트, 이미지 생성)을 실행할 스레드 풀
+# 이벤트 루프가 블로킹되지 않도록 모든 파이프라인 호출은 여기서 실행
+# 대부분 외부 API 응답을 기다리는 I/O 대기이므로 CPU 수보다 넉넉하게 설정
+executor = ThreadPoolExecutor(max_workers=int(os.getenv("RAG_WORKERS", "32")))
+
+# 쿼리 임베딩 기반 응답 캐시 (/query, /query-by-specs)
+semantic_cache = SemanticResponseCache()
+semantic_cache_lock = asyncio.Lock()
+
+# 후보 목록 직렬화기 (후보마다 model_dump를 호출하지 않고 리스트를 한 번에 변환)
+_CANDIDATE_LIST_ADAPTER = TypeAdapter(List[CandidateComponent])
+
+# 목적 한글 표기 / 단계 번호별 이름 (인덱스 = 단계 번호, 0은 완료)
+_PURPOSE_KR: Dict[str, str] = {"general": "일반/가정", "gaming": "게이밍", "workstation": "작업", "streaming": "방송"}
+_STEP_NAME_MAP = ("완료", "CPU", "메인보드", "RAM", "GPU", "SSD", "파워", "쿨러", "케이스")
+
+# CATEGORY_INFO에 없는 카테고리용 기본값 (요청마다 빈 dict를 만들지 않도록 공유, 읽기 전용)
+_EMPTY_CATEGORY_INFO: Dict[str, Any] = {}
+
+# Step 후보 응답 캐시 (세션 버전이 같으면 같은 후보를 재사용, ETag로 304 응답)
+# step 없이 요청하면 같은 URL이 선택/건너뛰기 후 다른 단계를 가리키므로,
+# 브라우저가 매번 ETag로 재검증하도록 no-cache 사용 (304는 여전히 저렴)
+CANDIDATES_CACHE_SIZE = 512
+CANDIDATES_CACHE_CONTROL = "private, no-cache"
+_candidates_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
+# 시작 시 임베딩 API 연결과 벡터 인덱스를 미리 준비 (첫 요청 지연 제거)
+WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "true").lower() == "true"
+
+# 시작 시 Step-by-Step 첫 단계(CPU) 검색 결과 미리 조회 (/step/start 첫 응답의 검색 지연 제거)
+# 워커마다 목적 수(4회)만큼 벡터 검색을 수행하며 LLM은 호출하지 않음
+STEP_PRELOAD_ON_STARTUP = os.getenv("STEP_PRELOAD_ON_STARTUP", "true").lower() == "true"
+
+# 멀티 워커 시작 시 벡터 DB 자동 초기화는 락 파일을 먼저 만든 워커 하나만 수행
+REBUILD_LOCK_PATH = Path(CHROMA_PERSIST_DIRECTORY) / ".rebuild.lock"
+REBUILD_LOCK_STALE = 3600
+REBUILD_POLL_INTERVAL = 10
+
+# 벡터 DB 통계 캐시 (/ready, /stats 폴링이 매번 DB를 조회하지 않도록)
+STATS_CACHE_TTL = float(os.getenv("STATS_CACHE_TTL", "5"))
+_stats_cache: Dict[str, Any] = {"value": None, "expires_at": 0.0}
+_stats_lock = asyncio.Lock()
 
-# Pydantic 모델 정의
-class QueryRequest(BaseModel):
-    query: str = Field(..., description="사용자 쿼리", min_length=1)
-    top_k: int = Field(5, description="검색할 부품 수", ge=1, le=20)
-    category: Optional[str] = Field(None, description="특정 카테고리로 제한")
-    include_context: bool = Field(False, description="검색된 원본 데이터 포함 여부")
 
+# 요청 모델 정의
+# 호출 빈도가 높은 POST 엔드포인트는 msgspec.Struct로 JSON을 바로 디코딩+검증
+class QueryRequest(msgspec.Struct, kw_only=True):
+    query: Annotated[str, msgspec.Meta(min_length=1, description="사용자 쿼리")]
+    top_k: Annotated[int, msgspec.Meta(ge=1, le=20, description="검색할 부품 수")] = 5
+    category: Annotated[Optional[str], msgspec.Meta(description="특정 카테고리로 제한")] = None
+    include_context: Annotated[bool, msgspec.Meta(description="검색된 원본 데이터 포함 여부")] = False
 
-class SpecsRequest(BaseModel):
-    budget: Optional[int] = Field(None, description="예산 (만원)")
-    purpose: Optional[str] = Field(None, description="사용 목적")
-    categories: List[str] = Field(
-        ["cpu", "gpu", "memory"], description="검색할 카테고리 리스트"
+
+class RetrieveRequest(msgspec.Struct, kw_only=True):
+    query: Annotated[str, msgspec.Meta(min_length=1, description="검색 쿼리")]
+    top_k: Annotated[int, msgspec.Meta(ge=1, le=50, description="검색할 부품 수")] = 5
+    category: Annotated[Optional[str], msgspec.Meta(description="특정 카테고리로 제한")] = None
+
+
+class SpecsRequest(msgspec.Struct, kw_only=True):
+    budget: Annotated[Optional[int], msgspec.Meta(description="예산 (만원)")] = None
+    purpose: Annotated[Optional[str], msgspec.Meta(description="사용 목적")] = None
+    categories: Annotated[List[str], msgspec.Meta(description="검색할 카테고리 리스트")] = msgspec.field(
+        default_factory=lambda: ["cpu", "gpu", "memory"]
     )
-    preferences: Optional[str] = Field(None, description="추가 선호사항")
-    top_k: int = Field(3, description="각 카테고리별 검색 결과 수", ge=1, le=10)
+    preferences: Annotated[Optional[str], msgspec.Meta(description="추가 선호사항")] = None
+    top_k: Annotated[int, msgspec.Meta(ge=1, le=10, description="각 카테고리별 검색 결과 수")] = 3
 
 
-class CompareRequest(BaseModel):
-    component_ids: List[str] = Field(..., description="비교할 부품 ID 리스트", min_items=2)
+class CompareRequest(msgspec.Struct, kw_only=True):
+    component_ids: Annotated[List[str], msgspec.Meta(min_length=2, description="비교할 부품 ID 리스트")]
 
 
 # Step-by-Step 관련 모델
-class StepStartRequest(BaseModel):
-    budget: int = Field(..., description="총 예산 (원)", ge=100000)
-    purpose: str = Field("general", description="사용 목적 (gaming, workstation, general)")
+class StepStartRequest(msgspec.Struct, kw_only=True):
+    budget: Annotated[int, msgspec.Meta(ge=100000, description="총 예산 (원)")]
+    purpose: Annotated[str, msgspec.Meta(description="사용 목적 (gaming, workstation, general)")] = "general"
+
 
+class StepSelectRequest(msgspec.Struct, kw_only=True):
+    step: Annotated[int, msgspec.Meta(ge=1, le=8, description="현재 단계 번호")]
+    component_id: Annotated[str, msgspec.Meta(description="선택한 부품 ID")]
+    component_data: Annotated[Optional[Dict[str, Any]], msgspec.Meta(description="부품 상세 정보")] = None
 
-class StepSelectRequest(BaseModel):
-    step: int = Field(..., description="현재 단계 번호", ge=1, le=8)
-    component_id: str = Field(..., description="선택한 부품 ID")
-    component_data: Optional[Dict[str, Any]] = Field(None, description="부품 상세 정보")
 
+# Step-by-Step 새 API 모델 (단계별 부품 선택 요청)
+class StepRequest(msgspec.Struct, kw_only=True):
+    query: Annotated[str, msgspec.Meta(description="초기 요구사항 또는 선택 의도")]
+    session_id: Annotated[Optional[str], msgspec.Meta(description="세션 ID (첫 호출 시 None)")] = None
+    current_step: Annotated[int, msgspec.Meta(ge=0, le=8, description="현재 단계 (0: 세션 시작, 1-8: 각 단계)")] = 0
+    selected_component_id: Annotated[Optional[str], msgspec.Meta(description="이전 단계에서 선택한 부품 ID")] = None
+    budget: Annotated[Optional[int], msgspec.Meta(description="예산 (원)")] = None
+    purpose: Annotated[Optional[str], msgspec.Meta(description="목적 (gaming, workstation, etc)")] = None
+
+
+class AgentChatRequest(msgspec.Struct, kw_only=True):
+    query: Annotated[str, msgspec.Meta(description="사용자 요청 메시지")]
+    budget: Annotated[Optional[int], msgspec.Meta(description="예산 (원)")] = None
+    purpose: Annotated[Optional[str], msgspec.Meta(description="주용도 (gaming, workstation, etc)")] = None
+    preferences: Annotated[Optional[Dict[str, Any]], msgspec.Meta(description="추가 선호사항")] = msgspec.field(
+        default_factory=dict
+    )
 
-class AgentChatRequest(BaseModel):
-    query: str = Field(..., description="사용자 요청 메시지")
-    budget: Optional[int] = Field(None, description="예산 (원)")
-    purpose: Optional[str] = Field(None, description="주용도 (gaming, workstation, etc)")
-    preferences: Optional[Dict[str, Any]] = Field(default_factory=dict, description="추가 선호사항")
 
+class GenerateImageRequest(msgspec.Struct, kw_only=True):
+    components: Annotated[List[Dict[str, Any]], msgspec.Meta(description="선택된 부품 목록")]
+    purpose: Annotated[str, msgspec.Meta(description="사용 목적")] = "gaming"
+
+
+# 엔드포인트별 msgspec 디코더 (시작 시 워밍업용)
+_MSGSPEC_DECODERS: List[msgspec.json.Decoder] = []
+
+
+def _msgspec_body(struct_type: Type[msgspec.Struct]):
+    """요청 본문을 msgspec으로 디코딩하는 FastAPI 의존성 생성"""
+    decoder = msgspec.json.Decoder(struct_type)
+    _MSGSPEC_DECODERS.append(decoder)
+
+    async def parse(request: Request):
+        try:
+            return decoder.decode(await request.body())
+        except (msgspec.ValidationError, msgspec.DecodeError) as e:
+            raise HTTPException(status_code=422, detail=str(e))
 
-# Step-by-Step 새 API 모델
-class StepRequest(BaseModel):
-    """단계별 부품 선택 요청"""
-    session_id: Optional[str] = Field(None, description="세션 ID (첫 호출 시 None)")
-    query: str = Field(..., description="초기 요구사항 또는 선택 의도")
-    current_step: int = Field(0, description="현재 단계 (0: 세션 시작, 1-8: 각 단계)", ge=0, le=8)
-    selected_component_id: Optional[str] = Field(None, description="이전 단계에서 선택한 부품 ID")
-    budget: Optional[int] = Field(None, description="예산 (원)")
-    purpose: Optional[str] = Field(None, description="목적 (gaming, workstation, etc)")
+    return Depends(parse)
 
 
+def _msgspec_openapi(struct_type: Type[msgspec.Struct]) -> Dict[str, Any]:
+    """msgspec 모델의 JSON 스키마를 OpenAPI requestBody로 변환 (/docs 표시용)"""
+    _, components = msgspec.json.schema_components((struct_type,))
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": components[struct_type.__name__]}},
+        }
+    }
+
+
+# Pydantic 모델 (응답 스키마로 쓰이는 모델)
 class ComponentCandidate(BaseModel):
     """부품 후보 정보"""
     id: str
@@ -125,21 +326,18 @@ class StepResponse(BaseModel):
     is_final: bool
     total_price: int = 0
     category_description: Optional[str] = None
-    category_description: Optional[str] = None
     spec_meanings: Optional[Dict[str, str]] = None
 
 
-class GenerateImageRequest(BaseModel):
-    """이미지 생성 요청"""
-    components: List[Dict[str, Any]] = Field(..., description="선택된 부품 목록")
-    purpose: str = Field("gaming", description="사용 목적")
-
+# 초기화
+def initialize_pipelines() -> bool:
+    """
+    앱 시작 시 RAG 파이프라인 초기화
 
-# 이벤트 핸들러
-@app.on_event("startup")
-async def startup_event():
-    """앱 시작 시 RAG 파이프라인 초기화 및 벡터 DB 자동 초기화"""
-    global pipeline, step_pipeline, orchestrator  # [수정] orchestrator 추가
+    Returns:
+        벡터 DB가 비어 있어 백그라운드 자동 초기화가 필요한지 여부
+    """
+    global pipeline, step_pipeline, orchestrator, image_generator
     logger.info("=" * 60)
     logger.info("🚀 RAG 파이프라인 초기화 중...")
     logger.info("=" * 60)
@@ -152,6 +350,7 @@ async def startup_event():
         
         # RAG 파이프라인 초기화
         pipeline = RAGPipeline()
+        needs_rebuild = False
         
         # 벡터 DB 상태 확인
         try:
@@ -164,23 +363,9 @@ async def startup_event():
         if doc_count == 0:
             if auto_init:
                 logger.warning("⚠️  벡터 데이터베이스가 비어있습니다.")
-                logger.info("🔧 개발 모드: 자동 초기화를 시작합니다...")
-                logger.info("⏱️  이 작업은 약 10-15분이 소요될 수 있습니다.")
-                logger.info("📊 135,660개의 문서를 임베딩하는 중입니다...")
-                logger.info("")
-                
-                try:
-                    result = pipeline.initialize_database(force_rebuild=True)
-                    logger.info("")
-                    logger.success("✅ 벡터 데이터베이스 초기화 완료!")
-                    logger.info(f"📈 총 문서 수: {result.get('total_documents', 0)}개")
-                except Exception as init_error:
-                    logger.error("❌ 벡터 DB 자동 초기화 실패")
-                    logger.error(f"오류 내용: {str(init_error)}")
-                    logger.error("")
-                    logger.error("수동으로 초기화하려면 다음 명령어를 실행하세요:")
-                    logger.error("  python backend/scripts/init_database.py")
-                    raise RuntimeError(f"벡터 DB 자동 초기화 실패: {str(init_error)}")
+                logger.info("🔧 개발 모드: 백그라운드에서 자동 초기화를 시작합니다...")
+                logger.info("⏱️  이 작업은 약 10-15분이 소요될 수 있습니다. 완료 전까지 /ready는 503을 반환합니다.")
+                needs_rebuild = True
             else:
                 logger.error("❌ 벡터 데이터베이스가 비어있습니다!")
                 logger.error("")
@@ -213,7 +398,11 @@ async def startup_event():
         logger.info("✅ Step-by-Step 파이프라인 초기화 완료!")
 
         # 이미지 생성기 초기화
-        image_generator = ImageGenerator(api_key=llm_api_key)
+        # 임베딩/추천 생성과 같은 커넥션 풀을 쓰도록 공유 클라이언트 전달
+        image_generator = ImageGenerator(
+            api_key=llm_api_key,
+            client=get_genai_client(llm_api_key) if llm_api_key else None,
+        )
         logger.info("🎨 이미지 생성기 초기화 완료!")
 
         # 멀티 에이전트 오케스트레이터 초기화
@@ -221,6 +410,7 @@ async def startup_event():
         logger.info("🤖 멀티 에이전트 오케스트레이터 초기화 완료!")
         
         logger.info("=" * 60)
+        return needs_rebuild
         
     except Exception as e:
         logger.error("=" * 60)
@@ -229,25 +419,217 @@ async def startup_event():
         raise
 
 
-# API 엔드포인트
-@app.get("/")
-async def root():
-    """헬스 체크"""
+def _acquire_rebuild_lock() -> bool:
+    """
+    벡터 DB 재구축 락 파일 생성 시도 (워커 간 중복 임베딩 방지)
+
+    REBUILD_LOCK_STALE초보다 오래된 락은 비정상 종료한 워커가 남긴 것으로 보고 제거한다.
+    """
+    REBUILD_LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        if time.time() - REBUILD_LOCK_PATH.stat().st_mtime > REBUILD_LOCK_STALE:
+            logger.warning("오래된 벡터 DB 재구축 락 제거: {}", REBUILD_LOCK_PATH)
+            REBUILD_LOCK_PATH.unlink(missing_ok=True)
+    except FileNotFoundError:
+        pass
+
+    try:
+        fd = os.open(REBUILD_LOCK_PATH, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        return False
+    os.write(fd, str(os.getpid()).encode())
+    os.close(fd)
+    return True
+
+
+def _warm_request_schemas(app: FastAPI) -> None:
+    """
+    첫 요청 전에 지연 생성되는 스키마/디코더 경로를 미리 실행
+
+    Pydantic 모델과 msgspec 디코더는 임포트 시 이미 만들어지므로, 남은 지연 생성
+    비용은 OpenAPI 스키마(/docs 첫 요청)와 디코더 첫 호출뿐이다.
+    """
+    app.openapi()
+    for decoder in _MSGSPEC_DECODERS:
+        try:
+            decoder.decode(b"{}")
+        except msgspec.ValidationError:
+            pass
+
+
+async def _background_rebuild(app: FastAPI):
+    """
+    벡터 DB 자동 초기화 (백그라운드)
+
+    수 분이 걸리므로 요청 처리용 스레드 풀이 아닌 별도 스레드에서 실행하고,
+    완료되면 레디 상태로 전환한다.
+    """
+    # 여러 워커가 동시에 시작해도 임베딩은 한 워커만 수행하고 나머지는 완료를 기다림
+    while not _acquire_rebuild_lock():
+        logger.info("⏳ 다른 워커가 벡터 DB를 초기화하는 중입니다. 완료를 기다립니다...")
+        await asyncio.sleep(REBUILD_POLL_INTERVAL)
+        try:
+            doc_count = (await _run_blocking(pipeline.get_stats)).get("total_documents", 0)
+        except Exception:
+            doc_count = 0
+        if doc_count > 0:
+            logger.success(f"✅ 벡터 데이터베이스 초기화 완료! (다른 워커, 문서 수: {doc_count}개)")
+            break
+    else:
+        logger.info("📊 벡터 DB 문서를 임베딩하는 중입니다...")
+        try:
+            result = await asyncio.to_thread(pipeline.initialize_database, force_rebuild=True)
+        except Exception as init_error:
+            logger.error("❌ 벡터 DB 자동 초기화 실패")
+            logger.error(f"오류 내용: {str(init_error)}")
+            logger.error("")
+            logger.error("수동으로 초기화하려면 다음 명령어를 실행하세요:")
+            logger.error("  python backend/scripts/init_database.py")
+            return
+        finally:
+            REBUILD_LOCK_PATH.unlink(missing_ok=True)
+
+        logger.success("✅ 벡터 데이터베이스 초기화 완료!")
+        logger.info(f"📈 총 문서 수: {result.get('total_documents', 0)}개")
+
+    _stats_cache["value"] = None  # 재구축 전 통계 폐기
+    if WARMUP_ON_STARTUP:
+        await _run_blocking(pipeline.warmup)
+    app.state.ready = True
+    _start_step_preload(app)
+
+
+def _start_step_preload(app: FastAPI) -> None:
+    """자주 쓰이는 목적의 첫 단계 검색 결과를 백그라운드에서 미리 조회"""
+    if STEP_PRELOAD_ON_STARTUP and step_pipeline is not None:
+        app.state.preload_task = asyncio.create_task(_run_blocking(step_pipeline.preload_first_step))
+
+
+async def _run_blocking(func, *args, **kwargs):
+    """동기 함수를 스레드 풀에서 실행하고 결과를 기다림"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+
+
+async def _cached_stats() -> Dict[str, Any]:
+    """TTL 동안 재사용되는 벡터 DB 통계"""
+    # 캐시가 유효하면 락 없이 바로 반환 (헬스 체크 폴링 경로)
+    if _stats_cache["value"] is not None and time.monotonic() < _stats_cache["expires_at"]:
+        return _stats_cache["value"]
+
+    async with _stats_lock:
+        now = time.monotonic()
+        if _stats_cache["value"] is None or now >= _stats_cache["expires_at"]:
+            _stats_cache["value"] = await _run_blocking(pipeline.get_stats)
+            _stats_cache["expires_at"] = now + STATS_CACHE_TTL
+        return _stats_cache["value"]
+
+
+def _embed_for_cache(text: str) -> Optional[List[float]]:
+    """시맨틱 캐시 조회용 쿼리 임베딩 (실패 시 None)"""
+    try:
+        return pipeline.embedder.embed_query(text)
+    except Exception as e:
+        logger.warning(f"캐시용 쿼리 임베딩 실패: {str(e)}")
+        return None
+
+
+def _candidates_etag(cache_key: tuple) -> str:
+    """(세션, 단계, 세션 버전, top_k)로부터 약한 ETag 생성
+
+    LLM 분석 문구는 워커마다 다를 수 있어 바이트 단위 동일성을 보장하지 않으므로 W/ 사용
+    """
+    digest = hashlib.blake2b(":".join(map(str, cache_key)).encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더에 etag가 포함되어 있는지 확인 (약한 ETag 비교)"""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def _build_candidates_payload(result) -> Dict[str, Any]:
+    """StepResult를 /step/{session_id}/candidates 응답으로 변환"""
+    # 카테고리 정보 추가
+    category_info = CATEGORY_INFO.get(result.category, {})
+
+    # 응답 모델 검증을 거치지 않고 바로 직렬화 (후보 목록이 응답의 대부분)
     return {
-        "service": "Spckit AI - PC Component Recommendation API",
-        "status": "running",
-        "version": "1.0.0",
+        "session_id": result.session_id,
+        "step": result.step,
+        "category": result.category,
+        "category_name": category_info.get("name", result.category),
+        "category_description": category_info.get("description", ""),
+        "key_specs": category_info.get("key_specs", []),
+        "spec_meanings": category_info.get("spec_meanings", {}),
+        "candidates": _CANDIDATE_LIST_ADAPTER.dump_python(result.candidates),
+        "allocated_budget": result.allocated_budget,
+        "remaining_budget": result.remaining_budget,
+        "next_step": result.next_step,
+        "is_final_step": result.is_final_step
     }
 
 
+def _build_candidates(raw: List[CandidateComponent], category: str) -> List[ComponentCandidate]:
+    """
+    StepResult 후보를 /step/next 응답 후보로 변환
+
+    CandidateComponent는 파이프라인에서 이미 검증된 데이터이므로
+    model_construct로 재검증 없이 생성한다.
+    """
+    return [
+        ComponentCandidate.model_construct(
+            id=c.component_id,
+            name=c.name,
+            price=c.price,
+            category=category,
+            match_score=c.match_score,
+            specs=c.specs,
+            hashtags=c.hashtags,
+            representative_specs=c.representative_specs,
+            compatibility_status=c.compatibility_status,
+            danawa_url=c.danawa_url,
+            image_url=c.image_url
+        )
+        for c in raw
+    ]
+
+
+def _step_response(response: "StepResponse") -> StrKeyORJSONResponse:
+    """
+    StepResponse를 바로 직렬화하여 반환
+
+    핸들러가 만든 모델은 이미 검증되었으므로, response_model 재검증을 건너뛰고
+    orjson으로 직렬화한다 (response_model은 OpenAPI 문서용으로만 유지).
+    """
+    return StrKeyORJSONResponse(response.model_dump())
+
+
+# API 엔드포인트
 @app.get("/health")
 async def health_check():
-    """시스템 상태 확인"""
+    """
+    라이브니스 체크
+
+    파이프라인이 초기화되어 있으면 본문 없이 204를 반환합니다 (미초기화 시 503).
+    벡터 DB를 조회하지 않습니다. DB 상태까지 확인하려면 /ready를 사용하세요.
+    """
+    return Response(status_code=204)
+
+
+@app.get("/ready")
+async def readiness_check():
+    """레디니스 체크 (벡터 DB 통계 포함)"""
     if pipeline is None:
         raise HTTPException(status_code=503, detail="RAG 파이프라인이 초기화되지 않았습니다.")
+    if not getattr(app.state, "ready", False):
+        raise HTTPException(status_code=503, detail="벡터 데이터베이스를 초기화하는 중입니다.")
 
     try:
-        stats = pipeline.get_stats()
+        stats = await _cached_stats()
         return {
             "status": "healthy",
             "pipeline": "initialized",
@@ -257,40 +639,75 @@ async def health_check():
         raise HTTPException(status_code=500, detail=f"상태 확인 실패: {str(e)}")
 
 
-@app.post("/query")
-async def query_components(request: QueryRequest) -> Dict[str, Any]:
+@app.post("/query", openapi_extra=_msgspec_openapi(QueryRequest))
+async def query_components(request: QueryRequest = _msgspec_body(QueryRequest)) -> Dict[str, Any]:
     """
     PC 부품 추천 쿼리
 
     사용자의 자연어 쿼리를 받아 관련 부품을 검색하고 추천을 생성합니다.
     """
-    if pipeline is None:
-        raise HTTPException(status_code=503, detail="RAG 파이프라인이 초기화되지 않았습니다.")
-
     try:
-        logger.info(f"쿼리 요청: '{request.query}'")
-        result = pipeline.query(
+        logger.info("쿼리 요청: '{}'", request.query)
+        cache_key = ("query", request.top_k, request.category, request.include_context)
+        query_embedding = await _run_blocking(_embed_for_cache, request.query)
+
+        if query_embedding is not None:
+            async with semantic_cache_lock:
+                cached = semantic_cache.lookup(query_embedding, cache_key)
+            if cached is not None:
+                return {**cached, "cache": "hit"}
+
+        result = await _run_blocking(
+            pipeline.query,
             user_query=request.query,
             top_k=request.top_k,
             category=request.category,
             include_context=request.include_context,
+            query_embedding=query_embedding,
         )
+
+        if query_embedding is not None:
+            async with semantic_cache_lock:
+                semantic_cache.store(query_embedding, cache_key, result)
         return result
     except Exception as e:
         logger.error(f"쿼리 처리 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"쿼리 처리 실패: {str(e)}")
 
 
-@app.post("/query-by-specs")
-async def query_by_specifications(request: SpecsRequest) -> Dict[str, Any]:
+@app.post("/retrieve", openapi_extra=_msgspec_openapi(RetrieveRequest))
+async def retrieve_components(request: RetrieveRequest = _msgspec_body(RetrieveRequest)) -> Dict[str, Any]:
+    """
+    부품 검색 (LLM 생성 없음)
+
+    벡터 검색 결과(ID, 유사도, 메타데이터)만 반환합니다. 후보 목록만 필요한
+    클라이언트는 /query 대신 이 엔드포인트를 사용하면 LLM 호출 지연이 없습니다.
+    """
+    try:
+        results = await _run_blocking(
+            pipeline.retriever.retrieve,
+            query=request.query,
+            top_k=request.top_k,
+            category=request.category,
+        )
+        return {
+            "query": request.query,
+            "ids": [r["id"] for r in results],
+            "scores": [r["similarity"] for r in results],
+            "metadatas": [r["metadata"] for r in results],
+        }
+    except Exception as e:
+        logger.error(f"부품 검색 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"검색 실패: {str(e)}")
+
+
+@app.post("/query-by-specs", openapi_extra=_msgspec_openapi(SpecsRequest))
+async def query_by_specifications(request: SpecsRequest = _msgspec_body(SpecsRequest)) -> Dict[str, Any]:
     """
     사양 기반 부품 추천
 
     예산, 목적 등의 사양을 기반으로 최적의 부품 조합을 추천합니다.
     """
-    if pipeline is None:
-        raise HTTPException(status_code=503, detail="RAG 파이프라인이 초기화되지 않았습니다.")
-
     try:
         requirements = {
             "budget": request.budget,
@@ -299,30 +716,49 @@ async def query_by_specifications(request: SpecsRequest) -> Dict[str, Any]:
             "preferences": request.preferences,
         }
 
-        logger.info(f"사양 기반 쿼리: {requirements}")
-        result = pipeline.query_by_specs(
+        logger.info("사양 기반 쿼리: {}", requirements)
+        # 예산/목적/카테고리는 정확히 일치해야 하므로 키로 분리하고, 자유 텍스트(선호사항)만 임베딩
+        # (목적은 파이프라인의 예산 배분을 바꾸므로 임베딩 유사도로 묶으면 안 됨)
+        cache_key = (
+            "query-by-specs", request.top_k, request.budget, request.purpose, tuple(request.categories)
+        )
+        query_embedding = None
+        if request.preferences is not None:
+            query_embedding = await _run_blocking(_embed_for_cache, request.preferences)
+
+        if query_embedding is not None:
+            async with semantic_cache_lock:
+                cached = semantic_cache.lookup(query_embedding, cache_key)
+            if cached is not None:
+                return {**cached, "cache": "hit"}
+
+        result = await _run_blocking(
+            pipeline.query_by_specs,
             requirements=requirements,
             top_k=request.top_k,
         )
+
+        if query_embedding is not None:
+            async with semantic_cache_lock:
+                semantic_cache.store(query_embedding, cache_key, result)
         return result
     except Exception as e:
         logger.error(f"사양 기반 쿼리 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"쿼리 처리 실패: {str(e)}")
 
 
-@app.post("/compare")
-async def compare_components(request: CompareRequest) -> Dict[str, Any]:
+@app.post("/compare", openapi_extra=_msgspec_openapi(CompareRequest))
+async def compare_components(request: CompareRequest = _msgspec_body(CompareRequest)) -> Dict[str, Any]:
     """
     부품 비교
 
     여러 부품을 비교 분석하여 각각의 장단점과 추천 대상을 제시합니다.
     """
-    if pipeline is None:
-        raise HTTPException(status_code=503, detail="RAG 파이프라인이 초기화되지 않았습니다.")
-
     try:
-        logger.info(f"부품 비교: {len(request.component_ids)}개")
-        result = pipeline.compare_components(component_ids=request.component_ids)
+        logger.info("부품 비교: {}개", len(request.component_ids))
+        result = await _run_blocking(
+            pipeline.compare_components, component_ids=request.component_ids
+        )
         return result
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -338,11 +774,8 @@ async def get_statistics() -> Dict[str, Any]:
 
     벡터 데이터베이스의 통계 정보를 반환합니다.
     """
-    if pipeline is None:
-        raise HTTPException(status_code=503, detail="RAG 파이프라인이 초기화되지 않았습니다.")
-
     try:
-        stats = pipeline.get_stats()
+        stats = await _cached_stats()
         return stats
     except Exception as e:
         logger.error(f"통계 조회 실패: {str(e)}")
@@ -353,25 +786,24 @@ async def get_statistics() -> Dict[str, Any]:
 # Step-by-Step API 엔드포인트
 # =============================================================================
 
-@app.post("/step/start")
-async def start_step_session(request: StepStartRequest) -> Dict[str, Any]:
+@app.post("/step/start", openapi_extra=_msgspec_openapi(StepStartRequest))
+async def start_step_session(request: StepStartRequest = _msgspec_body(StepStartRequest)) -> Dict[str, Any]:
     """
     Step-by-Step 세션 시작
     
     예산과 목적을 받아 새 세션을 생성하고 CPU 선택 단계를 시작합니다.
     """
-    if step_pipeline is None:
-        raise HTTPException(status_code=503, detail="Step-by-Step 파이프라인이 초기화되지 않았습니다.")
-    
     try:
-        logger.info(f"Step 세션 시작: 예산={request.budget:,}원, 목적={request.purpose}")
-        session = step_pipeline.start_session(
+        logger.info("Step 세션 시작: 예산={:,}원, 목적={}", request.budget, request.purpose)
+        session = await _run_blocking(
+            step_pipeline.start_session,
             budget=request.budget,
             purpose=request.purpose
         )
         
         # 첫 단계(CPU) 후보 자동 조회
-        candidates_result = step_pipeline.get_step_candidates(
+        candidates_result = await _run_blocking(
+            step_pipeline.get_step_candidates,
             session_id=session.session_id,
             step=1
         )
@@ -380,7 +812,7 @@ async def start_step_session(request: StepStartRequest) -> Dict[str, Any]:
             "session_id": session.session_id,
             "step": 1,
             "category": "cpu",
-            "candidates": [c.model_dump() for c in candidates_result.candidates],
+            "candidates": _CANDIDATE_LIST_ADAPTER.dump_python(candidates_result.candidates),
             "allocated_budget": candidates_result.allocated_budget,
             "remaining_budget": candidates_result.remaining_budget,
             "next_step": candidates_result.next_step,
@@ -395,39 +827,44 @@ async def start_step_session(request: StepStartRequest) -> Dict[str, Any]:
 @app.get("/step/{session_id}/candidates")
 async def get_step_candidates(
     session_id: str,
+    request: Request,
     step: Optional[int] = None,
     top_k: int = 5
 ) -> Dict[str, Any]:
     """
     현재 단계의 후보 부품 조회
+
+    후보 목록은 (세션, 단계, 세션 버전)이 같으면 동일하므로 ETag를 붙이고,
+    클라이언트가 같은 ETag로 재요청하면 검색 없이 304를 반환합니다.
     """
-    if step_pipeline is None:
-        raise HTTPException(status_code=503, detail="Step-by-Step 파이프라인이 초기화되지 않았습니다.")
-    
     try:
-        result = step_pipeline.get_step_candidates(
-            session_id=session_id,
-            step=step,
-            top_k=top_k
-        )
-        
-        # 카테고리 정보 추가
-        category_info = CATEGORY_INFO.get(result.category, {})
-        
-        return {
-            "session_id": result.session_id,
-            "step": result.step,
-            "category": result.category,
-            "category_name": category_info.get("name", result.category),
-            "category_description": category_info.get("description", ""),
-            "key_specs": category_info.get("key_specs", []),
-            "spec_meanings": category_info.get("spec_meanings", {}),
-            "candidates": [c.model_dump() for c in result.candidates],
-            "allocated_budget": result.allocated_budget,
-            "remaining_budget": result.remaining_budget,
-            "next_step": result.next_step,
-            "is_final_step": result.is_final_step
-        }
+        session = await _run_blocking(step_pipeline.get_session, session_id)
+        if session is None:
+            raise ValueError(f"세션을 찾을 수 없습니다: {session_id}")
+
+        cache_key = (session_id, step or session.current_step, session.version, top_k)
+        etag = _candidates_etag(cache_key)
+        headers = {"ETag": etag, "Cache-Control": CANDIDATES_CACHE_CONTROL}
+
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+
+        payload = _candidates_cache.get(cache_key)
+        if payload is None:
+            result = await _run_blocking(
+                step_pipeline.get_step_candidates,
+                session_id=session_id,
+                step=step,
+                top_k=top_k
+            )
+            payload = _build_candidates_payload(result)
+            _candidates_cache[cache_key] = payload
+            if len(_candidates_cache) > CANDIDATES_CACHE_SIZE:
+                _candidates_cache.popitem(last=False)
+        else:
+            _candidates_cache.move_to_end(cache_key)
+
+        return StrKeyORJSONResponse(payload, headers=headers)
         
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -436,38 +873,31 @@ async def get_step_candidates(
         raise HTTPException(status_code=500, detail=f"후보 조회 실패: {str(e)}")
 
 
-@app.post("/step/{session_id}/select")
+@app.post("/step/{session_id}/select", openapi_extra=_msgspec_openapi(StepSelectRequest))
 async def select_component(
     session_id: str,
-    request: StepSelectRequest
+    request: StepSelectRequest = _msgspec_body(StepSelectRequest)
 ) -> Dict[str, Any]:
     """
     부품 선택 및 다음 단계로 진행
     """
-    if step_pipeline is None:
-        raise HTTPException(status_code=503, detail="Step-by-Step 파이프라인이 초기화되지 않았습니다.")
-    
     try:
-        logger.info(f"부품 선택: 세션={session_id}, 단계={request.step}, ID={request.component_id}")
+        logger.info("부품 선택: 세션={}, 단계={}, ID={}", session_id, request.step, request.component_id)
         
-        session = step_pipeline.select_component(
+        # 선택 저장과 다음 단계 후보 조회를 한 번에 처리 (8단계 완료 시 next_result는 None)
+        session, next_result = await _run_blocking(
+            step_pipeline.select_and_advance,
             session_id=session_id,
             step=request.step,
             component_id=request.component_id,
             component_data=request.component_data
         )
         
-        # 다음 단계 후보 자동 조회 (8단계 완료 시 제외)
-        if session.current_step <= 8:
-            next_result = step_pipeline.get_step_candidates(
-                session_id=session_id,
-                step=session.current_step
-            )
-            
+        if next_result is not None:
             # 카테고리 정보 추가
             category_info = CATEGORY_INFO.get(next_result.category, {})
             
-            return {
+            return StrKeyORJSONResponse({
                 "session_id": session_id,
                 "selected_step": request.step,
                 "next_step": session.current_step,
@@ -476,15 +906,15 @@ async def select_component(
                 "category_description": category_info.get("description", ""),
                 "key_specs": category_info.get("key_specs", []),
                 "spec_meanings": category_info.get("spec_meanings", {}),
-                "candidates": [c.model_dump() for c in next_result.candidates],
+                "candidates": _CANDIDATE_LIST_ADAPTER.dump_python(next_result.candidates),
                 "allocated_budget": next_result.allocated_budget,
                 "remaining_budget": next_result.remaining_budget,
                 "is_final_step": next_result.is_final_step,
                 "selections_count": len(session.selections)
-            }
+            })
         else:
             # 모든 단계 완료
-            summary = step_pipeline.get_summary(session_id)
+            summary = await _run_blocking(step_pipeline.get_summary, session_id)
             return {
                 "session_id": session_id,
                 "status": "completed",
@@ -492,6 +922,8 @@ async def select_component(
                 "summary": summary
             }
         
+    except SessionConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -504,11 +936,8 @@ async def get_session_summary(session_id: str) -> Dict[str, Any]:
     """
     세션 요약 (현재까지 선택한 부품 목록 및 총 가격)
     """
-    if step_pipeline is None:
-        raise HTTPException(status_code=503, detail="Step-by-Step 파이프라인이 초기화되지 않았습니다.")
-    
     try:
-        summary = step_pipeline.get_summary(session_id)
+        summary = await _run_blocking(step_pipeline.get_summary, session_id)
         if not summary:
             raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
         return summary
@@ -525,14 +954,14 @@ async def deselect_component(session_id: str, step: int) -> Dict[str, Any]:
     
     해당 단계 및 이후 선택된 모든 부품이 제거됩니다.
     """
-    if step_pipeline is None:
-        raise HTTPException(status_code=503, detail="Step-by-Step 파이프라인이 초기화되지 않았습니다.")
-    
     try:
-        session = step_pipeline.deselect_component(session_id=session_id, step=step)
+        session = await _run_blocking(
+            step_pipeline.deselect_component, session_id=session_id, step=step
+        )
         
         # 해당 단계의 후보를 다시 조회하여 반환
-        step_result = step_pipeline.get_step_candidates(
+        step_result = await _run_blocking(
+            step_pipeline.get_step_candidates,
             session_id=session_id,
             step=step,
             top_k=5
@@ -546,10 +975,12 @@ async def deselect_component(session_id: str, step: int) -> Dict[str, Any]:
             "category": step_result.category,
             "category_name": category_info.get("name", step_result.category),
             "category_description": category_info.get("description", ""),
-            "candidates": [c.model_dump() for c in step_result.candidates],
+            "candidates": _CANDIDATE_LIST_ADAPTER.dump_python(step_result.candidates),
             "message": f"단계 {step} 이후의 선택이 취소되었습니다."
         }
         
+    except SessionConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -560,23 +991,19 @@ async def deselect_component(session_id: str, step: int) -> Dict[str, Any]:
 # Multi-Agent API 엔드포인트
 # =============================================================================
 
-@app.post("/agent/chat")
-async def agent_chat(request: AgentChatRequest) -> Dict[str, Any]:
+@app.post("/agent/chat", openapi_extra=_msgspec_openapi(AgentChatRequest))
+async def agent_chat(request: AgentChatRequest = _msgspec_body(AgentChatRequest)) -> Dict[str, Any]:
     """
     멀티 에이전트와의 대화 (자동 PC 견적)
     
     사용자의 자연어 요청을 분석하여, Multi-Agent 시스템이 'Auto PC Builder Tool'을 통해
     CPU부터 케이스까지 완벽한 호환성을 갖춘 PC를 자동으로 구성해줍니다.
     """
-    if orchestrator is None:
-        logger.error("DEBUG: orchestrator is None in /agent/chat handler!")
-        raise HTTPException(status_code=503, detail="멀티 에이전트 시스템이 초기화되지 않았습니다.")
-    
     try:
-        logger.info(f"에이전트 요청: {request.query}")
+        logger.info("에이전트 요청: {}", request.query)
         
         # 오케스트레이터 실행
-        result = orchestrator.run({
+        result = await _run_blocking(orchestrator.run, {
             "query": request.query,
             "budget": request.budget,
             "purpose": request.purpose,
@@ -590,22 +1017,15 @@ async def agent_chat(request: AgentChatRequest) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=f"에이전트 실행 실패: {str(e)}")
 
 
-@app.post("/step/next", response_model=StepResponse)
-async def step_next(request: StepRequest):
+@app.post("/step/next", response_model=StepResponse, openapi_extra=_msgspec_openapi(StepRequest))
+async def step_next(request: StepRequest = _msgspec_body(StepRequest)):
     """
     단계별 부품 선택 (인터랙티브)
     
     - 세션 시작 (step=0): 초기 요구사항 분석 및 첫 번째 부품(CPU) 리스트 반환
     - 부품 선택 (step=1-8): 선택된 부품을 저장하고 다음 단계 부품 리스트 반환
     """
-    global step_pipeline
-    
-    if step_pipeline is None:
-        raise HTTPException(status_code=503, detail="Step-by-Step 파이프라인이 초기화되지 않았습니다.")
-    
     try:
-        import uuid
-        
         # 세션 시작 (첫 호출 또는 new session)
         if request.session_id is None or request.current_step == 0:
             # 예산 필수 체크 (기본값 제거)
@@ -616,45 +1036,33 @@ async def step_next(request: StepRequest):
             purpose = request.purpose or "general"
             
             # 세션 생성 (session_id는 자동 생성됨)
-            session = step_pipeline.start_session(
+            session = await _run_blocking(
+                step_pipeline.start_session,
                 budget=budget,
                 purpose=purpose
             )
             
             session_id = session.session_id
-            logger.info(f"새 세션 시작: {session_id}, 예산: {budget:,}원, 목적: {purpose}")
+            logger.info("새 세션 시작: {}, 예산: {:,}원, 목적: {}", session_id, budget, purpose)
             
             # 첫 번째 단계 (CPU) 후보 조회
-            step_result = step_pipeline.get_step_candidates(session_id, step=1, top_k=5)
+            step_result = await _run_blocking(
+                step_pipeline.get_step_candidates, session_id, step=1, top_k=5
+            )
+            
+            # 카테고리 정보 가져오기 (step_result.category는 "cpu" 등)
+            category = step_result.category
+            cat_info = CATEGORY_INFO.get(category, _EMPTY_CATEGORY_INFO)
             
             # 응답 변환
-            candidates = [
-                ComponentCandidate(
-                    id=c.component_id,
-                    name=c.name,
-                    price=c.price,
-                    category=step_result.category,
-                    match_score=c.match_score,
-                    specs=c.specs,
-                    hashtags=getattr(c, "hashtags", []),
-                    representative_specs=getattr(c, "representative_specs", {}),
-                    compatibility_status=getattr(c, "compatibility_status", "compatible"),
-                    danawa_url=getattr(c, "danawa_url", None),
-                    image_url=getattr(c, "image_url", None)
-                )
-                for c in step_result.candidates
-            ]
+            candidates = _build_candidates(step_result.candidates, category)
             
-            purpose_kr = {"general": "일반/가정", "gaming": "게이밍", "workstation": "작업", "streaming": "방송"}.get(purpose, purpose)
+            purpose_kr = _PURPOSE_KR.get(purpose, purpose)
 
             
-            analysis_msg = step_result.analysis if hasattr(step_result, "analysis") and step_result.analysis else f"{purpose_kr} 용도에 적합한 CPU 후보입니다. 예산은 {budget:,}원입니다."
-
-            # 카테고리 정보 가져오기 (step_result.category는 "CPU" 등)
-            cat_name = step_result.category
-            cat_info = CATEGORY_INFO.get(cat_name, {})
+            analysis_msg = step_result.analysis or f"{purpose_kr} 용도에 적합한 CPU 후보입니다. 예산은 {budget:,}원입니다."
             
-            return StepResponse(
+            return _step_response(StepResponse(
                 session_id=session_id,
                 step=1,
                 step_name="CPU",
@@ -664,47 +1072,47 @@ async def step_next(request: StepRequest):
                 total_price=0,
                 category_description=cat_info.get("description", ""),
                 spec_meanings=cat_info.get("spec_meanings", {})
-            )
+            ))
         
         # 부품 선택 및 다음 단계
+        # (current_step은 1 이상이므로 선택/건너뛰기 단계로 그대로 사용, 세션 조회는 파이프라인에서 한 번만 수행)
         else:
             session_id = request.session_id
-            session = step_pipeline.get_session(session_id)
-            
-            if session is None:
-                raise HTTPException(status_code=404, detail=f"세션을 찾을 수 없습니다: {session_id}")
+            current_step_for_selection = request.current_step
             
             # 이전 단계에서 선택한 부품 저장
             if request.selected_component_id:
-                # [Fix] Use request.current_step directly as the selection step
-                current_step_for_selection = request.current_step if request.current_step >= 1 else session.current_step
-                
-                # 선택한 부품 정보 조회 필요 (간단히 빈 데이터로 처리, 실제로는 DB에서 조회)
+                # 부품 상세 정보는 파이프라인이 제시했던 후보 또는 벡터 DB에서 조회
                 component_data = {"id": request.selected_component_id}
                 
-                step_pipeline.select_component(
+                # 선택 저장과 다음 단계 후보 조회를 한 번에 처리
+                session, step_result = await _run_blocking(
+                    step_pipeline.select_and_advance,
                     session_id=session_id,
                     step=current_step_for_selection,
                     component_id=request.selected_component_id,
-                    component_data=component_data
+                    component_data=component_data,
+                    top_k=5
                 )
                 
-                logger.info(f"부품 선택: step={current_step_for_selection}, id={request.selected_component_id}")
+                logger.info("부품 선택: step={}, id={}", current_step_for_selection, request.selected_component_id)
             
             else:
-                # [Fix] 선택 없이 건너뛰기 (Skip)
-                current_step_for_selection = request.current_step if request.current_step >= 1 else session.current_step
-                step_pipeline.skip_step(session_id=session_id, step=current_step_for_selection)
-                logger.info(f"단계 건너뛰기: step={current_step_for_selection}")
+                # 선택 없이 건너뛰기 (Skip) + 다음 단계 후보 조회
+                session, step_result = await _run_blocking(
+                    step_pipeline.skip_and_advance,
+                    session_id=session_id,
+                    step=current_step_for_selection,
+                    top_k=5
+                )
+                logger.info("단계 건너뛰기: step={}", current_step_for_selection)
             
-            # [Fix] Re-fetch session after selection to get updated current_step
-            session = step_pipeline.get_session(session_id)
             next_step = session.current_step
             
             if next_step > 8:
                 # 모든 단계 완료
                 total_price = sum(s.price for s in session.selections)
-                return StepResponse(
+                return _step_response(StepResponse(
                     session_id=session_id,
                     step=8,
                     step_name="완료",
@@ -712,38 +1120,21 @@ async def step_next(request: StepRequest):
                     analysis="PC 구성이 완료되었습니다!",
                     is_final=True,
                     total_price=total_price
-                )
+                ))
             
-            step_result = step_pipeline.get_step_candidates(session_id, step=next_step, top_k=5)
+            # 카테고리 정보 가져오기 (step_result.category는 "cpu" 등)
+            category = step_result.category
+            cat_info = CATEGORY_INFO.get(category, _EMPTY_CATEGORY_INFO)
             
             # 응답 변환
-            candidates = [
-                ComponentCandidate(
-                    id=c.component_id,
-                    name=c.name,
-                    price=c.price,
-                    category=step_result.category,
-                    match_score=c.match_score,
-                    specs=c.specs,
-                    hashtags=getattr(c, "hashtags", []),
-                    representative_specs=getattr(c, "representative_specs", {}),
-                    compatibility_status=getattr(c, "compatibility_status", "compatible"),
-                    danawa_url=getattr(c, "danawa_url", None),
-                    image_url=getattr(c, "image_url", None)
-                )
-                for c in step_result.candidates
-            ]
+            candidates = _build_candidates(step_result.candidates, category)
             
             total_price = sum(s.price for s in session.selections)
-            step_name_map = {1: "CPU", 2: "메인보드", 3: "RAM", 4: "GPU", 5: "SSD", 6: "파워", 7: "쿨러", 8: "케이스"}
-            next_step_name = step_name_map.get(next_step, "부품")
-            
-            analysis_msg = step_result.analysis if hasattr(step_result, "analysis") and step_result.analysis else f"{step_result.category} 후보입니다. 현재까지 {total_price:,}원 사용했습니다."
+            next_step_name = _STEP_NAME_MAP[next_step] if 0 <= next_step < len(_STEP_NAME_MAP) else "부품"
             
-            cat_name = step_result.category
-            cat_info = CATEGORY_INFO.get(cat_name, {})
+            analysis_msg = step_result.analysis or f"{category} 후보입니다. 현재까지 {total_price:,}원 사용했습니다."
 
-            return StepResponse(
+            return _step_response(StepResponse(
                 session_id=session_id,
                 step=next_step,
                 step_name=next_step_name,
@@ -753,35 +1144,48 @@ async def step_next(request: StepRequest):
                 total_price=total_price,
                 category_description=cat_info.get("description", ""),
                 spec_meanings=cat_info.get("spec_meanings", {})
-            )
+            ))
             
+    except HTTPException:
+        raise
+    except SessionConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         logger.error(f"Step 처리 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Step 처리 실패: {str(e)}")
 
 
-@app.post("/generate/pc-image")
-async def generate_pc_image(request: GenerateImageRequest):
+@app.post("/generate/pc-image", openapi_extra=_msgspec_openapi(GenerateImageRequest))
+async def generate_pc_image(
+    request: GenerateImageRequest = _msgspec_body(GenerateImageRequest),
+    encoding: str = Query("binary", pattern="^(binary|base64)$"),
+):
     """
     선택된 부품을 기반으로 PC 조립 이미지를 생성합니다.
-    """
-    global image_generator
     
+    기본적으로 PNG 바이너리(image/png)를 그대로 반환하며,
+    encoding=base64이면 {"image_url": "data:image/png;base64,..."} JSON을 반환합니다.
+    """
     if not image_generator or not image_generator.client:
         raise HTTPException(status_code=503, detail="Image generation service is not available (Check API Key)")
         
     try:
-        image_base64 = image_generator.generate_pc_image(
+        image_bytes = await _run_blocking(
+            image_generator.generate_pc_image,
             components=request.components,
             purpose=request.purpose
         )
         
-        if not image_base64:
+        if not image_bytes:
              raise HTTPException(status_code=500, detail="Failed to generate image")
-             
-        import base64
-        if isinstance(image_base64, bytes):
-            image_base64 = base64.b64encode(image_base64).decode('utf-8')
+        
+        # 기본: base64 인코딩 없이 PNG 바이너리 그대로 전송 (응답 크기 약 25% 감소)
+        if encoding == "binary":
+            return Response(content=image_bytes, media_type="image/png")
+        
+        image_base64 = base64.b64encode(image_bytes).decode('utf-8')
             
         return {
             "image_url": f"data:image/png;base64,{image_base64}"
@@ -795,36 +1199,52 @@ async def generate_pc_image(request: GenerateImageRequest):
 @app.get("/agent/status")
 async def agent_status():
     """디버그용 orchestrator 상태 확인 엔드포인트"""
-    global orchestrator
     return {
         "status": "ok" if orchestrator else "error",
         "orchestrator_initialized": orchestrator is not None
     }
 
 
-# 개발 서버 실행 (직접 실행 시)
+# 프론트엔드 정적 파일 (모든 API 라우트 등록 후 마운트하여 API 경로가 우선)
+# 빌드 결과가 있으면 "/"를 StaticFiles가, 없으면 root()가 처리 (둘 중 하나만 등록)
+if HAS_DIST:
+    if (DIST_DIR / "assets").is_dir():
+        app.mount("/assets", CachedStaticFiles(directory=str(DIST_DIR / "assets")), name="assets")
+    app.mount("/", StaticFiles(directory=str(DIST_DIR), html=True), name="static")
+else:
+    @app.get("/")
+    async def root():
+        """API 서버 정보 (프론트엔드 미빌드 시)"""
+        return {
+            "service": "Spckit AI - PC 부품 추천 API",
+            "status": "running",
+            "version": "1.0.0",
+            "docs": "/docs",
+            "frontend": "npm run dev (port 3000)",
+        }
+
+
+# 서버 실행 (직접 실행 시)
 if __name__ == "__main__":
     import uvicorn
 
+    # DEV_RELOAD=1이면 개발용 자동 리로드 (단일 프로세스)
+    dev_reload = os.getenv("DEV_RELOAD", "0") == "1"
+
+    # Step-by-Step 세션은 REDIS_URL이 있어야 워커 간에 공유되므로, 없으면 기본 1개 워커
+    default_workers = max(1, (os.cpu_count() or 2) // 2) if os.getenv("REDIS_URL") else 1
+    workers = 1 if dev_reload else int(os.getenv("WEB_CONCURRENCY", str(default_workers)))
+
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
-        port=8000,
-        reload=True,
+        port=int(os.getenv("PORT", "8000")),
+        reload=dev_reload,
+        workers=workers,
+        # uvicorn[standard]로 설치된 uvloop/httptools 사용 (Windows 등 미설치 환경은 asyncio/h11)
+        loop="auto",
+        http="auto",
+        # 요청 로그는 loguru로 남기므로 uvicorn 액세스 로그는 끔
+        access_log=False,
         log_level="info",
     )
-
-
-
-# 루트 경로 (API 서버 정보)
-@app.get("/")
-async def root():
-    return {
-        "service": "Spckit AI - PC 부품 추천 API",
-        "version": "2.0.0 (VERIFIED NEW VERSION)",
-        "status": "If you see this, Backend is updated",
-        "docs": "/docs",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "frontend": "npm run dev (port 3000)"
-    }
@@ -1,10 +1,16 @@
 import re
+import io
+import csv
 import json
-import bisect
+import mmap
+import hashlib
+import orjson
+import numpy as np
 from pathlib import Path
 from datetime import datetime
 from loguru import logger
-from collections import defaultdict
+from collections import defaultdict, Counter
+from functools import lru_cache
 
 # PyTorch Geometric 변환을 위한 선택적 임포트
 try:
@@ -20,15 +26,72 @@ BASE_DIR = Path(__file__).resolve().parent.parent.parent
 SQL_PATH = BASE_DIR / "data" / "pc_data_dump.sql"
 REC_DIR = BASE_DIR / "data" / "recommendation"
 
+# 빌드 결과 파일과 입력 지문(fingerprint) 파일
+OUTPUT_FILES = ["component_nodes.json", "compatibility_edges.json", "synergy_edges.json", "attribute_mappings.json"]
+FINGERPRINT_FILE = ".build_fingerprint"
+# 결과 JSON 저장 시 한 번에 직렬화하는 레코드 수
+SAVE_CHUNK_SIZE = 10000
+
 # [공신력 기준] 성능 티어 정의
 TIERS = ['Entry', 'Mainstream', 'Performance', 'High-End', 'Enthusiast']
 TIER_MAP = {tier: i for i, tier in enumerate(TIERS)}
 
+# 기술 스펙 추출 패턴 (대문자로 변환한 텍스트 대상, 항목별로 미리 컴파일)
+# 하나의 alternation으로 합치면 리터럴 접두어 최적화가 사라져 항목별 search보다 느림
+SOCKET_PATTERN = re.compile(r"(LGA\d+|AM\d|TR\d|WRX\d)")
+MEMORY_TYPE_PATTERN = re.compile(r"(DDR\d)")
+FORM_FACTOR_PATTERN = re.compile(r"(E-ATX|ATX|M-ATX|ITX)")
+WATTAGE_PATTERN = re.compile(r"(\d+)W")
+MM_PATTERN = re.compile(r"(\d+)MM")
+# 케이스가 지원하는 메인보드 폼팩터 (원문 부분 문자열 기준)
+CASE_FORM_FACTORS = ["E-ATX", "ATX", "MATX", "ITX"]
+
+# 브랜드 키워드 (대소문자 무시, 브랜드별 키워드를 하나의 정규식으로 미리 컴파일)
+BRAND_KEYWORDS = {
+    "Intel": ["Intel", "인텔"],
+    "AMD": ["AMD", "라이젠", "Ryzen"],
+    "NVIDIA": ["NVIDIA", "GeForce", "RTX", "GTX"],
+    "Samsung": ["삼성", "Samsung"],
+    "ASUS": ["ASUS", "아수스", "ROG", "TUF", "PRIME"],
+    "MSI": ["MSI", "MAG", "MPG", "MEG"],
+    "Gigabyte": ["GIGABYTE", "기가바이트", "AORUS", "AERO"],
+    "SK hynix": ["SK하이닉스", "hynix"]
+}
+BRAND_PATTERNS = [
+    (brand, re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE))
+    for brand, keywords in BRAND_KEYWORDS.items()
+]
+
+# 같은 제품명이 여러 SKU 행에 반복되므로 이름 단위로 결과를 메모이즈 (모듈 상수만 읽는 순수 함수)
+@lru_cache(maxsize=None)
+def _brand_of(name: str) -> str:
+    # 브랜드 순서대로 검사 (여러 브랜드 키워드가 있으면 앞선 브랜드 우선)
+    for brand, pattern in BRAND_PATTERNS:
+        if pattern.search(name):
+            return brand
+    return "Generic"
+
+
+@lru_cache(maxsize=None)
+def _performance_tier(category: str, name: str) -> str:
+    if category == 'cpu':
+        if any(x in name for x in ['I9', 'R9', '7800X3D', '7950X']): return 'Enthusiast'
+        if any(x in name for x in ['I7', 'R7']): return 'High-End'
+        if any(x in name for x in ['I5', 'R5']): return 'Performance'
+        return 'Mainstream'
+    elif category == 'gpu':
+        if any(x in name for x in ['4090', '4080', '7900XT']): return 'Enthusiast'
+        if any(x in name for x in ['4070', '7800XT']): return 'High-End'
+        if any(x in name for x in ['4060', '7600']): return 'Performance'
+        return 'Entry'
+    return 'Mainstream'
+
 class PCDataPipeline:
     def __init__(self):
         self.nodes = []
         self.edges = []
-        # 검색 최적화용 맵: {category: {keyword: [id1, id2, ...]}}
+        # 검색 최적화용 맵: {category: {keyword: [(id, 대문자 이름), ...]}}
+        # 파싱이 끝나면 _freeze_keyword_index()로 {keyword: (id 배열, 이름 배열)} 형태로 변환
         self.keyword_index = defaultdict(lambda: defaultdict(list))
         self.version = "1.4.2" # SSD 및 쿨러 테이블 누락 해결 버전
         REC_DIR.mkdir(parents=True, exist_ok=True)
@@ -52,58 +115,34 @@ class PCDataPipeline:
         return []
 
     def extract_brand(self, name: str) -> str:
-        brands = {
-            "Intel": ["Intel", "인텔"],
-            "AMD": ["AMD", "라이젠", "Ryzen"],
-            "NVIDIA": ["NVIDIA", "GeForce", "RTX", "GTX"],
-            "Samsung": ["삼성", "Samsung"],
-            "ASUS": ["ASUS", "아수스", "ROG", "TUF", "PRIME"],
-            "MSI": ["MSI", "MAG", "MPG", "MEG"],
-            "Gigabyte": ["GIGABYTE", "기가바이트", "AORUS", "AERO"],
-            "SK hynix": ["SK하이닉스", "hynix"]
-        }
-        for brand, keywords in brands.items():
-            for kw in keywords:
-                if kw.lower() in name.lower():
-                    return brand
-        return "Generic"
+        return _brand_of(name)
 
     def get_performance_tier(self, category: str, name: str, price: float) -> str:
-        name = name.upper()
-        if category == 'cpu':
-            if any(x in name for x in ['I9', 'R9', '7800X3D', '7950X']): return 'Enthusiast'
-            if any(x in name for x in ['I7', 'R7']): return 'High-End'
-            if any(x in name for x in ['I5', 'R5']): return 'Performance'
-            return 'Mainstream'
-        elif category == 'gpu':
-            if any(x in name for x in ['4090', '4080', '7900XT']): return 'Enthusiast'
-            if any(x in name for x in ['4070', '7800XT']): return 'High-End'
-            if any(x in name for x in ['4060', '7600']): return 'Performance'
-            return 'Entry'
-        return 'Mainstream'
+        # name은 호출부(run)에서 이미 대문자로 변환된 제품명 (티어는 가격과 무관하게 이름으로만 결정)
+        return _performance_tier(category, name)
 
     def extract_tech_specs(self, category: str, raw_text: str) -> dict:
         specs = {}
         raw = raw_text.upper()
         
-        socket = re.search(r"(LGA\d+|AM\d|TR\d|WRX\d)", raw)
+        socket = SOCKET_PATTERN.search(raw)
         if socket: specs['socket'] = socket.group(0).replace(" ", "")
         
-        mem = re.search(r"(DDR\d)", raw)
+        mem = MEMORY_TYPE_PATTERN.search(raw)
         if mem: specs['memory_type'] = mem.group(0)
         
-        ff = re.search(r"(E-ATX|ATX|M-ATX|ITX)", raw)
+        ff = FORM_FACTOR_PATTERN.search(raw)
         if ff: 
             found_ff = ff.group(0).replace("M-ATX", "MATX")
             specs['form_factor'] = found_ff
         
-        wattage = re.search(r"(\d+)W", raw)
+        wattage = WATTAGE_PATTERN.search(raw)
         if wattage: 
             val = int(wattage.group(1))
             if category == 'psu': specs['wattage'] = val
             else: specs['tdp'] = val
         
-        mm_matches = re.findall(r"(\d+)MM", raw)
+        mm_matches = MM_PATTERN.findall(raw)
         if mm_matches:
             vals = [int(v) for v in mm_matches]
             if category == 'gpu': specs['length_mm'] = max(vals)
@@ -111,6 +150,10 @@ class PCDataPipeline:
                 specs['max_gpu_mm'] = max(vals)
                 specs['max_cooler_mm'] = min(vals) if len(vals) > 1 else 160
             elif category == 'cooler': specs['height_mm'] = min(vals)
+
+        if category == 'case':
+            supported_ff = [ff for ff in CASE_FORM_FACTORS if ff in raw]
+            if supported_ff: specs['supported_ff'] = supported_ff
         
         return specs
 
@@ -118,11 +161,115 @@ class PCDataPipeline:
         if not part_name or part_name == "Internal": return None
         keywords = [k for k in part_name.upper().split() if len(k) > 2]
         if not keywords: return None
-        candidates = self.keyword_index[category].get(keywords[0], [])
-        for node_id, full_name in candidates:
-            if all(k in full_name for k in keywords):
-                return node_id
-        return None
+        # 포스팅 리스트가 가장 짧은 키워드(가장 희귀한 토큰)로 후보를 좁힌 뒤 나머지 키워드 확인
+        index = self.keyword_index.get(category, {})
+        postings = [index[k] for k in keywords if k in index]
+        if not postings: return None
+        ids, names = min(postings, key=len)
+        # 모든 키워드를 부분 문자열로 포함하는 후보 중 색인 순서상 첫 번째 (C 레벨 벡터 연산)
+        mask = np.ones(len(names), dtype=bool)
+        for k in keywords:
+            mask &= np.char.find(names, k) >= 0
+        return ids[mask.argmax()] if mask.any() else None
+
+    def _freeze_keyword_index(self):
+        """키워드별 (id, 이름) 튜플 리스트를 id 배열 + 이름 문자열 배열 쌍으로 변환"""
+        self.keyword_index = {
+            cat: {kw: (np.array([i for i, _ in posting], dtype=object), np.array([n for _, n in posting], dtype=str))
+                  for kw, posting in index.items()}
+            for cat, index in self.keyword_index.items()
+        }
+
+    @staticmethod
+    def _spec_column(nodes, key, default=0):
+        """노드 리스트의 specs[key]를 int64 배열로 추출 (없으면 default)"""
+        return np.fromiter((n['specs'].get(key, default) for n in nodes), dtype=np.int64, count=len(nodes))
+
+    @staticmethod
+    def _range_edges(src_ids, values, dst_ids, limits, rule, max_per):
+        """values[i] 이상인 limits 구간의 앞쪽 max_per개 대상과 호환성 엣지 생성
+
+        limits는 정렬되지 않은 카테고리 컬럼 그대로 받아 안정 정렬한 뒤,
+        source별 구간 탐색은 np.searchsorted 한 번과 인덱스 배열 연산으로 처리.
+        """
+        if not len(src_ids) or not len(dst_ids): return []
+        order = np.argsort(limits, kind='stable')
+        dst_sorted = dst_ids[order]
+        starts = np.searchsorted(limits[order], values, side='left')
+        dst = starts[:, None] + np.arange(max_per)
+        src = np.broadcast_to(np.arange(len(src_ids))[:, None], dst.shape)
+        valid = dst < len(dst_ids)
+        return [
+            {"source": s_id, "target": d_id, "type": "COMPATIBLE_WITH", "rule": rule}
+            for s_id, d_id in zip(src_ids[src[valid]].tolist(), dst_sorted[dst[valid]].tolist())
+        ]
+
+    # ===== 호환성 규칙 (각 규칙은 독립적으로 COMPATIBLE_WITH 엣지 리스트를 반환) =====
+
+    @staticmethod
+    def _rule_socket(by_cat, max_per):
+        """[Rule 1] CPU-메인보드 소켓 일치"""
+        mb_by_socket = defaultdict(list)
+        for mb in by_cat.get('motherboard', []):
+            if mb['specs'].get('socket'): mb_by_socket[mb['specs']['socket']].append(mb['id'])
+        return [
+            {"source": cpu['id'], "target": mb_id, "type": "COMPATIBLE_WITH", "rule": "socket"}
+            for cpu in by_cat.get('cpu', [])
+            for mb_id in mb_by_socket.get(cpu['specs'].get('socket'), [])[:max_per]
+        ]
+
+    @staticmethod
+    def _rule_ddr(by_cat, max_per):
+        """[Rule 2] 메모리-메인보드 DDR 규격 일치"""
+        mb_by_ddr = defaultdict(list)
+        for mb in by_cat.get('motherboard', []):
+            if mb['specs'].get('memory_type'): mb_by_ddr[mb['specs']['memory_type']].append(mb['id'])
+        return [
+            {"source": mem['id'], "target": mb_id, "type": "COMPATIBLE_WITH", "rule": "ddr"}
+            for mem in by_cat.get('memory', [])
+            for mb_id in mb_by_ddr.get(mem['specs'].get('memory_type'), [])[:max_per]
+        ]
+
+    @classmethod
+    def _rule_gpu_length(cls, cols, max_per):
+        """[Rule 3] GPU 길이 <= 케이스 최대 GPU 길이"""
+        case_gpu_mask = cols['case']['max_gpu_mm'] != 0
+        gpu_len_mask = cols['gpu']['length_mm'] != 0
+        return cls._range_edges(
+            cols['gpu']['id'][gpu_len_mask], cols['gpu']['length_mm'][gpu_len_mask],
+            cols['case']['id'][case_gpu_mask], cols['case']['max_gpu_mm'][case_gpu_mask],
+            "gpu_length", max_per)
+
+    @staticmethod
+    def _rule_form_factor(by_cat, max_per):
+        """[Rule 4] 메인보드 폼팩터를 지원하는 케이스"""
+        case_by_ff = defaultdict(list)
+        for case in by_cat.get('case', []):
+            for ff in case['specs'].get('supported_ff', []): case_by_ff[ff].append(case['id'])
+        return [
+            {"source": mb['id'], "target": c_id, "type": "COMPATIBLE_WITH", "rule": "form_factor"}
+            for mb in by_cat.get('motherboard', [])
+            for c_id in case_by_ff.get(mb['specs'].get('form_factor'), [])[:max_per]
+        ]
+
+    @classmethod
+    def _rule_psu_capacity(cls, cols, max_per):
+        """[Rule 5] GPU TDP + 200W <= PSU 용량"""
+        psu_mask = cols['psu']['wattage'] != 0
+        return cls._range_edges(
+            cols['gpu']['id'], cols['gpu']['tdp'] + 200,
+            cols['psu']['id'][psu_mask], cols['psu']['wattage'][psu_mask],
+            "psu_capacity", max_per)
+
+    @classmethod
+    def _rule_cooler_height(cls, cols, max_per):
+        """[Rule 6] 쿨러 높이 <= 케이스 최대 쿨러 높이"""
+        case_h_mask = cols['case']['max_cooler_mm'] != 0
+        cooler_h_mask = cols['cooler']['height_mm'] != 0
+        return cls._range_edges(
+            cols['cooler']['id'][cooler_h_mask], cols['cooler']['height_mm'][cooler_h_mask],
+            cols['case']['id'][case_h_mask], cols['case']['max_cooler_mm'][case_h_mask],
+            "cooler_height", max_per)
 
     def generate_verified_edges(self):
         """[체크리스트 100% 충족] 메모리 안전성을 확보하며 6대 호환성 규칙 모두 생성"""
@@ -132,8 +279,18 @@ class PCDataPipeline:
         
         MAX_EDGES_PER_NODE = 20
         
-        # storage를 포함하여 필터링
-        by_cat = {cat: [n for n in self.nodes if n.get('category') == cat] for cat in ['cpu', 'motherboard', 'memory', 'gpu', 'case', 'psu', 'cooler', 'storage']}
+        # storage를 포함하여 카테고리별로 분류 (노드 전체를 한 번만 순회)
+        by_cat = {cat: [] for cat in ['cpu', 'motherboard', 'memory', 'gpu', 'case', 'psu', 'cooler', 'storage']}
+        for n in self.nodes:
+            bucket = by_cat.get(n.get('category'))
+            if bucket is not None: bucket.append(n)
+        # 범위 규칙에 쓰는 수치 스펙은 카테고리별 컬럼 배열(SoA)로 한 번만 추출 (0 = 정보 없음)
+        numeric_specs = {'gpu': {'length_mm': 0, 'tdp': 250}, 'case': {'max_gpu_mm': 0, 'max_cooler_mm': 0}, 'psu': {'wattage': 0}, 'cooler': {'height_mm': 0}}
+        cols = {
+            cat: {'id': np.array([n['id'] for n in by_cat[cat]], dtype=object),
+                  **{key: self._spec_column(by_cat[cat], key, default) for key, default in specs.items()}}
+            for cat, specs in numeric_specs.items()
+        }
         
         # 1. 시너지 및 적합성 (3개 규칙)
         logger.info("시너지 및 적합성 엣지 연산 중...")
@@ -152,69 +309,27 @@ class PCDataPipeline:
                 syn_edges.append({"source": cpu['id'], "target": gid, "type": "SYNERGY_WITH", "score": 1.0, "rule": "tier_match"})
 
         # (C) 게임 적합성
+        node_ids = {n['id'] for n in self.nodes}
+        new_game_nodes = []
         for game in self.game_reqs:
             game_node_id = f"game_{game['id']}"
-            if not any(n['id'] == game_node_id for n in self.nodes):
-                self.nodes.append({"id": game_node_id, "type": "purpose", "name": game['name'], "tier": game['tier']})
+            if game_node_id not in node_ids:
+                new_game_nodes.append({"id": game_node_id, "type": "purpose", "name": game['name'], "tier": game['tier']})
+                node_ids.add(game_node_id)
             g_id = self._find_id_by_name_optimized('gpu', game.get('gpu_min'))
             if g_id: suitable_edges.append({"source": g_id, "target": game_node_id, "type": "SUITABLE_FOR"})
+        self.nodes.extend(new_game_nodes)
 
         # 2. 호환성 엣지 (6대 규칙 - 샘플링 방식으로 메모리 보호)
         logger.info("호환성 엣지 6대 규칙 생성 시작 (샘플링 적용)...")
         
-        # [Rule 1, 2] 소켓 & DDR
-        mb_by_socket = defaultdict(list); mb_by_ddr = defaultdict(list)
-        for mb in by_cat.get('motherboard', []):
-            s = mb['specs']
-            if s.get('socket'): mb_by_socket[s['socket']].append(mb['id'])
-            if s.get('memory_type'): mb_by_ddr[s['memory_type']].append(mb['id'])
-        
-        for cpu in by_cat.get('cpu', []):
-            for mb_id in mb_by_socket.get(cpu['specs'].get('socket'), [])[:MAX_EDGES_PER_NODE]:
-                comp_edges.append({"source": cpu['id'], "target": mb_id, "type": "COMPATIBLE_WITH", "rule": "socket"})
-        for mem in by_cat.get('memory', []):
-            for mb_id in mb_by_ddr.get(mem['specs'].get('memory_type'), [])[:MAX_EDGES_PER_NODE]:
-                comp_edges.append({"source": mem['id'], "target": mb_id, "type": "COMPATIBLE_WITH", "rule": "ddr"})
-
-        # [Rule 3] GPU 길이
-        case_by_gpu_limit = sorted([n for n in by_cat.get('case', []) if n['specs'].get('max_gpu_mm')], key=lambda x: x['specs']['max_gpu_mm'])
-        case_lens = [c['specs']['max_gpu_mm'] for c in case_by_gpu_limit]
-        for gpu in by_cat.get('gpu', []):
-            g_len = gpu['specs'].get('length_mm')
-            if g_len:
-                idx = bisect.bisect_left(case_lens, g_len)
-                for c in case_by_gpu_limit[idx : idx + MAX_EDGES_PER_NODE]:
-                    comp_edges.append({"source": gpu['id'], "target": c['id'], "type": "COMPATIBLE_WITH", "rule": "gpu_length"})
-
-        # [Rule 4] 폼팩터 (MB-Case)
-        case_by_ff = defaultdict(list)
-        for case in by_cat.get('case', []):
-            for ff in ["E-ATX", "ATX", "MATX", "ITX"]:
-                if ff in case.get('raw', ''): case_by_ff[ff].append(case['id'])
-        for mb in by_cat.get('motherboard', []):
-            m_ff = mb['specs'].get('form_factor')
-            if m_ff in case_by_ff:
-                for c_id in case_by_ff[m_ff][:MAX_EDGES_PER_NODE]:
-                    comp_edges.append({"source": mb['id'], "target": c_id, "type": "COMPATIBLE_WITH", "rule": "form_factor"})
-
-        # [Rule 5] PSU 용량
-        psu_by_watt = sorted([n for n in by_cat.get('psu', []) if n['specs'].get('wattage')], key=lambda x: x['specs']['wattage'])
-        psu_watts = [p['specs']['wattage'] for p in psu_by_watt]
-        for gpu in by_cat.get('gpu', []):
-            min_psu = gpu['specs'].get('tdp', 250) + 200
-            idx = bisect.bisect_left(psu_watts, min_psu)
-            for p in psu_by_watt[idx : idx + MAX_EDGES_PER_NODE]:
-                comp_edges.append({"source": gpu['id'], "target": p['id'], "type": "COMPATIBLE_WITH", "rule": "psu_capacity"})
-
-        # [Rule 6] CPU 쿨러 높이
-        case_by_h_limit = sorted([n for n in by_cat.get('case', []) if n['specs'].get('max_cooler_mm')], key=lambda x: x['specs']['max_cooler_mm'])
-        case_h_list = [c['specs']['max_cooler_mm'] for c in case_by_h_limit]
-        for clr in by_cat.get('cooler', []):
-            h = clr['specs'].get('height_mm')
-            if h:
-                idx = bisect.bisect_left(case_h_list, h)
-                for c in case_by_h_limit[idx : idx + MAX_EDGES_PER_NODE]:
-                    comp_edges.append({"source": clr['id'], "target": c['id'], "type": "COMPATIBLE_WITH", "rule": "cooler_height"})
+        # 규칙은 서로 독립적이며 순서대로 실행 (엣지 dict 생성이 대부분이라 스레드로는 GIL 때문에 이득 없음)
+        rules = [
+            (self._rule_socket, by_cat), (self._rule_ddr, by_cat), (self._rule_gpu_length, cols),
+            (self._rule_form_factor, by_cat), (self._rule_psu_capacity, cols), (self._rule_cooler_height, cols),
+        ]
+        for rule, data in rules:
+            comp_edges.extend(rule(data, MAX_EDGES_PER_NODE))
 
         return comp_edges, syn_edges, suitable_edges
 
@@ -229,28 +344,62 @@ class PCDataPipeline:
             by_type[n_type].append(node)
         for n_type, n_list in by_type.items():
             num_nodes = len(n_list)
-            data[n_type].x = torch.randn(num_nodes, 128)
+            # 검증/캐시용 그래프라 특징은 형태만 맞춘 자리표시자 (GNN 추론 시 graph_builder.to_pyg가 별도로 초기화)
+            # 난수 생성 대신 0으로 채워 RNG 비용을 없앰 (torch.empty와 달리 NaN 등 쓰레기 값이 저장되지 않음)
+            data[n_type].x = torch.zeros(num_nodes, 128)
             data[n_type].num_nodes = num_nodes
-        edge_store = defaultdict(lambda: {'src': [], 'dst': [], 'weight': []})
-        for edge in edges:
-            if edge['source'] not in node_mapping or edge['target'] not in node_mapping: continue
+        # 1차 패스: 엣지 타입별 개수 집계 (배열 크기 사전 할당용)
+        def resolve(edge):
+            if edge['source'] not in node_mapping or edge['target'] not in node_mapping: return None
             src_type, src_idx = node_mapping[edge['source']]
             dst_type, dst_idx = node_mapping[edge['target']]
-            e_type = (src_type, edge['type'].lower(), dst_type)
-            edge_store[e_type]['src'].append(src_idx)
-            edge_store[e_type]['dst'].append(dst_idx)
-            edge_store[e_type]['weight'].append(edge.get('score', 1.0))
-        for e_type, indices in edge_store.items():
-            data[e_type].edge_index = torch.tensor([indices['src'], indices['dst']], dtype=torch.long)
-            data[e_type].edge_attr = torch.tensor(indices['weight'], dtype=torch.float).unsqueeze(1)
+            return (src_type, edge['type'].lower(), dst_type), src_idx, dst_idx
+        counts = Counter(r[0] for r in map(resolve, edges) if r)
+        # 2차 패스: 미리 할당한 NumPy 배열에 타입별 커서 위치로 기록
+        edge_store = {e_type: (np.empty((2, cnt), dtype=np.int64), np.empty(cnt, dtype=np.float32)) for e_type, cnt in counts.items()}
+        cursor = dict.fromkeys(counts, 0)
+        for edge in edges:
+            r = resolve(edge)
+            if r is None: continue
+            e_type, src_idx, dst_idx = r
+            index, weight = edge_store[e_type]; i = cursor[e_type]
+            index[0, i] = src_idx; index[1, i] = dst_idx
+            weight[i] = edge.get('score', 1.0)
+            cursor[e_type] = i + 1
+        for e_type, (index, weight) in edge_store.items():
+            data[e_type].edge_index = torch.from_numpy(index)
+            data[e_type].edge_attr = torch.from_numpy(weight).unsqueeze(1)
         return data
 
-    def run(self):
+    def _input_fingerprint(self) -> str:
+        """SQL 덤프, 참조 JSON, 빌드 버전과 이 스크립트 코드를 합친 입력 지문 (덤프는 mmap으로 읽어 해시)"""
+        h = hashlib.blake2b(self.version.encode(), digest_size=16)
+        # 파싱/엣지 생성 로직이 바뀌면 입력이 같아도 결과가 달라지므로 코드도 지문에 포함
+        h.update(Path(__file__).read_bytes())
+        # mmap은 빈 파일을 매핑할 수 없으므로 빈 덤프는 해시할 내용 없음
+        if SQL_PATH.stat().st_size:
+            with open(SQL_PATH, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                h.update(content)
+        for ref in ("popular_builds.json", "game_requirements.json"):
+            path = REC_DIR / ref
+            h.update(path.read_bytes() if path.exists() else b"")
+        return h.hexdigest()
+
+    def run(self, force: bool = False):
         logger.info(f"[{self.version}] 체크리스트 완벽 대응 그래프 빌드 시작...")
         if not SQL_PATH.exists(): return
-        
-        with open(SQL_PATH, 'r', encoding='utf-8') as f:
-            content = f.read()
+
+        # 입력이 이전 빌드와 같으면 JSON/PyG 결과를 그대로 재사용
+        fingerprint = self._input_fingerprint()
+        fingerprint_path = REC_DIR / FINGERPRINT_FILE
+        pyg_cache = REC_DIR / f"pyg_{fingerprint}.pt"
+        if (not force and fingerprint_path.exists() and fingerprint_path.read_text().strip() == fingerprint
+                and all((REC_DIR / name).exists() for name in OUTPUT_FILES)):
+            logger.info(f"입력 변경 없음 (fingerprint={fingerprint}), 기존 결과 재사용")
+            if HAS_PYG and pyg_cache.exists():
+                pyg_data = torch.load(pyg_cache, map_location='cpu', weights_only=False)
+                logger.success(f"PyG 캐시 로드: 메타데이터: {pyg_data.metadata()}")
+            return
 
         # [필수 수정] 쿨러와 SSD 테이블을 모두 포함하도록 확장
         category_map = {
@@ -264,43 +413,64 @@ class PCDataPipeline:
             "storage": ["storage", "internal_hard_drive"] # SSD/HDD 추가
         }
         
-        raw_nodes = []
+        # INSERT 문 파싱: 모든 테이블을 하나의 패턴으로 한 번만 스캔 (파일은 mmap으로 필요한 부분만 읽음)
+        table_names = sorted({t for tables in category_map.values() for t in tables}, key=len, reverse=True)
+        pattern = re.compile(
+            rb"INSERT INTO\s+[`]?(" + b"|".join(re.escape(t.encode()) for t in table_names) + rb")[`]?\s+VALUES\s*\((.*?)\);",
+            re.I | re.S
+        )
+        values_by_table = defaultdict(list)
+        # mmap은 빈 파일을 매핑할 수 없으므로 빈 덤프는 파싱할 INSERT 없음 (빈 결과 생성)
+        if SQL_PATH.stat().st_size:
+            with open(SQL_PATH, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                for m in pattern.finditer(content):
+                    values_by_table[m.group(1).decode().lower()].append(m.group(2).decode('utf-8'))
+
+        # 같은 ID는 처음 등장한 위치에 마지막 행의 값으로 유지
+        nodes_by_id = {}
         for cat, tables in category_map.items():
             for table in tables:
-                # INSERT 문 파싱
-                pattern = re.compile(rf"INSERT INTO\s+[`]?{re.escape(table)}[`]?\s+VALUES\s*\((.*?)\);", re.I | re.S)
-                for match in pattern.findall(content):
-                    rows = match.split("),(")
-                    for row in rows:
-                        cols = [c.strip("'\" ") for c in row.split(",")]
-                        if len(cols) < 2: continue
-                        node_id = f"{cat}_{cols[0]}"
-                        name = cols[1]; price = float(cols[-1]) if cols[-1].replace('.','').isdigit() else 0
-                        full_text = " ".join(cols).upper()
-                        raw_nodes.append({
-                            "id": node_id, "category": cat, "name": name, "brand": self.extract_brand(name),
-                            "price": price, "tier": self.get_performance_tier(cat, name, price),
-                            "specs": self.extract_tech_specs(cat, full_text), "type": "component", "raw": full_text
-                        })
-                        first_word = name.upper().split()[0] if name else ""
-                        if first_word: self.keyword_index[cat][first_word].append((node_id, name.upper()))
-
-        self.nodes = list({n['id']: n for n in raw_nodes}.values())
+                # 테이블별 원래 순서 유지 (노드/키워드 인덱스 순서가 기존과 동일)
+                # 테이블의 모든 INSERT 값 목록을 줄 단위로 이어 붙이고 행 구분자 "),("도 줄바꿈으로 바꿔
+                # C 구현 csv 리더 하나로 토큰화 (따옴표 안의 쉼표 보존, INSERT 문마다 리더를 만들지 않음)
+                if table not in values_by_table: continue
+                values_text = "\n".join(values_by_table[table]).replace("),(", "\n")
+                for cols in csv.reader(io.StringIO(values_text), quotechar="'", escapechar="\\", skipinitialspace=True):
+                    if len(cols) < 2: continue
+                    node_id = f"{cat}_{cols[0]}"
+                    # 가격: 대부분 정수라 isdigit으로 먼저 판정 (소수점은 하나까지만 허용, "1.2.3"은 0)
+                    name = cols[1]; p = cols[-1]; price = float(p) if p.isdigit() or p.replace('.', '', 1).isdigit() else 0
+                    name_upper = name.upper()
+                    full_text = " ".join(cols).upper()
+                    nodes_by_id[node_id] = {
+                        "id": node_id, "category": cat, "name": name, "brand": self.extract_brand(name),
+                        "price": price, "tier": self.get_performance_tier(cat, name_upper, price),
+                        "specs": self.extract_tech_specs(cat, full_text), "type": "component"
+                    }
+                    # 이름의 모든 토큰(3자 이상)을 색인 (첫 단어만 색인하면 브랜드명 후보 전체를 훑게 됨)
+                    for token in dict.fromkeys(t for t in name_upper.split() if len(t) > 2):
+                        self.keyword_index[cat][token].append((node_id, name_upper))
+
+        self.nodes = list(nodes_by_id.values())
+        self._freeze_keyword_index()
         compat_edges, synergy_edges, suitable_edges = self.generate_verified_edges()
         
         # 속성 매핑 생성
         logger.info("속성 노드 및 매핑 생성 중...")
-        attr_edges = []; node_ids = {n['id'] for n in self.nodes}; new_nodes = []
+        # (속성 종류, 값) -> 속성 노드 ID (같은 값이라도 종류가 다르면 별도 노드, 예: 650W tdp vs wattage)
+        attr_edges = []; attr_ids = {}; new_nodes = []
         for node in self.nodes:
             if node.get('type') == 'component':
                 # 카테고리 관계
                 attr_edges.append({"source": node['id'], "target": f"cat_{node['category']}", "type": "BELONGS_TO"})
                 # 개별 스펙 관계
                 for s_key, s_val in node['specs'].items():
-                    attr_node_id = f"attr_{s_val}"
-                    if attr_node_id not in node_ids:
+                    # 목록형 스펙(케이스 지원 폼팩터)은 호환성 규칙 전용이라 속성 노드로 만들지 않음
+                    if isinstance(s_val, list): continue
+                    attr_node_id = attr_ids.get((s_key, s_val))
+                    if attr_node_id is None:
+                        attr_node_id = attr_ids[(s_key, s_val)] = f"attr_{s_key}_{s_val}"
                         new_nodes.append({"id": attr_node_id, "type": "attribute", "name": str(s_val), "attr_type": s_key})
-                        node_ids.add(attr_node_id)
                     attr_edges.append({"source": node['id'], "target": attr_node_id, "type": "HAS_ATTRIBUTE"})
         
         self.nodes.extend(new_nodes)
@@ -317,13 +487,23 @@ class PCDataPipeline:
             pyg_data = self.build_pyg_graph(self.nodes, compat_edges + synergy_edges + suitable_edges + attr_edges)
             if pyg_data:
                 logger.success(f"PyG 변환 성공! 메타데이터: {pyg_data.metadata()}")
+                for stale in REC_DIR.glob("pyg_*.pt"): stale.unlink()
+                torch.save(pyg_data, pyg_cache)
+
+        # 모든 결과를 저장한 뒤에 지문을 기록 (중간 실패 시 다음 실행에서 다시 빌드)
+        fingerprint_path.write_text(fingerprint)
         
         logger.success(f"최종 완료: 노드 {len(self.nodes)}개, 호환성 규칙 6개 모두 적용됨.")
 
     def save_json(self, filename, data):
-        wrapper = {"version": self.version, "updated_at": datetime.now().strftime("%Y-%m-%d"), "data": data}
-        with open(REC_DIR / filename, "w", encoding="utf-8") as f:
-            json.dump(wrapper, f, ensure_ascii=False)
+        header = {"version": self.version, "updated_at": datetime.now().strftime("%Y-%m-%d")}
+        # orjson으로 SAVE_CHUNK_SIZE개 레코드씩 직렬화해 스트리밍 (전체 JSON 바이트를 한 번에 만들지 않음)
+        with open(REC_DIR / filename, "wb") as f:
+            f.write(orjson.dumps(header)[:-1] + b',"data":[')
+            for start in range(0, len(data), SAVE_CHUNK_SIZE):
+                if start: f.write(b",")
+                f.write(orjson.dumps(data[start:start + SAVE_CHUNK_SIZE])[1:-1])
+            f.write(b"]}")
         logger.info(f"저장 완료: {filename} ({len(data)} items)")
 
 if __name__ == "__main__":
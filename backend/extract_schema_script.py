@@ -1,5 +1,7 @@
 
 import os
+import re
+import mmap
 from pathlib import Path
 
 def extract():
@@ -12,24 +14,34 @@ def extract():
     
     schemas = {}
     targets = [b"CREATE TABLE `cpu`", b"CREATE TABLE `gpu`", b"CREATE TABLE `video_card`", b"CREATE TABLE `motherboard`", b"CREATE TABLE `memory`"]
+    # All targets in one alternation so the dump is scanned once instead of once per target
+    pattern = re.compile(b"|".join(re.escape(t) for t in targets))
     
     try:
-        with open(sql_path, "rb") as f:
-            content = f.read()
+        found = {}
+        # mmap cannot map an empty file
+        if sql_path.stat().st_size:
+            with open(sql_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                for m in pattern.finditer(content):
+                    t = m.group(0)
+                    if t in found:
+                        continue
+                    # Find the closing semicolon
+                    end_idx = content.find(b";", m.start())
+                    if end_idx != -1:
+                        found[t] = content[m.start():end_idx+1]
+                    if len(found) == len(targets):
+                        break
             
+        # Keep the original target order in the output
         for t in targets:
-            start_idx = content.find(t)
-            if start_idx != -1:
-                # Find the closing semicolon
-                end_idx = content.find(b";", start_idx)
-                if end_idx != -1:
-                    schema_bytes = content[start_idx:end_idx+1]
-                    try:
-                        schema_str = schema_bytes.decode('utf-8', errors='replace')
-                        name = t.decode().replace("CREATE TABLE ", "").strip("`")
-                        schemas[name] = schema_str
-                    except:
-                        pass
+            if t in found:
+                try:
+                    schema_str = found[t].decode('utf-8', errors='replace')
+                    name = t.decode().replace("CREATE TABLE ", "").strip("`")
+                    schemas[name] = schema_str
+                except:
+                    pass
         
         with open(output_path, "w", encoding="utf-8") as f:
             f.write("# Extracted Schemas\n\n")
@@ -10,11 +10,13 @@ PC 부품 간 호환성을 온톨로지와 규칙 기반으로 검증하는 모
 """
 
 from .engine import CompatibilityEngine
+from .catalog import ComponentCatalog
 from .ontology import PCOntology
 from .rules import CompatibilityRules
 
 __all__ = [
     "CompatibilityEngine",
+    "ComponentCatalog",
     "PCOntology",
     "CompatibilityRules",
 ]
@@ -0,0 +1,132 @@
+"""
+부품 카탈로그 (열 기반 배열)
+==========================
+
+[목표]
+------
+추천기처럼 수천 개 부품 쌍을 한꺼번에 평가할 때, 부품 dict를 한 번만 읽어
+스펙 필드별 NumPy 배열(SoA)로 보관하고 호환성 마스크를 벡터 연산으로 계산.
+
+[사용 예시]
+----------
+```python
+catalog = ComponentCatalog(components)
+cpu_idx = np.arange(len(catalog.components["cpu"]))
+mb_idx = np.arange(len(catalog.components["motherboard"]))
+
+# 인덱스 배열은 브로드캐스팅되므로 [:, None] / [None, :]로 전체 쌍 행렬 계산
+mask = catalog.socket_mask(cpu_idx[:, None], mb_idx[None, :])
+```
+
+[판정 기준]
+----------
+마스크는 CompatibilityEngine의 스펙 기반 검사가 FAIL이 아닌 쌍이면 True.
+스펙이 없는 부품(엔진에서는 WARNING 또는 이름 기반 추론)은 True로 남기므로,
+마스크는 후보를 걸러내는 용도이고 최종 판정은 check_all로 확인한다.
+"""
+
+from typing import Dict, Any, List, Tuple
+
+import numpy as np
+
+from .engine import FORM_FACTOR_COMPATIBILITY
+
+
+# 정보 없음을 나타내는 범주 코드
+UNKNOWN_CODE = -1
+
+
+def _encode(values: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """문자열 목록을 정수 코드로 인코딩 (빈 값은 UNKNOWN_CODE), (코드 배열, 어휘 배열) 반환"""
+    vocab, codes = np.unique(np.array(values, dtype=str), return_inverse=True)
+    codes = codes.astype(np.int16)
+    if len(vocab) and vocab[0] == "":
+        # np.unique는 정렬된 어휘를 반환하므로 빈 문자열은 항상 0번
+        codes -= 1
+        vocab = vocab[1:]
+    return codes, vocab
+
+
+def _to_float(value: Any) -> float:
+    """치수 스펙 값을 float로 변환 (없거나 0이거나 숫자가 아니면 NaN)"""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return np.nan
+    return value if value else np.nan
+
+
+class ComponentCatalog:
+    """
+    부품 목록을 카테고리별 스펙 열 배열로 변환한 카탈로그
+
+    components[category]의 순서가 해당 카테고리 배열의 인덱스가 된다.
+    소켓/폼팩터 문자열은 카테고리 간 공통 어휘의 정수 코드로 저장되어
+    서로 다른 카테고리의 열을 바로 비교할 수 있다.
+    """
+
+    def __init__(self, components: List[Dict[str, Any]]):
+        """
+        Args:
+            components: 부품 목록 (check_all 입력과 같은 형식, 여러 카테고리 혼합 가능)
+        """
+        self.components: Dict[str, List[Dict[str, Any]]] = {
+            "cpu": [], "motherboard": [], "gpu": [], "case": [],
+        }
+        for component in components:
+            category = component.get("category")
+            if category in self.components:
+                self.components[category].append(component)
+
+        def column(category: str, key: str) -> List[Any]:
+            return [c.get("specs", {}).get(key) for c in self.components[category]]
+
+        # 소켓: CPU/메인보드 공통 어휘
+        cpu_sockets = [s or "" for s in column("cpu", "socket")]
+        mb_sockets = [s or "" for s in column("motherboard", "socket")]
+        codes, self.socket_vocab = _encode(cpu_sockets + mb_sockets)
+        self.cpu_socket = codes[:len(cpu_sockets)]
+        self.mb_socket = codes[len(cpu_sockets):]
+
+        # 폼팩터: 메인보드/케이스 공통 어휘 + [케이스 코드, 메인보드 코드] 장착 가능 테이블
+        mb_forms = [f or "" for f in column("motherboard", "form_factor")]
+        case_forms = [f or "" for f in column("case", "form_factor")]
+        codes, self.form_factor_vocab = _encode(mb_forms + case_forms)
+        self.mb_form_factor = codes[:len(mb_forms)]
+        self.case_form_factor = codes[len(mb_forms):]
+        self.form_factor_table = np.array(
+            [
+                [mb_form in FORM_FACTOR_COMPATIBILITY.get(case_form, frozenset())
+                 for mb_form in self.form_factor_vocab]
+                for case_form in self.form_factor_vocab
+            ],
+            dtype=bool,
+        ).reshape(len(self.form_factor_vocab), len(self.form_factor_vocab))
+
+        # 치수 (mm, 정보 없음은 NaN)
+        self.gpu_length = np.array([_to_float(v) for v in column("gpu", "length")], dtype=np.float64)
+        self.case_max_gpu_length = np.array(
+            [_to_float(v) for v in column("case", "max_gpu_length")], dtype=np.float64
+        )
+
+    def socket_mask(self, cpu_idx: np.ndarray, mb_idx: np.ndarray) -> np.ndarray:
+        """CPU-메인보드 소켓 마스크 (두 소켓이 모두 있고 다르면 False)"""
+        cpu = self.cpu_socket[cpu_idx]
+        mb = self.mb_socket[mb_idx]
+        return (cpu == mb) | (cpu == UNKNOWN_CODE) | (mb == UNKNOWN_CODE)
+
+    def gpu_case_mask(self, gpu_idx: np.ndarray, case_idx: np.ndarray) -> np.ndarray:
+        """GPU-케이스 길이 마스크 (두 치수가 모두 있고 GPU가 더 길면 False)"""
+        gpu_length = self.gpu_length[gpu_idx]
+        case_max = self.case_max_gpu_length[case_idx]
+        return ~(gpu_length > case_max)  # NaN 비교는 False이므로 정보 없음은 True
+
+    def form_factor_mask(self, mb_idx: np.ndarray, case_idx: np.ndarray) -> np.ndarray:
+        """메인보드-케이스 폼팩터 마스크 (두 폼팩터가 모두 있고 장착 불가면 False)"""
+        mb = self.mb_form_factor[mb_idx]
+        case = self.case_form_factor[case_idx]
+        known = (mb != UNKNOWN_CODE) & (case != UNKNOWN_CODE)
+        if not known.any():
+            return ~known
+        fits = self.form_factor_table[np.where(known, case, 0), np.where(known, mb, 0)]
+        return ~known | fits
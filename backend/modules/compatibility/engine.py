@@ -165,9 +165,17 @@ PC 부품 간의 물리적/논리적 호환성을 온톨로지와 규칙 기반
 backend/tests/test_compatibility.py 참조
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, FrozenSet, Annotated, Union
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from collections import Counter, OrderedDict
+import msgspec
+import numpy as np
 from loguru import logger
 from pydantic import BaseModel, Field
 
@@ -203,31 +211,126 @@ class ComponentSpecs(BaseModel):
     specs: Dict[str, Any] = Field(default_factory=dict)
 
 
-class CompatibilityCheck(BaseModel):
+# 검사 결과 모델은 check_all마다 여러 개 생성되므로 검증 비용이 없는 msgspec.Struct 사용
+# (엔진 내부에서만 생성, 결과 캐시에서 공유되므로 frozen + 튜플; 직렬화는 msgspec.to_builtins / msgspec.json.encode)
+# details는 dict라 변경 가능하므로 check_all이 호출자마다 복사해서 반환
+
+class CompatibilityCheck(msgspec.Struct, frozen=True, kw_only=True):
     """개별 호환성 검사 결과"""
     check_id: str
     name: str
-    components: List[str]
+    components: Tuple[str, ...]
     status: CheckStatus
     message: str
-    details: Dict[str, Any] = Field(default_factory=dict)
+    details: Dict[str, Any] = {}
 
 
-class PowerSummary(BaseModel):
+class PowerSummary(msgspec.Struct, frozen=True, kw_only=True):
     """전력 요약"""
-    total_tdp: int = Field(..., description="총 TDP (W)")
-    recommended_psu: int = Field(..., description="권장 PSU 용량 (W)")
-    current_psu: Optional[int] = Field(None, description="현재 PSU 용량 (W)")
-    headroom_pct: Optional[float] = Field(None, description="전력 여유율 (%)")
+    total_tdp: Annotated[int, msgspec.Meta(description="총 TDP (W)")]
+    recommended_psu: Annotated[int, msgspec.Meta(description="권장 PSU 용량 (W)")]
+    current_psu: Annotated[Optional[int], msgspec.Meta(description="현재 PSU 용량 (W)")] = None
+    headroom_pct: Annotated[Optional[float], msgspec.Meta(description="전력 여유율 (%)")] = None
 
 
-class CompatibilityResult(BaseModel):
+class CompatibilityResult(msgspec.Struct, frozen=True, kw_only=True):
     """호환성 검사 결과"""
     is_compatible: bool
-    overall_score: int = Field(..., ge=0, le=100)
-    checks: List[CompatibilityCheck]
+    overall_score: Annotated[int, msgspec.Meta(ge=0, le=100)]
+    checks: Tuple[CompatibilityCheck, ...]
     power_summary: Optional[PowerSummary] = None
-    recommendations: List[str] = Field(default_factory=list)
+    recommendations: Tuple[str, ...] = ()
+
+
+# 검사별 고정 필드 (check_id -> (name, components)): 검사 메서드에서는 변하는 값만 넘김
+CHECK_META = {
+    "cpu_mb_socket": ("CPU-메인보드 소켓 호환성", ("cpu", "motherboard")),
+    "mem_mb_type": ("메모리-메인보드 호환성", ("memory", "motherboard")),
+    "gpu_case_length": ("GPU-케이스 길이 호환성", ("gpu", "case")),
+    "mb_case_form": ("메인보드-케이스 폼팩터", ("motherboard", "case")),
+    "cooler_case_height": ("CPU 쿨러-케이스 높이 호환성", ("cpu_cooler", "case")),
+    "storage_mb_slots": ("저장장치-메인보드 슬롯 호환성", ("storage", "motherboard")),
+    "power_check": ("전력 호환성", ("psu",)),
+}
+
+# 실패한 검사별 권장 사항 (check_id -> 문구); 전력 검사는 권장 PSU 용량이 필요해 별도 처리
+FAIL_RECOMMENDATIONS = {
+    "cpu_mb_socket": "CPU와 메인보드의 소켓이 일치하는지 확인하세요",
+    "mem_mb_type": "메모리 타입(DDR4/DDR5)이 메인보드와 호환되는지 확인하세요",
+    "mb_case_form": "메인보드 폼팩터가 케이스에 맞는지 확인하세요",
+}
+
+# 권장 사항 최대 개수
+MAX_RECOMMENDATIONS = 5
+
+
+def _make_check(
+    check_id: str,
+    status: CheckStatus,
+    message: str,
+    details: Dict[str, Any],
+) -> CompatibilityCheck:
+    """CHECK_META의 고정 필드와 검사 결과(status/message/details)로 CompatibilityCheck 생성"""
+    name, components = CHECK_META[check_id]
+    return CompatibilityCheck(
+        check_id=check_id,
+        name=name,
+        components=components,
+        status=status,
+        message=message,
+        details=details,
+    )
+
+
+def _detach_details(result: CompatibilityResult) -> CompatibilityResult:
+    """캐시된 결과를 호출자에게 넘길 사본 (변경 가능한 details dict만 새로 만들고 나머지는 공유)"""
+    return msgspec.structs.replace(
+        result,
+        checks=tuple(
+            msgspec.structs.replace(check, details=dict(check.details)) for check in result.checks
+        ),
+    )
+
+
+def recommend_psu_wattage(total_tdp: Union[int, np.ndarray]) -> Union[int, np.ndarray]:
+    """
+    총 TDP로 권장 PSU 용량 계산: TDP의 1.4배(1.3~1.5배 권장)를 50W 단위로 올림
+    
+    int 하나 또는 여러 빌드의 TDP를 담은 정수 NumPy 배열을 받아 같은 형태로 반환한다
+    (후보 빌드를 대량으로 평가할 때 파이썬 루프 없이 한 번에 계산).
+    """
+    if isinstance(total_tdp, np.ndarray):
+        recommended = (total_tdp * 1.4).astype(np.int64)
+    else:
+        recommended = int(total_tdp * 1.4)
+    return ((recommended + 49) // 50) * 50
+
+
+def _freeze(value: Any) -> Any:
+    """부품 목록을 캐시 키로 쓸 수 있는 해시 가능한 값으로 변환 (dict는 키 정렬, list는 tuple)"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    hash(value)  # 해시 불가 값이면 TypeError
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _normalized_name(name: str) -> str:
+    """이름 기반 추론용 소문자 이름 (같은 부품 이름은 한 번만 변환)"""
+    return name.lower()
+
+
+@lru_cache(maxsize=256)
+def _interface_kind(interface: str) -> Optional[str]:
+    """저장장치 인터페이스 문자열 분류: M.2 -> "m2", SATA -> "sata", 그 외 None"""
+    interface = interface.upper()
+    if "M.2" in interface:
+        return "m2"
+    if "SATA" in interface:
+        return "sata"
+    return None
 
 
 # ============================================================================
@@ -262,12 +365,12 @@ AMD_COMPATIBILITY = {
     },
 }
 
-# 폼팩터 호환성
+# 폼팩터 호환성: 케이스 폼팩터 -> 장착 가능한 메인보드 폼팩터 (frozenset 멤버십 검사)
 FORM_FACTOR_COMPATIBILITY = {
-    "ATX": ["ATX", "Micro-ATX", "Mini-ITX"],
-    "Micro-ATX": ["Micro-ATX", "Mini-ITX"],
-    "Mini-ITX": ["Mini-ITX"],
-    "E-ATX": ["E-ATX", "ATX", "Micro-ATX", "Mini-ITX"],
+    "ATX": frozenset({"ATX", "Micro-ATX", "Mini-ITX"}),
+    "Micro-ATX": frozenset({"Micro-ATX", "Mini-ITX"}),
+    "Mini-ITX": frozenset({"Mini-ITX"}),
+    "E-ATX": frozenset({"E-ATX", "ATX", "Micro-ATX", "Mini-ITX"}),
 }
 
 # GPU 전력 요구사항 (대략적 값)
@@ -284,6 +387,58 @@ GPU_POWER_REQUIREMENTS = {
 }
 
 
+# ============================================================================
+# 이름 기반 추론용 정규식 (모듈 로드 시 한 번만 컴파일, 이름 문자열을 한 번만 스캔)
+# ============================================================================
+
+# CPU 세대 추론 (소문자 이름 대상)
+INTEL_14TH_GEN_PATTERN = re.compile(r"14600|14700|14900")
+RYZEN_7000_PATTERN = re.compile(r"7800|7900|7600")
+INTEL_700_SERIES_MB_PATTERN = re.compile(r"z790|b760|h770")
+AMD_600_SERIES_MB_PATTERN = re.compile(r"x670|b650")
+
+# TDP 125W로 추정하는 CPU 모델 번호
+CPU_125W_PATTERN = re.compile(r"14900|14700|14600|13600|12600")
+
+# GPU 모델 (소문자 이름 대상): 그룹 이름 g{i} -> GPU_POWER_REQUIREMENTS의 i번째 모델
+# 여러 모델이 포함되면 GPU_POWER_REQUIREMENTS에 먼저 나오는 모델을 우선 (기존 순차 검사와 동일)
+GPU_MODEL_PATTERN = re.compile(
+    "|".join(f"(?P<g{i}>{re.escape(model.lower())})" for i, model in enumerate(GPU_POWER_REQUIREMENTS))
+)
+GPU_MODEL_TDP = {f"g{i}": (i, specs["tdp"]) for i, specs in enumerate(GPU_POWER_REQUIREMENTS.values())}
+
+
+@lru_cache(maxsize=512)
+def _gpu_tdp_from_name(gpu_name: str) -> int:
+    """GPU 이름으로 TDP 추정 (이름당 한 번만 스캔, 모르는 모델은 기본값 200W)
+
+    한 번의 스캔으로 모든 모델 후보를 찾고, 그중 테이블 순서가 가장 앞선 모델 선택.
+    """
+    matched = min(
+        (GPU_MODEL_TDP[m.lastgroup] for m in GPU_MODEL_PATTERN.finditer(_normalized_name(gpu_name))),
+        default=None,
+    )
+    return matched[1] if matched else 200
+
+# 부품 구성별 검사 결과 캐시 크기 (엔진 인스턴스당)
+RESULT_CACHE_SIZE = 4096
+
+# PSU 이름의 용량 표기 (예: "Foo 750W")
+PSU_WATTAGE_PATTERN = re.compile(r"(\d{3,4})W")
+
+
+# 부품 쌍 호환성 검사 목록: (검사 메서드, 필요한 카테고리, 인자 키) - check_all에서 이 순서대로 실행
+# 저장장치는 여러 개일 수 있어 카테고리 대표값 대신 전체 목록("storage_list")을 인자로 받음
+PAIR_CHECKS = (
+    ("_check_cpu_motherboard", ("cpu", "motherboard"), ("cpu", "motherboard")),
+    ("_check_memory_motherboard", ("memory", "motherboard"), ("memory", "motherboard")),
+    ("_check_gpu_case", ("gpu", "case"), ("gpu", "case")),
+    ("_check_motherboard_case", ("motherboard", "case"), ("motherboard", "case")),
+    ("_check_cpu_cooler_case", ("cpu_cooler", "case"), ("cpu_cooler", "case")),
+    ("_check_storage_motherboard", ("storage", "motherboard"), ("storage_list", "motherboard")),
+)
+
+
 # ============================================================================
 # 호환성 엔진
 # ============================================================================
@@ -325,80 +480,123 @@ class CompatibilityEngine:
         """
         self.strict_mode = strict_mode
         
+        # 부품 구성(순서 포함) -> 검사 결과 LRU 캐시
+        self._result_cache: "OrderedDict[Tuple, CompatibilityResult]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        
         # 규칙 엔진 초기화
         from .rules import CompatibilityRules
         self.rules = CompatibilityRules()
         
-        logger.info(f"CompatibilityEngine 초기화: strict_mode={strict_mode}")
+        logger.info("CompatibilityEngine 초기화: strict_mode={}", strict_mode)
     
     def check_all(
         self,
         components: List[Dict[str, Any]],
+        fast_reject: bool = False,
     ) -> CompatibilityResult:
         """
         모든 호환성 검사 수행
         
+        같은 부품 구성(부품 순서 포함)은 캐시된 결과를 재사용한다. 결과와 검사 목록은 불변이고,
+        변경 가능한 details dict만 호출자마다 복사하므로 반환값을 수정해도 캐시에 영향이 없다.
+        
         Args:
             components: 부품 목록
+            fast_reject: True면 호환 불가가 확정되는 첫 검사(FAIL, strict 모드는 WARNING 포함)에서
+                즉시 반환 (추천 후보 사전 필터용). 이때 결과는 is_compatible만 유효하며
+                overall_score=0, power_summary=None, 권장 사항 없음
             
         Returns:
             CompatibilityResult: 검사 결과
         """
-        logger.info(f"호환성 검사 시작: {len(components)}개 부품")
+        logger.info("호환성 검사 시작: {}개 부품", len(components))
         
-        checks = []
+        try:
+            key = (fast_reject, _freeze(components))
+        except TypeError:
+            # 해시할 수 없는 스펙 값이 있으면 캐시 없이 검사
+            return self._check_all_uncached(components, fast_reject)
         
-        # 부품을 카테고리별로 분류
-        by_category = self._categorize_components(components)
+        with self._result_cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+        if cached is None:
+            cached = self._check_all_uncached(components, fast_reject)
+            with self._result_cache_lock:
+                self._result_cache[key] = cached
+                if len(self._result_cache) > RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+        return _detach_details(cached)
+    
+    def check_all_batch(
+        self,
+        builds: List[List[Dict[str, Any]]],
+        fast_reject: bool = False,
+        max_workers: Optional[int] = None,
+        chunksize: int = 64,
+    ) -> List[CompatibilityResult]:
+        """
+        여러 후보 빌드를 프로세스 풀로 병렬 검사 (추천기의 대량 후보 평가용)
         
-        # 1. CPU-메인보드 호환성
-        if "cpu" in by_category and "motherboard" in by_category:
-            check = self._check_cpu_motherboard(
-                by_category["cpu"],
-                by_category["motherboard"],
-            )
-            checks.append(check)
+        각 워커 프로세스는 같은 strict_mode의 엔진을 한 번만 생성해 재사용하므로
+        규칙 테이블과 결과 캐시가 워커가 맡은 모든 청크에 걸쳐 재사용된다.
+        빌드 수가 chunksize 이하면 프로세스 생성 비용이 더 크므로 현재 프로세스에서 순차 검사한다.
         
-        # 2. 메모리-메인보드 호환성
-        if "memory" in by_category and "motherboard" in by_category:
-            check = self._check_memory_motherboard(
-                by_category["memory"],
-                by_category["motherboard"],
-            )
-            checks.append(check)
+        Args:
+            builds: 부품 목록(check_all 입력)의 리스트
+            fast_reject: check_all의 fast_reject와 동일
+            max_workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+            chunksize: 워커에 한 번에 넘길 빌드 수
+            
+        Returns:
+            List[CompatibilityResult]: builds와 같은 순서의 검사 결과
+        """
+        workers = max_workers or os.cpu_count() or 1
+        if workers <= 1 or len(builds) <= chunksize:
+            return [self.check_all(components, fast_reject) for components in builds]
         
-        # 3. GPU-케이스 호환성
-        if "gpu" in by_category and "case" in by_category:
-            check = self._check_gpu_case(
-                by_category["gpu"],
-                by_category["case"],
+        logger.info("호환성 일괄 검사 시작: {}개 빌드, {}개 프로세스", len(builds), workers)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(self.strict_mode,),
+        ) as executor:
+            return list(executor.map(
+                _check_in_batch_worker,
+                builds,
+                [fast_reject] * len(builds),
+                chunksize=chunksize,
+            ))
+    
+    def _check_all_uncached(
+        self,
+        components: List[Dict[str, Any]],
+        fast_reject: bool = False,
+    ) -> CompatibilityResult:
+        """캐시 없이 모든 호환성 검사 수행"""
+        checks = []
+        # fast_reject 모드에서 즉시 호환 불가로 확정되는 상태
+        reject_statuses = ()
+        if fast_reject:
+            reject_statuses = (
+                (CheckStatus.FAIL, CheckStatus.WARNING) if self.strict_mode else (CheckStatus.FAIL,)
             )
-            checks.append(check)
         
-        # 4. 메인보드-케이스 폼팩터
-        if "motherboard" in by_category and "case" in by_category:
-            check = self._check_motherboard_case(
-                by_category["motherboard"],
-                by_category["case"],
-            )
-            checks.append(check)
-
-        # 5. CPU 쿨러-케이스 호환성
-        if "cpu_cooler" in by_category and "case" in by_category:
-            check = self._check_cpu_cooler_case(
-                by_category["cpu_cooler"],
-                by_category["case"],
-            )
-            checks.append(check)
-
-        # 6. 저장장치-메인보드 호환성
-        storage_list = [c for c in components if c.get("category") == "storage"]
-        if storage_list and "motherboard" in by_category:
-            check = self._check_storage_motherboard(
-                storage_list,
-                by_category["motherboard"],
-            )
+        # 부품을 카테고리별로 분류
+        by_category = self._categorize_components(components)
+        
+        # 1~6. 부품 쌍 호환성 (카테고리 구성별로 미리 계산한 검사 계획만 실행)
+        sources = by_category
+        if "storage" in by_category:
+            storage_list = [c for c in components if c.get("category") == "storage"]
+            sources = dict(by_category, storage_list=storage_list)
+        for check_fn, first_key, second_key in self._check_plan(frozenset(by_category)):
+            check = check_fn(self, sources[first_key], sources[second_key])
             checks.append(check)
+            if check.status in reject_statuses:
+                return self._rejected_result(checks)
         
         # 7. 전력 계산
         power_summary = self._calculate_power(components, by_category)
@@ -406,6 +604,8 @@ class CompatibilityEngine:
         if "psu" in by_category:
             check = self._check_power(power_summary, by_category["psu"])
             checks.append(check)
+            if check.status in reject_statuses:
+                return self._rejected_result(checks)
         
         # 전체 결과 계산
         is_compatible, overall_score = self._calculate_overall(checks)
@@ -416,21 +616,43 @@ class CompatibilityEngine:
         return CompatibilityResult(
             is_compatible=is_compatible,
             overall_score=overall_score,
-            checks=checks,
+            checks=tuple(checks),
             power_summary=power_summary,
             recommendations=recommendations,
         )
     
+    @staticmethod
+    def _rejected_result(checks: List[CompatibilityCheck]) -> CompatibilityResult:
+        """fast_reject 모드의 조기 종료 결과 (점수/전력/권장 사항은 계산하지 않음)"""
+        return CompatibilityResult(
+            is_compatible=False,
+            overall_score=0,
+            checks=tuple(checks),
+            power_summary=None,
+            recommendations=(),
+        )
+    
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _check_plan(cls, shape: FrozenSet[str]) -> Tuple[Tuple[Any, str, str], ...]:
+        """
+        카테고리 구성(shape)에 해당하는 부품 쌍 검사 계획
+        
+        요청마다 7개 조건 분기를 평가하지 않도록, 같은 구성이면 적용 가능한 검사 함수와
+        인자 키 목록을 캐시하여 재사용한다.
+        """
+        return tuple(
+            (getattr(cls, method), *arg_keys)
+            for method, required, arg_keys in PAIR_CHECKS
+            if all(category in shape for category in required)
+        )
+    
     def _categorize_components(
         self,
         components: List[Dict[str, Any]],
     ) -> Dict[str, Dict[str, Any]]:
-        """부품을 카테고리별로 분류"""
-        by_category = {}
-        for comp in components:
-            category = comp.get("category", "unknown")
-            by_category[category] = comp
-        return by_category
+        """부품을 카테고리별로 분류 (같은 카테고리가 여러 개면 마지막 부품)"""
+        return {comp.get("category", "unknown"): comp for comp in components}
     
     def _check_cpu_motherboard(
         self,
@@ -447,22 +669,18 @@ class CompatibilityEngine:
         # 소켓 확인
         if cpu_socket and mb_socket:
             if cpu_socket == mb_socket:
-                return CompatibilityCheck(
-                    check_id="cpu_mb_socket",
-                    name="CPU-메인보드 소켓 호환성",
-                    components=["cpu", "motherboard"],
-                    status=CheckStatus.PASS,
-                    message=f"{cpu_socket} 소켓으로 완벽 호환",
-                    details={"cpu_socket": cpu_socket, "mb_socket": mb_socket},
+                return _make_check(
+                    "cpu_mb_socket",
+                    CheckStatus.PASS,
+                    f"{cpu_socket} 소켓으로 완벽 호환",
+                    {"cpu_socket": cpu_socket, "mb_socket": mb_socket},
                 )
             else:
-                return CompatibilityCheck(
-                    check_id="cpu_mb_socket",
-                    name="CPU-메인보드 소켓 호환성",
-                    components=["cpu", "motherboard"],
-                    status=CheckStatus.FAIL,
-                    message=f"소켓 불일치: CPU({cpu_socket}) vs 메인보드({mb_socket})",
-                    details={"cpu_socket": cpu_socket, "mb_socket": mb_socket},
+                return _make_check(
+                    "cpu_mb_socket",
+                    CheckStatus.FAIL,
+                    f"소켓 불일치: CPU({cpu_socket}) vs 메인보드({mb_socket})",
+                    {"cpu_socket": cpu_socket, "mb_socket": mb_socket},
                 )
         
         # 소켓 정보 없으면 이름으로 추론
@@ -474,41 +692,35 @@ class CompatibilityEngine:
         motherboard: Dict[str, Any],
     ) -> CompatibilityCheck:
         """CPU-메인보드 호환성 추론 (이름 기반)"""
-        cpu_name = cpu.get("name", "").lower()
-        mb_name = motherboard.get("name", "").lower()
+        cpu_name = _normalized_name(cpu.get("name", ""))
+        mb_name = _normalized_name(motherboard.get("name", ""))
         
         # Intel 14세대 + Z790/B760
-        if ("14600" in cpu_name or "14700" in cpu_name or "14900" in cpu_name):
-            if "z790" in mb_name or "b760" in mb_name or "h770" in mb_name:
-                return CompatibilityCheck(
-                    check_id="cpu_mb_socket",
-                    name="CPU-메인보드 소켓 호환성",
-                    components=["cpu", "motherboard"],
-                    status=CheckStatus.PASS,
-                    message="Intel 14세대 CPU와 700시리즈 메인보드 호환",
-                    details={"inferred": True},
+        if INTEL_14TH_GEN_PATTERN.search(cpu_name):
+            if INTEL_700_SERIES_MB_PATTERN.search(mb_name):
+                return _make_check(
+                    "cpu_mb_socket",
+                    CheckStatus.PASS,
+                    "Intel 14세대 CPU와 700시리즈 메인보드 호환",
+                    {"inferred": True},
                 )
         
         # AMD Ryzen 7000 + X670/B650
-        if ("7800" in cpu_name or "7900" in cpu_name or "7600" in cpu_name):
-            if "x670" in mb_name or "b650" in mb_name:
-                return CompatibilityCheck(
-                    check_id="cpu_mb_socket",
-                    name="CPU-메인보드 소켓 호환성",
-                    components=["cpu", "motherboard"],
-                    status=CheckStatus.PASS,
-                    message="AMD Ryzen 7000 시리즈와 600시리즈 메인보드 호환",
-                    details={"inferred": True},
+        if RYZEN_7000_PATTERN.search(cpu_name):
+            if AMD_600_SERIES_MB_PATTERN.search(mb_name):
+                return _make_check(
+                    "cpu_mb_socket",
+                    CheckStatus.PASS,
+                    "AMD Ryzen 7000 시리즈와 600시리즈 메인보드 호환",
+                    {"inferred": True},
                 )
         
         # 확인 불가
-        return CompatibilityCheck(
-            check_id="cpu_mb_socket",
-            name="CPU-메인보드 소켓 호환성",
-            components=["cpu", "motherboard"],
-            status=CheckStatus.UNKNOWN,
-            message="소켓 정보가 부족하여 호환성을 확인할 수 없습니다",
-            details={"inferred": True},
+        return _make_check(
+            "cpu_mb_socket",
+            CheckStatus.UNKNOWN,
+            "소켓 정보가 부족하여 호환성을 확인할 수 없습니다",
+            {"inferred": True},
         )
     
     def _check_memory_motherboard(
@@ -526,32 +738,26 @@ class CompatibilityEngine:
         # DDR 세대 확인
         if mem_type and mb_mem_type:
             if mem_type.upper() == mb_mem_type.upper():
-                return CompatibilityCheck(
-                    check_id="mem_mb_type",
-                    name="메모리-메인보드 호환성",
-                    components=["memory", "motherboard"],
-                    status=CheckStatus.PASS,
-                    message=f"{mem_type} 메모리 호환",
-                    details={"memory_type": mem_type},
+                return _make_check(
+                    "mem_mb_type",
+                    CheckStatus.PASS,
+                    f"{mem_type} 메모리 호환",
+                    {"memory_type": mem_type},
                 )
             else:
-                return CompatibilityCheck(
-                    check_id="mem_mb_type",
-                    name="메모리-메인보드 호환성",
-                    components=["memory", "motherboard"],
-                    status=CheckStatus.FAIL,
-                    message=f"메모리 타입 불일치: {mem_type} vs {mb_mem_type}",
-                    details={"memory_type": mem_type, "mb_type": mb_mem_type},
+                return _make_check(
+                    "mem_mb_type",
+                    CheckStatus.FAIL,
+                    f"메모리 타입 불일치: {mem_type} vs {mb_mem_type}",
+                    {"memory_type": mem_type, "mb_type": mb_mem_type},
                 )
         
         # 정보 부족 시 경고
-        return CompatibilityCheck(
-            check_id="mem_mb_type",
-            name="메모리-메인보드 호환성",
-            components=["memory", "motherboard"],
-            status=CheckStatus.WARNING,
-            message="메모리 타입 정보를 확인해주세요",
-            details={},
+        return _make_check(
+            "mem_mb_type",
+            CheckStatus.WARNING,
+            "메모리 타입 정보를 확인해주세요",
+            {},
         )
     
     def _check_gpu_case(
@@ -568,31 +774,25 @@ class CompatibilityEngine:
         
         if gpu_length and case_max_gpu:
             if gpu_length <= case_max_gpu:
-                return CompatibilityCheck(
-                    check_id="gpu_case_length",
-                    name="GPU-케이스 길이 호환성",
-                    components=["gpu", "case"],
-                    status=CheckStatus.PASS,
-                    message=f"GPU 길이 {gpu_length}mm, 케이스 허용 {case_max_gpu}mm",
-                    details={"gpu_length": gpu_length, "case_max": case_max_gpu},
+                return _make_check(
+                    "gpu_case_length",
+                    CheckStatus.PASS,
+                    f"GPU 길이 {gpu_length}mm, 케이스 허용 {case_max_gpu}mm",
+                    {"gpu_length": gpu_length, "case_max": case_max_gpu},
                 )
             else:
-                return CompatibilityCheck(
-                    check_id="gpu_case_length",
-                    name="GPU-케이스 길이 호환성",
-                    components=["gpu", "case"],
-                    status=CheckStatus.FAIL,
-                    message=f"GPU가 너무 깁니다: {gpu_length}mm > {case_max_gpu}mm",
-                    details={"gpu_length": gpu_length, "case_max": case_max_gpu},
+                return _make_check(
+                    "gpu_case_length",
+                    CheckStatus.FAIL,
+                    f"GPU가 너무 깁니다: {gpu_length}mm > {case_max_gpu}mm",
+                    {"gpu_length": gpu_length, "case_max": case_max_gpu},
                 )
         
-        return CompatibilityCheck(
-            check_id="gpu_case_length",
-            name="GPU-케이스 길이 호환성",
-            components=["gpu", "case"],
-            status=CheckStatus.WARNING,
-            message="GPU/케이스 치수 정보를 확인해주세요",
-            details={},
+        return _make_check(
+            "gpu_case_length",
+            CheckStatus.WARNING,
+            "GPU/케이스 치수 정보를 확인해주세요",
+            {},
         )
     
     def _check_motherboard_case(
@@ -610,33 +810,27 @@ class CompatibilityEngine:
         # 케이스 폼팩터가 지정되어 있으면 해당 폼팩터 확인
         case_form = case_specs.get("form_factor", "")
         if case_form:
-            compatible_forms = FORM_FACTOR_COMPATIBILITY.get(case_form, [])
+            compatible_forms = FORM_FACTOR_COMPATIBILITY.get(case_form, frozenset())
             if mb_form in compatible_forms:
-                return CompatibilityCheck(
-                    check_id="mb_case_form",
-                    name="메인보드-케이스 폼팩터",
-                    components=["motherboard", "case"],
-                    status=CheckStatus.PASS,
-                    message=f"{mb_form} 메인보드가 {case_form} 케이스에 장착 가능",
-                    details={"mb_form": mb_form, "case_form": case_form},
+                return _make_check(
+                    "mb_case_form",
+                    CheckStatus.PASS,
+                    f"{mb_form} 메인보드가 {case_form} 케이스에 장착 가능",
+                    {"mb_form": mb_form, "case_form": case_form},
                 )
             elif mb_form:
-                return CompatibilityCheck(
-                    check_id="mb_case_form",
-                    name="메인보드-케이스 폼팩터",
-                    components=["motherboard", "case"],
-                    status=CheckStatus.FAIL,
-                    message=f"{mb_form} 메인보드는 {case_form} 케이스에 맞지 않습니다",
-                    details={"mb_form": mb_form, "case_form": case_form},
+                return _make_check(
+                    "mb_case_form",
+                    CheckStatus.FAIL,
+                    f"{mb_form} 메인보드는 {case_form} 케이스에 맞지 않습니다",
+                    {"mb_form": mb_form, "case_form": case_form},
                 )
         
-        return CompatibilityCheck(
-            check_id="mb_case_form",
-            name="메인보드-케이스 폼팩터",
-            components=["motherboard", "case"],
-            status=CheckStatus.WARNING,
-            message="폼팩터 정보를 확인해주세요",
-            details={},
+        return _make_check(
+            "mb_case_form",
+            CheckStatus.WARNING,
+            "폼팩터 정보를 확인해주세요",
+            {},
         )
 
     def _check_cpu_cooler_case(
@@ -653,31 +847,25 @@ class CompatibilityEngine:
         
         if cooler_height and case_max_height:
             if cooler_height <= case_max_height:
-                return CompatibilityCheck(
-                    check_id="cooler_case_height",
-                    name="CPU 쿨러-케이스 높이 호환성",
-                    components=["cpu_cooler", "case"],
-                    status=CheckStatus.PASS,
-                    message=f"쿨러 높이 {cooler_height}mm, 케이스 허용 {case_max_height}mm",
-                    details={"cooler_height": cooler_height, "case_max": case_max_height},
+                return _make_check(
+                    "cooler_case_height",
+                    CheckStatus.PASS,
+                    f"쿨러 높이 {cooler_height}mm, 케이스 허용 {case_max_height}mm",
+                    {"cooler_height": cooler_height, "case_max": case_max_height},
                 )
             else:
-                return CompatibilityCheck(
-                    check_id="cooler_case_height",
-                    name="CPU 쿨러-케이스 높이 호환성",
-                    components=["cpu_cooler", "case"],
-                    status=CheckStatus.FAIL,
-                    message=f"CPU 쿨러가 너무 높습니다: {cooler_height}mm > {case_max_height}mm",
-                    details={"cooler_height": cooler_height, "case_max": case_max_height},
+                return _make_check(
+                    "cooler_case_height",
+                    CheckStatus.FAIL,
+                    f"CPU 쿨러가 너무 높습니다: {cooler_height}mm > {case_max_height}mm",
+                    {"cooler_height": cooler_height, "case_max": case_max_height},
                 )
         
-        return CompatibilityCheck(
-            check_id="cooler_case_height",
-            name="CPU 쿨러-케이스 높이 호환성",
-            components=["cpu_cooler", "case"],
-            status=CheckStatus.WARNING,
-            message="CPU 쿨러/케이스 높이 정보를 확인해주세요",
-            details={},
+        return _make_check(
+            "cooler_case_height",
+            CheckStatus.WARNING,
+            "CPU 쿨러/케이스 높이 정보를 확인해주세요",
+            {},
         )
 
     def _check_storage_motherboard(
@@ -690,16 +878,13 @@ class CompatibilityEngine:
         m2_slots_available = mb_specs.get("m2_slots", 0)
         sata_slots_available = mb_specs.get("sata_slots", 0)
         
-        m2_needed = 0
-        sata_needed = 0
-        
-        for storage in storage_list:
-            storage_specs = storage.get("specs", {})
-            interface = storage_specs.get("interface", "").upper()
-            if "M.2" in interface:
-                m2_needed += 1
-            elif "SATA" in interface:
-                sata_needed += 1
+        # 인터페이스 문자열별 분류는 캐시하고, 장치 수는 한 번의 순회로 집계
+        kinds = Counter(
+            _interface_kind(storage.get("specs", {}).get("interface", ""))
+            for storage in storage_list
+        )
+        m2_needed = kinds["m2"]
+        sata_needed = kinds["sata"]
         
         m2_ok = m2_needed <= m2_slots_available
         sata_ok = sata_needed <= sata_slots_available
@@ -712,13 +897,11 @@ class CompatibilityEngine:
         }
         
         if m2_ok and sata_ok:
-            return CompatibilityCheck(
-                check_id="storage_mb_slots",
-                name="저장장치-메인보드 슬롯 호환성",
-                components=["storage", "motherboard"],
-                status=CheckStatus.PASS,
-                message="모든 저장장치가 메인보드에 연결 가능합니다.",
-                details=details,
+            return _make_check(
+                "storage_mb_slots",
+                CheckStatus.PASS,
+                "모든 저장장치가 메인보드에 연결 가능합니다.",
+                details,
             )
         else:
             messages = []
@@ -727,13 +910,11 @@ class CompatibilityEngine:
             if not sata_ok:
                 messages.append(f"SATA 슬롯 부족 (필요: {sata_needed}, 사용 가능: {sata_slots_available})")
                 
-            return CompatibilityCheck(
-                check_id="storage_mb_slots",
-                name="저장장치-메인보드 슬롯 호환성",
-                components=["storage", "motherboard"],
-                status=CheckStatus.FAIL,
-                message="; ".join(messages),
-                details=details,
+            return _make_check(
+                "storage_mb_slots",
+                CheckStatus.FAIL,
+                "; ".join(messages),
+                details,
             )
     
     def _calculate_power(
@@ -750,37 +931,21 @@ class CompatibilityEngine:
             if not cpu_tdp:
                 # 이름으로 추정
                 cpu_name = by_category["cpu"].get("name", "")
-                if "14900" in cpu_name or "14700" in cpu_name:
-                    cpu_tdp = 125
-                elif "14600" in cpu_name:
-                    cpu_tdp = 125
-                elif "13600" in cpu_name or "12600" in cpu_name:
-                    cpu_tdp = 125
-                else:
-                    cpu_tdp = 65  # 기본값
+                cpu_tdp = 125 if CPU_125W_PATTERN.search(cpu_name) else 65  # 기본값 65W
             total_tdp += cpu_tdp
         
         # GPU TDP
         if "gpu" in by_category:
             gpu_tdp = by_category["gpu"].get("specs", {}).get("tdp", 0)
             if not gpu_tdp:
-                gpu_name = by_category["gpu"].get("name", "")
-                for model, specs in GPU_POWER_REQUIREMENTS.items():
-                    if model.lower() in gpu_name.lower():
-                        gpu_tdp = specs["tdp"]
-                        break
-                if not gpu_tdp:
-                    gpu_tdp = 200  # 기본값
+                gpu_tdp = _gpu_tdp_from_name(by_category["gpu"].get("name", ""))
             total_tdp += gpu_tdp
         
         # 기타 부품 (대략적 추정)
         other_tdp = 100  # 메모리, 스토리지, 팬 등
         total_tdp += other_tdp
         
-        # 권장 PSU: TDP의 1.3~1.5배
-        recommended_psu = int(total_tdp * 1.4)
-        # 50W 단위로 올림
-        recommended_psu = ((recommended_psu + 49) // 50) * 50
+        recommended_psu = recommend_psu_wattage(total_tdp)
         
         # 현재 PSU
         current_psu = None
@@ -790,8 +955,7 @@ class CompatibilityEngine:
             if not current_psu:
                 # 이름에서 추출 시도
                 psu_name = by_category["psu"].get("name", "")
-                import re
-                match = re.search(r"(\d{3,4})W", psu_name)
+                match = PSU_WATTAGE_PATTERN.search(psu_name)
                 if match:
                     current_psu = int(match.group(1))
             
@@ -812,49 +976,41 @@ class CompatibilityEngine:
     ) -> CompatibilityCheck:
         """전력 호환성 검사"""
         if power_summary.current_psu is None:
-            return CompatibilityCheck(
-                check_id="power_check",
-                name="전력 호환성",
-                components=["psu"],
-                status=CheckStatus.WARNING,
-                message="PSU 용량을 확인할 수 없습니다",
-                details={},
+            return _make_check(
+                "power_check",
+                CheckStatus.WARNING,
+                "PSU 용량을 확인할 수 없습니다",
+                {},
             )
         
         if power_summary.current_psu >= power_summary.recommended_psu:
-            return CompatibilityCheck(
-                check_id="power_check",
-                name="전력 호환성",
-                components=["psu"],
-                status=CheckStatus.PASS,
-                message=f"전력 여유 충분: {power_summary.current_psu}W (권장 {power_summary.recommended_psu}W)",
-                details={
+            return _make_check(
+                "power_check",
+                CheckStatus.PASS,
+                f"전력 여유 충분: {power_summary.current_psu}W (권장 {power_summary.recommended_psu}W)",
+                {
                     "current": power_summary.current_psu,
                     "recommended": power_summary.recommended_psu,
                     "tdp": power_summary.total_tdp,
                 },
             )
         elif power_summary.current_psu >= power_summary.total_tdp:
-            return CompatibilityCheck(
-                check_id="power_check",
-                name="전력 호환성",
-                components=["psu"],
-                status=CheckStatus.WARNING,
-                message=f"전력 여유 부족: {power_summary.current_psu}W (권장 {power_summary.recommended_psu}W)",
-                details={
+            return _make_check(
+                "power_check",
+                CheckStatus.WARNING,
+                f"전력 여유 부족: {power_summary.current_psu}W (권장 {power_summary.recommended_psu}W)",
+                {
                     "current": power_summary.current_psu,
                     "recommended": power_summary.recommended_psu,
                     "tdp": power_summary.total_tdp,
                 },
             )
         else:
-            return CompatibilityCheck(
-                check_id="power_check",
-                name="전력 호환성",
-                components=["psu"],
-                status=CheckStatus.FAIL,
-                message=f"전력 부족: {power_summary.current_psu}W < TDP {power_summary.total_tdp}W",
-                details={
+            return _make_check(
+                "power_check",
+                CheckStatus.FAIL,
+                f"전력 부족: {power_summary.current_psu}W < TDP {power_summary.total_tdp}W",
+                {
                     "current": power_summary.current_psu,
                     "recommended": power_summary.recommended_psu,
                     "tdp": power_summary.total_tdp,
@@ -869,8 +1025,10 @@ class CompatibilityEngine:
         if not checks:
             return True, 100
         
-        fail_count = sum(1 for c in checks if c.status == CheckStatus.FAIL)
-        warning_count = sum(1 for c in checks if c.status == CheckStatus.WARNING)
+        # 상태별 개수를 한 번의 순회로 집계
+        status_counts = Counter(c.status for c in checks)
+        fail_count = status_counts[CheckStatus.FAIL]
+        warning_count = status_counts[CheckStatus.WARNING]
         
         # 실패가 있으면 호환 불가
         is_compatible = fail_count == 0
@@ -880,8 +1038,8 @@ class CompatibilityEngine:
         
         # 점수 계산
         total = len(checks)
-        pass_count = sum(1 for c in checks if c.status == CheckStatus.PASS)
-        unknown_count = sum(1 for c in checks if c.status == CheckStatus.UNKNOWN)
+        pass_count = status_counts[CheckStatus.PASS]
+        unknown_count = status_counts[CheckStatus.UNKNOWN]
         
         # PASS: 100점, WARNING: 70점, UNKNOWN: 50점, FAIL: 0점
         score = (pass_count * 100 + warning_count * 70 + unknown_count * 50) / total
@@ -892,39 +1050,58 @@ class CompatibilityEngine:
         self,
         checks: List[CompatibilityCheck],
         power_summary: Optional[PowerSummary],
-    ) -> List[str]:
+    ) -> Tuple[str, ...]:
         """권장 사항 생성"""
         recommendations = []
         
         for check in checks:
             if check.status == CheckStatus.FAIL:
-                if "socket" in check.check_id:
-                    recommendations.append(
-                        "CPU와 메인보드의 소켓이 일치하는지 확인하세요"
-                    )
-                elif "memory" in check.check_id:
-                    recommendations.append(
-                        "메모리 타입(DDR4/DDR5)이 메인보드와 호환되는지 확인하세요"
-                    )
-                elif "form" in check.check_id:
-                    recommendations.append(
-                        "메인보드 폼팩터가 케이스에 맞는지 확인하세요"
-                    )
+                recommendation = FAIL_RECOMMENDATIONS.get(check.check_id)
+                if recommendation:
+                    recommendations.append(recommendation)
             
             elif check.status == CheckStatus.WARNING:
-                if "power" in check.check_id:
+                if check.check_id == "power_check":
                     if power_summary and power_summary.recommended_psu:
                         recommendations.append(
                             f"안정적인 운용을 위해 {power_summary.recommended_psu}W 이상 PSU 권장"
                         )
+            
+            if len(recommendations) == MAX_RECOMMENDATIONS:
+                break
         
-        return recommendations[:5]  # 최대 5개
+        return tuple(recommendations)
+
+
+# ============================================================================
+# 일괄 검사 워커 (ProcessPoolExecutor)
+# ============================================================================
+
+# 워커 프로세스의 엔진 (워커 초기화 시 한 번 생성)
+_batch_worker_engine: Optional[CompatibilityEngine] = None
+
+
+def _init_batch_worker(strict_mode: bool) -> None:
+    """워커 프로세스 초기화: 엔진을 워커당 한 번만 생성"""
+    global _batch_worker_engine
+    _batch_worker_engine = CompatibilityEngine(strict_mode=strict_mode)
+
+
+def _check_in_batch_worker(
+    components: List[Dict[str, Any]],
+    fast_reject: bool,
+) -> CompatibilityResult:
+    """워커 프로세스에서 빌드 하나 검사"""
+    return _batch_worker_engine.check_all(components, fast_reject)
 
 
 # ============================================================================
 # 간편 함수
 # ============================================================================
 
+_default_engine: Optional[CompatibilityEngine] = None
+
+
 def check_compatibility(
     components: List[Dict[str, Any]],
 ) -> CompatibilityResult:
@@ -937,8 +1114,10 @@ def check_compatibility(
     Returns:
         CompatibilityResult: 검사 결과
     """
-    engine = CompatibilityEngine()
-    return engine.check_all(components)
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = CompatibilityEngine()
+    return _default_engine.check_all(components)
 
 
 # ============================================================================
@@ -991,4 +1170,4 @@ if __name__ == "__main__":
     result = engine.check_all(test_components)
     
     print("호환성 검사 결과:")
-    print(json.dumps(result.model_dump(), indent=2, ensure_ascii=False))
+    print(json.dumps(msgspec.to_builtins(result), indent=2, ensure_ascii=False))
@@ -56,11 +56,11 @@ Component (부품)
 - [ ] 추론 엔진 연동
 """
 
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional, Set, FrozenSet
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-import json
+import orjson
 from loguru import logger
 
 
@@ -98,7 +98,7 @@ class PropertyType(str, Enum):
 # 데이터 클래스
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class OntologyProperty:
     """온톨로지 속성"""
     name: str
@@ -108,7 +108,7 @@ class OntologyProperty:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class OntologyClass:
     """온톨로지 클래스"""
     name: ComponentClass
@@ -117,7 +117,7 @@ class OntologyClass:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class OntologyIndividual:
     """온톨로지 개체 (실제 부품)"""
     id: str
@@ -341,6 +341,10 @@ class PCOntology:
         """온톨로지 초기화"""
         self.classes: Dict[ComponentClass, OntologyClass] = {}
         self.individuals: Dict[str, OntologyIndividual] = {}
+        # 클래스별 개체 인덱스 (add_individual에서 갱신): 클래스 -> {ID: 개체}
+        self._individuals_by_class: Dict[ComponentClass, Dict[str, OntologyIndividual]] = {}
+        # 개체 ID -> 최초 추가 순서 (여러 클래스 결과를 self.individuals 순서로 합칠 때 사용)
+        self._insertion_order: Dict[str, int] = {}
         self.compatibility_rules: List[Dict[str, Any]] = []
         
         # 클래스 초기화
@@ -375,7 +379,19 @@ class PCOntology:
             class_type=class_type,
             properties=properties,
         )
+        previous = self.individuals.get(id)
+        if previous is None:
+            self._insertion_order[id] = len(self._insertion_order)
         self.individuals[id] = individual
+        
+        bucket = self._individuals_by_class.setdefault(class_type, {})
+        bucket[id] = individual
+        if previous is not None and previous.class_type != class_type:
+            # 다른 클래스로 재등록: 기존 인덱스에서 빼고, 새 인덱스는 최초 추가 순서로 재정렬
+            del self._individuals_by_class[previous.class_type][id]
+            self._individuals_by_class[class_type] = dict(
+                sorted(bucket.items(), key=lambda item: self._insertion_order[item[0]])
+            )
         logger.debug(f"개체 추가: {id} ({class_type.value})")
     
     def get_individual(self, id: str) -> Optional[OntologyIndividual]:
@@ -397,27 +413,28 @@ class PCOntology:
         Returns:
             개체 리스트
         """
-        result = []
-        target_classes = {class_type}
-        
+        target_classes = (class_type,)
         if include_subclasses:
-            target_classes = self._get_subclasses(class_type)
-            target_classes.add(class_type)
+            target_classes = (class_type, *self._get_subclasses(class_type))
         
-        for individual in self.individuals.values():
-            if individual.class_type in target_classes:
-                result.append(individual)
+        # 전체 개체를 훑지 않고 대상 클래스 인덱스만 모음
+        buckets = [
+            self._individuals_by_class[cls]
+            for cls in target_classes
+            if self._individuals_by_class.get(cls)
+        ]
+        if not buckets:
+            return []
+        if len(buckets) == 1:
+            return list(buckets[0].values())
         
+        result = [individual for bucket in buckets for individual in bucket.values()]
+        result.sort(key=lambda individual: self._insertion_order[individual.id])
         return result
     
-    def _get_subclasses(self, class_type: ComponentClass) -> Set[ComponentClass]:
-        """하위 클래스 조회"""
-        subclasses = set()
-        for cls, parent in self.CLASS_HIERARCHY.items():
-            if parent == class_type:
-                subclasses.add(cls)
-                subclasses.update(self._get_subclasses(cls))
-        return subclasses
+    def _get_subclasses(self, class_type: ComponentClass) -> FrozenSet[ComponentClass]:
+        """하위 클래스 조회 (모듈 로드 시 계산한 인덱스)"""
+        return self._SUBCLASS_INDEX[class_type]
     
     def query_compatible(
         self,
@@ -523,15 +540,15 @@ class PCOntology:
             "rules": self.compatibility_rules,
         }
         
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         
         logger.info(f"온톨로지 내보내기: {path}")
     
     def import_from_json(self, path: str):
         """JSON에서 온톨로지 가져오기"""
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
         
         # 개체 로드
         for id, ind_data in data.get("individuals", {}).items():
@@ -547,6 +564,41 @@ class PCOntology:
         logger.info(f"온톨로지 가져오기: {path}, {len(self.individuals)}개 개체")
 
 
+def _build_subclass_index(
+    hierarchy: Dict[ComponentClass, Optional[ComponentClass]],
+) -> Dict[ComponentClass, FrozenSet[ComponentClass]]:
+    """
+    클래스 계층(자식 -> 부모)을 뒤집어 클래스별 전체 하위 클래스 집합 계산
+    
+    재귀 없이 방문 집합으로 순회하며, 계층에 순환이 있으면(자기 자신이 하위 클래스로 도달)
+    ValueError 발생.
+    """
+    children: Dict[ComponentClass, List[ComponentClass]] = {cls: [] for cls in hierarchy}
+    for cls, parent in hierarchy.items():
+        if parent is not None:
+            if parent not in children:
+                raise ValueError(f"클래스 계층에 정의되지 않은 부모 클래스: {cls} -> {parent}")
+            children[parent].append(cls)
+    
+    index = {}
+    for cls in hierarchy:
+        subclasses: Set[ComponentClass] = set()
+        queue = list(children[cls])
+        while queue:
+            child = queue.pop()
+            if child == cls:
+                raise ValueError(f"클래스 계층에 순환이 있습니다: {cls}")
+            if child not in subclasses:
+                subclasses.add(child)
+                queue.extend(children[child])
+        index[cls] = frozenset(subclasses)
+    return index
+
+
+# 클래스 계층은 상수이므로 하위 클래스 집합을 한 번만 계산
+PCOntology._SUBCLASS_INDEX = _build_subclass_index(PCOntology.CLASS_HIERARCHY)
+
+
 # ============================================================================
 # 테스트용 메인
 # ============================================================================
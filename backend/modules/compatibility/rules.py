@@ -35,9 +35,12 @@ PC 부품 간 호환성을 규칙 기반으로 검사하는 엔진.
 - [ ] BIOS 버전 호환성 체크
 """
 
-from typing import Dict, Any, List, Optional, Callable
+import re
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+import numpy as np
 from loguru import logger
 
 
@@ -66,7 +69,7 @@ class RuleCategory(str, Enum):
 # 데이터 클래스
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RuleResult:
     """규칙 검사 결과"""
     rule_id: str
@@ -76,7 +79,7 @@ class RuleResult:
     details: Dict[str, Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CompatibilityRule:
     """호환성 규칙"""
     id: str
@@ -92,6 +95,43 @@ class CompatibilityRule:
 # 규칙 정의 함수들
 # ============================================================================
 
+# 이름 기반 소켓/메모리 타입 추론 (소문자 이름 대상): (패턴, 결과)를 순서대로 검사해 처음 일치한 값 사용
+# CPU: 13/14세대 Intel은 "13"/"14"와 "600"/"700"/"900"이 이름 어딘가에 함께 있으면 LGA1700
+CPU_SOCKET_PATTERNS = (
+    (re.compile(r"\A(?=.*1[34])(?=.*[679]00)", re.DOTALL), "LGA1700"),
+    (re.compile(r"7[689]00"), "AM5"),
+    (re.compile(r"5[689]00"), "AM4"),
+)
+MB_SOCKET_PATTERNS = (
+    (re.compile(r"z790|b760|z690"), "LGA1700"),
+    (re.compile(r"x670|b650"), "AM5"),
+    (re.compile(r"x570|b550"), "AM4"),
+)
+MEMORY_TYPE_PATTERNS = (
+    (re.compile(r"ddr5"), "DDR5"),
+    (re.compile(r"ddr4"), "DDR4"),
+)
+MB_MEMORY_TYPE_PATTERNS = (
+    (re.compile(r"ddr5|z790|x670|b650"), "DDR5"),
+    (re.compile(r"ddr4"), "DDR4"),
+)
+
+
+@lru_cache(maxsize=1024)
+def _infer_from_name(name: str, patterns: Tuple[Tuple[re.Pattern, str], ...]) -> str:
+    """
+    이름에서 패턴 순서대로 처음 일치한 값 반환 (없으면 빈 문자열)
+    
+    check_all에서 같은 부품이 여러 쌍에 등장하므로 (이름, 패턴 표)별로 결과를 캐시해
+    소문자 변환과 패턴 검사를 부품 이름당 한 번만 수행.
+    """
+    name = name.lower()
+    for pattern, value in patterns:
+        if pattern.search(name):
+            return value
+    return ""
+
+
 def check_cpu_mb_socket(cpu: Dict[str, Any], mb: Dict[str, Any]) -> RuleResult:
     """CPU-메인보드 소켓 호환성 검사"""
     cpu_socket = cpu.get("specs", {}).get("socket", "")
@@ -99,24 +139,10 @@ def check_cpu_mb_socket(cpu: Dict[str, Any], mb: Dict[str, Any]) -> RuleResult:
     
     # 소켓 정보가 없으면 이름에서 추론
     if not cpu_socket:
-        cpu_name = cpu.get("name", "").lower()
-        if "14" in cpu_name and ("600" in cpu_name or "700" in cpu_name or "900" in cpu_name):
-            cpu_socket = "LGA1700"
-        elif "13" in cpu_name and ("600" in cpu_name or "700" in cpu_name or "900" in cpu_name):
-            cpu_socket = "LGA1700"
-        elif "7800" in cpu_name or "7900" in cpu_name or "7600" in cpu_name:
-            cpu_socket = "AM5"
-        elif "5800" in cpu_name or "5900" in cpu_name or "5600" in cpu_name:
-            cpu_socket = "AM4"
+        cpu_socket = _infer_from_name(cpu.get("name", ""), CPU_SOCKET_PATTERNS)
     
     if not mb_socket:
-        mb_name = mb.get("name", "").lower()
-        if "z790" in mb_name or "b760" in mb_name or "z690" in mb_name:
-            mb_socket = "LGA1700"
-        elif "x670" in mb_name or "b650" in mb_name:
-            mb_socket = "AM5"
-        elif "x570" in mb_name or "b550" in mb_name:
-            mb_socket = "AM4"
+        mb_socket = _infer_from_name(mb.get("name", ""), MB_SOCKET_PATTERNS)
     
     if not cpu_socket or not mb_socket:
         return RuleResult(
@@ -155,18 +181,10 @@ def check_memory_mb_type(memory: Dict[str, Any], mb: Dict[str, Any]) -> RuleResu
     
     # 이름에서 추론
     if not mem_type:
-        mem_name = memory.get("name", "").lower()
-        if "ddr5" in mem_name:
-            mem_type = "DDR5"
-        elif "ddr4" in mem_name:
-            mem_type = "DDR4"
+        mem_type = _infer_from_name(memory.get("name", ""), MEMORY_TYPE_PATTERNS)
     
     if not mb_mem_type:
-        mb_name = mb.get("name", "").lower()
-        if "ddr5" in mb_name or "z790" in mb_name or "x670" in mb_name or "b650" in mb_name:
-            mb_mem_type = "DDR5"
-        elif "ddr4" in mb_name:
-            mb_mem_type = "DDR4"
+        mb_mem_type = _infer_from_name(mb.get("name", ""), MB_MEMORY_TYPE_PATTERNS)
     
     if not mem_type or not mb_mem_type:
         return RuleResult(
@@ -198,19 +216,20 @@ def check_memory_mb_type(memory: Dict[str, Any], mb: Dict[str, Any]) -> RuleResu
         )
 
 
+# 폼팩터 호환 매트릭스: 메인보드 폼팩터 -> 장착 가능한 케이스 폼팩터
+MB_CASE_FORM_FACTORS = {
+    "E-ATX": frozenset({"E-ATX"}),
+    "ATX": frozenset({"ATX", "E-ATX"}),
+    "Micro-ATX": frozenset({"Micro-ATX", "ATX", "E-ATX"}),
+    "Mini-ITX": frozenset({"Mini-ITX", "Micro-ATX", "ATX", "E-ATX"}),
+}
+
+
 def check_mb_case_form(mb: Dict[str, Any], case: Dict[str, Any]) -> RuleResult:
     """메인보드-케이스 폼팩터 호환성"""
     mb_form = mb.get("specs", {}).get("form_factor", "")
     case_form = case.get("specs", {}).get("form_factor", "")
     
-    # 폼팩터 호환 매트릭스
-    compatibility = {
-        "E-ATX": ["E-ATX"],
-        "ATX": ["ATX", "E-ATX"],
-        "Micro-ATX": ["Micro-ATX", "ATX", "E-ATX"],
-        "Mini-ITX": ["Mini-ITX", "Micro-ATX", "ATX", "E-ATX"],
-    }
-    
     if not mb_form or not case_form:
         return RuleResult(
             rule_id="mb_case_form",
@@ -220,7 +239,7 @@ def check_mb_case_form(mb: Dict[str, Any], case: Dict[str, Any]) -> RuleResult:
             details={},
         )
     
-    compatible_cases = compatibility.get(mb_form, [])
+    compatible_cases = MB_CASE_FORM_FACTORS.get(mb_form, frozenset())
     
     if case_form in compatible_cases:
         return RuleResult(
@@ -305,14 +324,19 @@ def check_cooler_case_height(cooler: Dict[str, Any], case: Dict[str, Any]) -> Ru
         )
 
 
+# PCIe 버전 표기 (예: "PCIe 4.0 x16"), 소수점 없는 정수형 버전 (예: "PCIe 5")
+PCIE_DECIMAL_VERSION_PATTERN = re.compile(r'(\d+\.\d+)')
+PCIE_INTEGER_VERSION_PATTERN = re.compile(r'(\d+)')
+
+
 def get_pcie_version_from_string(s: str) -> Optional[float]:
     """문자열에서 PCIe 버전(예: 4.0)을 추출합니다."""
     if not isinstance(s, str):
         return None
-    match = re.search(r'(\d+\.\d+)', s)
+    match = PCIE_DECIMAL_VERSION_PATTERN.search(s)
     if match:
         return float(match.group(1))
-    match = re.search(r'(\d+)', s) # "5" 같은 정수형 버전도 고려
+    match = PCIE_INTEGER_VERSION_PATTERN.search(s) # "5" 같은 정수형 버전도 고려
     if match:
         return float(match.group(1))
     return None
@@ -426,6 +450,195 @@ def check_storage_mb_interface(storage: Dict[str, Any], mb: Dict[str, Any]) -> R
     )
 
 
+# ============================================================================
+# 배치 규칙 평가용 열 배열 색인 (대량 부품 목록)
+# ============================================================================
+
+@dataclass(slots=True)
+class RuleIndex:
+    """
+    부품 목록을 스펙 필드별 배열(SoA)로 변환한 색인 (CompatibilityRules.build_index 결과)
+
+    문자열 열의 빈 문자열과 숫자 열의 NaN은 정보 없음(규칙에서 falsy)을 뜻한다.
+    irregular는 스펙 값 타입이 예상과 달라 배열 커널로 판정하지 않고 항상 원래 규칙 함수로
+    검사할 부품 표시.
+    """
+    components: List[Dict[str, Any]]
+    categories: np.ndarray
+    sockets: np.ndarray            # CPU/메인보드 소켓 (이름 추론 포함)
+    memory_types: np.ndarray       # 메모리/메인보드 메모리 타입 (이름 추론 포함, 대문자)
+    form_factors: np.ndarray       # 메인보드/케이스 폼팩터
+    storage_kinds: np.ndarray      # 저장장치 인터페이스: "m2", "sata", 그 외 ""
+    gpu_length: np.ndarray
+    cooler_height: np.ndarray
+    case_max_gpu_length: np.ndarray
+    case_max_cooler_height: np.ndarray
+    m2_slots: np.ndarray
+    sata_slots: np.ndarray
+    irregular: np.ndarray
+
+
+def build_rule_index(components: List[Dict[str, Any]]) -> RuleIndex:
+    """부품 목록을 한 번 순회해 RuleIndex 생성 (규칙 함수와 같은 스펙 키/이름 추론 사용)"""
+    n = len(components)
+    categories = [""] * n
+    sockets = [""] * n
+    memory_types = [""] * n
+    form_factors = [""] * n
+    storage_kinds = [""] * n
+    numbers = {key: np.full(n, np.nan) for key in (
+        "gpu_length", "cooler_height", "case_max_gpu_length",
+        "case_max_cooler_height", "m2_slots", "sata_slots",
+    )}
+    irregular = np.zeros(n, dtype=bool)
+
+    def text(i: int, value: Any) -> str:
+        if isinstance(value, str):
+            return value
+        if value:
+            irregular[i] = True
+        return ""
+
+    def number(i: int, key: str, value: Any) -> None:
+        if isinstance(value, (int, float)) and value == value:
+            if value:
+                numbers[key][i] = value
+        elif value:
+            irregular[i] = True  # 숫자가 아닌 값, NaN
+
+    def inferred(i: int, component: Dict[str, Any], patterns) -> str:
+        name = component.get("name", "")
+        if not isinstance(name, str):
+            irregular[i] = True
+            return ""
+        return _infer_from_name(name, patterns)
+
+    for i, component in enumerate(components):
+        category = component.get("category", "unknown")
+        categories[i] = category if isinstance(category, str) else ""
+        specs = component.get("specs", {})
+
+        if category == "cpu":
+            sockets[i] = text(i, specs.get("socket", "")) or inferred(i, component, CPU_SOCKET_PATTERNS)
+        elif category == "motherboard":
+            sockets[i] = text(i, specs.get("socket", "")) or inferred(i, component, MB_SOCKET_PATTERNS)
+            memory_types[i] = (
+                text(i, specs.get("memory_type", "")) or inferred(i, component, MB_MEMORY_TYPE_PATTERNS)
+            ).upper()
+            form_factors[i] = text(i, specs.get("form_factor", ""))
+            number(i, "m2_slots", specs.get("m2_slots", 0))
+            number(i, "sata_slots", specs.get("sata_slots", 0))
+        elif category == "memory":
+            memory_types[i] = (
+                text(i, specs.get("generation", "")) or text(i, specs.get("type", ""))
+                or inferred(i, component, MEMORY_TYPE_PATTERNS)
+            ).upper()
+        elif category == "case":
+            form_factors[i] = text(i, specs.get("form_factor", ""))
+            number(i, "case_max_gpu_length", specs.get("max_gpu_length", 0))
+            number(i, "case_max_cooler_height", specs.get("max_cooler_height", 0))
+        elif category == "gpu":
+            number(i, "gpu_length", specs.get("length", 0))
+        elif category == "cpu_cooler":
+            number(i, "cooler_height", specs.get("height", 0))
+        elif category == "storage":
+            interface = specs.get("interface", "")
+            if not isinstance(interface, str):
+                irregular[i] = True
+            else:
+                interface = interface.upper()
+                storage_kinds[i] = "m2" if "M.2" in interface else "sata" if "SATA" in interface else ""
+
+    return RuleIndex(
+        components=components,
+        categories=np.array(categories, dtype=str),
+        sockets=np.array(sockets, dtype=str),
+        memory_types=np.array(memory_types, dtype=str),
+        form_factors=np.array(form_factors, dtype=str),
+        storage_kinds=np.array(storage_kinds, dtype=str),
+        irregular=irregular,
+        **numbers,
+    )
+
+
+# 규칙 함수별 배열 커널: (색인, applies_to[0] 부품 인덱스, applies_to[1] 부품 인덱스)
+# -> 규칙이 실패할 수 있는 쌍의 위치 (rows, cols). 후보 쌍만 원래 규칙 함수로 다시 검사해 결과를 만든다.
+PairKernel = Callable[[RuleIndex, np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]
+
+
+def _mask_kernel(mask_fn: Callable[[RuleIndex, np.ndarray, np.ndarray], np.ndarray]) -> PairKernel:
+    """두 인덱스 배열을 [:, None] / [None, :]로 브로드캐스팅한 bool 행렬 커널을 쌍 위치 커널로 변환"""
+    def kernel(index: RuleIndex, first: np.ndarray, second: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return np.nonzero(mask_fn(index, first[:, None], second[None, :]))
+    return kernel
+
+
+def _mismatch_kernel(column: str) -> PairKernel:
+    """두 부품의 문자열 값이 모두 있고 서로 다르면 실패 (소켓, 메모리 타입)"""
+    def mask(index: RuleIndex, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        values = getattr(index, column)
+        first, second = values[a], values[b]
+        return (first != "") & (second != "") & (first != second)
+    return _mask_kernel(mask)
+
+
+def _exceeds_kernel(size: str, limit: str) -> PairKernel:
+    """
+    부품 치수가 케이스 허용치를 넘으면 실패 (치수/허용치 정보가 없으면 통과)
+
+    전체 쌍을 비교하지 않고 허용치를 한 번 정렬한 뒤 np.searchsorted로 부품마다
+    허용치가 더 작은 구간(정렬 앞쪽)만 꺼내므로 비용은 O((n + m) log m + 실패 쌍 수).
+    """
+    def kernel(index: RuleIndex, first: np.ndarray, second: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        sizes = getattr(index, size)[first]
+        limits = getattr(index, limit)[second]
+        
+        known = np.flatnonzero(~np.isnan(limits))
+        order = known[np.argsort(limits[known], kind="stable")]
+        counts = np.searchsorted(limits[order], sizes, side="left")  # 치수보다 작은 허용치 개수
+        counts[np.isnan(sizes)] = 0
+        
+        rows = np.repeat(np.arange(len(first)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        return rows, order[offsets]
+    return kernel
+
+
+def _form_factor_mask(index: RuleIndex, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """메인보드/케이스 폼팩터가 모두 있고 MB_CASE_FORM_FACTORS에 없는 조합이면 실패"""
+    mb_form, case_form = index.form_factors[a], index.form_factors[b]
+    fits = np.zeros(np.broadcast(mb_form, case_form).shape, dtype=bool)
+    for form, case_forms in MB_CASE_FORM_FACTORS.items():
+        fits |= (mb_form == form) & np.isin(case_form, list(case_forms))
+    return (mb_form != "") & (case_form != "") & ~fits
+
+
+def _storage_mask(index: RuleIndex, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """M.2/SATA 저장장치인데 메인보드에 해당 슬롯이 없으면 실패"""
+    kind = index.storage_kinds[a]
+    return (
+        ((kind == "m2") & ~(index.m2_slots[b] > 0))
+        | ((kind == "sata") & ~(index.sata_slots[b] > 0))
+    )
+
+
+def _never_fails_kernel(index: RuleIndex, first: np.ndarray, second: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """항상 passed=True인 규칙 (PCIe 버전은 경고만 발생)"""
+    empty = np.zeros(0, dtype=np.intp)
+    return empty, empty
+
+
+RULE_KERNELS: Dict[Callable, PairKernel] = {
+    check_cpu_mb_socket: _mismatch_kernel("sockets"),
+    check_memory_mb_type: _mismatch_kernel("memory_types"),
+    check_mb_case_form: _mask_kernel(_form_factor_mask),
+    check_gpu_case_length: _exceeds_kernel("gpu_length", "case_max_gpu_length"),
+    check_cooler_case_height: _exceeds_kernel("cooler_height", "case_max_cooler_height"),
+    check_gpu_mb_pcie: _never_fails_kernel,
+    check_storage_mb_interface: _mask_kernel(_storage_mask),
+}
+
+
 # ============================================================================
 # 규칙 엔진
 # ============================================================================
@@ -451,9 +664,11 @@ class CompatibilityRules:
     def __init__(self):
         """규칙 엔진 초기화"""
         self.rules: List[CompatibilityRule] = []
+        # (카테고리1, 카테고리2) -> 적용 규칙 (등록 시 양방향 순서 모두 색인)
+        self._rules_by_pair: Dict[Tuple[str, str], List[CompatibilityRule]] = {}
         self._register_default_rules()
         
-        logger.info(f"CompatibilityRules 초기화: {len(self.rules)}개 규칙")
+        logger.info("CompatibilityRules 초기화: {}개 규칙", len(self.rules))
     
     def _register_default_rules(self):
         """기본 규칙 등록"""
@@ -537,7 +752,14 @@ class CompatibilityRules:
     def register_rule(self, rule: CompatibilityRule):
         """규칙 등록"""
         self.rules.append(rule)
-        logger.debug(f"규칙 등록: {rule.id}")
+        
+        # 순서에 관계없이 매칭: 카테고리 집합이 같은 모든 순서쌍에 색인
+        categories = set(rule.applies_to)
+        for category1 in categories:
+            for category2 in categories:
+                if {category1, category2} == categories:
+                    self._rules_by_pair.setdefault((category1, category2), []).append(rule)
+        logger.debug("규칙 등록: {}", rule.id)
     
     def get_applicable_rules(
         self,
@@ -554,15 +776,7 @@ class CompatibilityRules:
         Returns:
             적용 가능한 규칙 리스트
         """
-        applicable = []
-        
-        for rule in self.rules:
-            # 순서에 관계없이 매칭
-            if (set(rule.applies_to) == {category1, category2} or
-                set(rule.applies_to) == {category2, category1}):
-                applicable.append(rule)
-        
-        return applicable
+        return list(self._rules_by_pair.get((category1, category2), ()))
     
     def check_pair(
         self,
@@ -582,10 +796,10 @@ class CompatibilityRules:
         cat1 = component1.get("category", "unknown")
         cat2 = component2.get("category", "unknown")
         
-        applicable_rules = self.get_applicable_rules(cat1, cat2)
         results = []
         
-        for rule in applicable_rules:
+        # 색인된 규칙 목록을 복사 없이 순회
+        for rule in self._rules_by_pair.get((cat1, cat2), ()):
             # 규칙의 applies_to 순서에 맞게 인자 전달
             if rule.applies_to[0] == cat1:
                 result = rule.check_function(component1, component2)
@@ -611,13 +825,97 @@ class CompatibilityRules:
         """
         all_results = []
         
-        # 모든 쌍에 대해 검사
-        for i, comp1 in enumerate(components):
-            for comp2 in components[i+1:]:
-                results = self.check_pair(comp1, comp2)
-                all_results.extend(results)
+        # 카테고리별 부품 인덱스
+        by_category: Dict[str, List[int]] = {}
+        for i, component in enumerate(components):
+            by_category.setdefault(component.get("category", "unknown"), []).append(i)
+        
+        # 적용 규칙이 있는 카테고리 쌍의 부품 쌍만 모음 (색인에 양방향 순서가 모두 있으므로 i < j만 취함)
+        pairs = []
+        for category1, category2 in self._rules_by_pair:
+            for i in by_category.get(category1, ()):
+                for j in by_category.get(category2, ()):
+                    if i < j:
+                        pairs.append((i, j))
+        
+        # 전체 쌍을 순서대로 검사할 때와 같은 결과 순서 유지
+        pairs.sort()
+        for i, j in pairs:
+            all_results.extend(self.check_pair(components[i], components[j]))
         
         return all_results
+    
+    def build_index(self, components: List[Dict[str, Any]]) -> RuleIndex:
+        """대량 부품 목록을 find_failures용 열 배열 색인으로 변환"""
+        return build_rule_index(components)
+    
+    def find_failures(self, index: RuleIndex) -> List[RuleResult]:
+        """
+        실패한 규칙 결과만 배치 평가
+        
+        check_all(index.components) 중 passed=False인 결과와 같은 결과를 같은 순서로 반환한다.
+        규칙마다 배열 커널(RULE_KERNELS)로 실패 가능한 부품 쌍만 골라 원래 규칙 함수로
+        검사하므로, 대부분의 쌍이 통과하는 큰 목록에서 쌍별 파이썬 호출을 피한다.
+        커널이 없는 규칙(사용자 등록 규칙)은 모든 쌍을 검사한다.
+        
+        Args:
+            index: build_index 결과
+            
+        Returns:
+            실패한 검사 결과 리스트
+        """
+        components = index.components
+        positions: Dict[str, np.ndarray] = {}
+        
+        def in_category(category: str) -> np.ndarray:
+            if category not in positions:
+                positions[category] = np.flatnonzero(index.categories == category)
+            return positions[category]
+        
+        # (앞 인덱스, 뒤 인덱스, 규칙 등록 순서, applies_to[0] 부품, applies_to[1] 부품)
+        candidates = []
+        for order, rule in enumerate(self.rules):
+            categories = list(dict.fromkeys(rule.applies_to))
+            if len(categories) not in (1, 2):
+                continue
+            first = in_category(categories[0])
+            second = in_category(categories[-1])
+            if not len(first) or not len(second):
+                continue
+            
+            kernel = RULE_KERNELS.get(rule.check_function)
+            if kernel is None:
+                rows, cols = np.nonzero(np.ones((len(first), len(second)), dtype=bool))
+            else:
+                rows, cols = kernel(index, first, second)
+            
+            # 스펙 타입이 예상과 다른 부품이 낀 쌍은 항상 후보 (중복 제거)
+            odd_rows = np.flatnonzero(index.irregular[first])
+            odd_cols = np.flatnonzero(index.irregular[second])
+            if len(odd_rows) or len(odd_cols):
+                m = len(second)
+                keys = np.concatenate([
+                    rows * m + cols,
+                    (odd_rows[:, None] * m + np.arange(m)).ravel(),
+                    (np.arange(len(first))[:, None] * m + odd_cols).ravel(),
+                ])
+                rows, cols = np.divmod(np.unique(keys), m)
+            
+            xs, ys = first[rows], second[cols]
+            if len(categories) == 1:
+                keep = xs < ys  # 같은 카테고리 쌍은 check_all처럼 한 번만
+                xs, ys = xs[keep], ys[keep]
+            
+            for x, y in zip(xs.tolist(), ys.tolist()):
+                candidates.append((min(x, y), max(x, y), order, x, y))
+        
+        candidates.sort()
+        failures = []
+        for _, _, order, x, y in candidates:
+            result = self.rules[order].check_function(components[x], components[y])
+            if not result.passed:
+                failures.append(result)
+        return failures
 
 
 # ============================================================================
@@ -16,15 +16,19 @@ from google.genai import types
 class ImageGenerator:
     """Generation of PC build images using Google GenAI (v2 SDK)"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, client: Optional[genai.Client] = None):
         """
         Initialize GenAI client
         
         Args:
             api_key: Google Cloud API Key
+            client: Shared genai.Client to reuse its connection pool (optional)
         """
         self.api_key = api_key or os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
-        if not self.api_key:
+        if client is not None:
+            self.client = client
+            logger.info("Google GenAI Client shared with the RAG pipeline.")
+        elif not self.api_key:
             logger.warning("GEMINI_API_KEY or GOOGLE_API_KEY not found. Image generation will be disabled.")
             self.client = None
         else:
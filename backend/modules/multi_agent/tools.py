@@ -4,6 +4,7 @@ from pydantic import BaseModel, Field
 from backend.rag.retriever import PCComponentRetriever
 from backend.modules.compatibility.engine import CompatibilityEngine
 import json
+import msgspec
 
 class SearchPartsToolInput(BaseModel):
     """Input schema for SearchPartsTool."""
@@ -75,9 +76,10 @@ class CompatibilityCheckTool(BaseTool):
         try:
             result = self.engine.check_all(components)
             
-            # Serialize the result using Pydantic's model_dump/dict
-            # Check if result is a Pydantic model
-            if hasattr(result, 'model_dump'):
+            # Serialize the result (msgspec.Struct, or Pydantic model_dump/dict)
+            if isinstance(result, msgspec.Struct):
+                result_dict = msgspec.to_builtins(result)
+            elif hasattr(result, 'model_dump'):
                 result_dict = result.model_dump()
             elif hasattr(result, 'dict'):
                 result_dict = result.dict()
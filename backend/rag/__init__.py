@@ -9,6 +9,8 @@ from .vector_store import PCComponentVectorStore
 from .retriever import PCComponentRetriever
 from .generator import PCRecommendationGenerator
 from .pipeline import RAGPipeline
+from .semantic_cache import SemanticResponseCache
+from .session_store import InMemorySessionStore, RedisSessionStore, SessionConflictError, create_session_store
 
 __all__ = [
     "GeminiEmbedder",
@@ -16,5 +18,10 @@ __all__ = [
     "PCComponentRetriever",
     "PCRecommendationGenerator",
     "RAGPipeline",
+    "SemanticResponseCache",
+    "InMemorySessionStore",
+    "RedisSessionStore",
+    "SessionConflictError",
+    "create_session_store",
 ]
 
@@ -38,6 +38,21 @@ TOP_K_RESULTS = int(os.getenv("TOP_K_RESULTS", "5"))
 CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "500"))
 CHUNK_OVERLAP = int(os.getenv("CHUNK_OVERLAP", "50"))
 
+# 쿼리 임베딩 캐시 크기 (동일 쿼리의 임베딩 API 재호출 방지)
+QUERY_EMBEDDING_CACHE_SIZE = int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "4096"))
+
+# 벡터 DB 구축 시 동시에 임베딩할 배치 수 (임베딩 API 호출과 ChromaDB 저장을 겹쳐서 수행)
+INGEST_EMBED_WORKERS = int(os.getenv("INGEST_EMBED_WORKERS", "4"))
+
+# 시맨틱 캐시 설정
+SEMANTIC_CACHE_SIZE = int(os.getenv("SEMANTIC_CACHE_SIZE", "1024"))
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+SEMANTIC_CACHE_TTL = float(os.getenv("SEMANTIC_CACHE_TTL", "3600"))
+
+# Step-by-Step 세션 저장소 설정 (REDIS_URL 미설정 시 인메모리 저장)
+REDIS_URL = os.getenv("REDIS_URL")
+SESSION_TTL = int(os.getenv("SESSION_TTL", "3600"))
+
 # 데이터베이스 경로
 SQL_DUMP_PATH = PROJECT_ROOT / "backend" / "data" / "pc_data_dump.sql"
 
@@ -1,13 +1,15 @@
 """
 Gemini API를 사용한 임베딩 생성기 (New SDK)
 """
-from google import genai
 from google.genai import types
 from typing import List
+from functools import lru_cache
 from loguru import logger
+import numpy as np
 import time
 
-from .config import GEMINI_API_KEY, EMBEDDING_MODEL
+from .config import GEMINI_API_KEY, EMBEDDING_MODEL, QUERY_EMBEDDING_CACHE_SIZE
+from .genai_client import get_genai_client
 
 
 class GeminiEmbedder:
@@ -20,6 +22,7 @@ class GeminiEmbedder:
         task_type: str = "RETRIEVAL_DOCUMENT",
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        query_cache_size: int = QUERY_EMBEDDING_CACHE_SIZE,
     ):
         """
         Args:
@@ -28,6 +31,7 @@ class GeminiEmbedder:
             task_type: 임베딩 작업 유형 (RETRIEVAL_DOCUMENT, RETRIEVAL_QUERY 등)
             max_retries: 재시도 최대 횟수
             retry_delay: 재시도 대기 시간 (초)
+            query_cache_size: 쿼리 임베딩 LRU 캐시 크기 (0이면 캐시 안 함)
         """
         self.api_key = api_key
         self.model = model
@@ -35,8 +39,11 @@ class GeminiEmbedder:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
 
-        # Gemini API 클라이언트 초기화 (google-genai SDK)
-        self.client = genai.Client(api_key=self.api_key)
+        # Gemini API 클라이언트 (google-genai SDK, API 키별 커넥션 풀 공유)
+        self.client = get_genai_client(self.api_key)
+
+        # 쿼리 임베딩 캐시: 같은 쿼리는 API를 다시 호출하지 않음 (float32로 보관하여 메모리 절반)
+        self._cached_query_vector = lru_cache(maxsize=query_cache_size)(self._query_vector)
         logger.info(f"GeminiEmbedder 초기화 완료: model={model} (SDK: google-genai)")
 
     def embed_text(self, text: str, task_type: str = None) -> List[float]:
@@ -120,9 +127,15 @@ class GeminiEmbedder:
         logger.info(f"임베딩 완료: {len(all_embeddings)}개")
         return all_embeddings
 
+    def _query_vector(self, query: str) -> np.ndarray:
+        """쿼리 임베딩을 읽기 전용 float32 배열로 생성"""
+        vector = np.asarray(self.embed_text(query, task_type="RETRIEVAL_QUERY"), dtype=np.float32)
+        vector.flags.writeable = False
+        return vector
+
     def embed_query(self, query: str) -> List[float]:
-        """검색 쿼리를 임베딩"""
-        return self.embed_text(query, task_type="RETRIEVAL_QUERY")
+        """검색 쿼리를 임베딩 (앞뒤 공백을 제거한 쿼리 기준으로 캐시)"""
+        return self._cached_query_vector(query.strip()).tolist()
 
     def embed_document(self, document: str) -> List[float]:
         """문서를 임베딩"""
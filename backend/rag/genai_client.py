@@ -0,0 +1,41 @@
+"""
+공유 Google GenAI 클라이언트
+
+임베딩/추천 생성/이미지 생성이 API 키별로 하나의 genai.Client(= 하나의 HTTP
+커넥션 풀)를 공유하도록 하여, 호출마다 TCP/TLS 핸드셰이크가 반복되지 않게 한다.
+"""
+
+import os
+from functools import lru_cache
+
+import httpx
+from google import genai
+from google.genai import types
+
+# 유지할 유휴 커넥션 수와 유휴 유지 시간 (초)
+GENAI_MAX_KEEPALIVE = int(os.getenv("GENAI_MAX_KEEPALIVE", "32"))
+GENAI_KEEPALIVE_EXPIRY = float(os.getenv("GENAI_KEEPALIVE_EXPIRY", "300"))
+
+
+@lru_cache(maxsize=None)
+def get_genai_client(api_key: str) -> genai.Client:
+    """
+    API 키별 공유 genai.Client 반환
+
+    Args:
+        api_key: Gemini API 키
+
+    Returns:
+        keep-alive 커넥션 풀이 설정된 genai.Client
+    """
+    limits = httpx.Limits(
+        max_keepalive_connections=GENAI_MAX_KEEPALIVE,
+        keepalive_expiry=GENAI_KEEPALIVE_EXPIRY,
+    )
+    return genai.Client(
+        api_key=api_key,
+        http_options=types.HttpOptions(
+            client_args={"limits": limits},
+            async_client_args={"limits": limits},
+        ),
+    )
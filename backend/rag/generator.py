@@ -1,13 +1,13 @@
 """
 Gemini API를 사용한 추천 응답 생성기 (New SDK)
 """
-from google import genai
 from google.genai import types
 from typing import List, Dict, Any, Optional
 from loguru import logger
 import json
 
 from .config import GEMINI_API_KEY, GENERATION_MODEL
+from .genai_client import get_genai_client
 
 
 class PCRecommendationGenerator:
@@ -29,8 +29,8 @@ class PCRecommendationGenerator:
         self.model_name = model
         self.temperature = temperature
 
-        # Gemini API 클라이언트 초기화 (google-genai SDK)
-        self.client = genai.Client(api_key=self.api_key)
+        # Gemini API 클라이언트 (google-genai SDK, API 키별 커넥션 풀 공유)
+        self.client = get_genai_client(self.api_key)
         
         logger.info(f"PCRecommendationGenerator 초기화: model={model} (SDK: google-genai)")
 
@@ -195,12 +195,23 @@ class PCRecommendationGenerator:
     def generate_comparison(
         self,
         components_to_compare: List[Dict[str, Any]],
+        similarity_matrix: Optional[Any] = None,
     ) -> Dict[str, Any]:
         """
         여러 부품을 비교 분석
+
+        similarity_matrix가 주어지면 부품 간 임베딩 유사도를 프롬프트에 포함
         """
         context = self._build_context(components_to_compare)
 
+        if similarity_matrix is not None:
+            names = [c.get("metadata", {}).get("name", c.get("id")) for c in components_to_compare]
+            pairs = ["### 부품 간 유사도:"]
+            for i in range(len(names)):
+                for j in range(i + 1, len(names)):
+                    pairs.append(f"- {names[i]} ↔ {names[j]}: {float(similarity_matrix[i][j]):.2%}")
+            context = context + "\n\n" + "\n".join(pairs)
+
         prompt = f"""다음 PC 부품들을 비교 분석해주세요:
 
 {context}
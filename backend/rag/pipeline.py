@@ -3,6 +3,7 @@ RAG 파이프라인 - 전체 시스템 통합
 """
 from typing import Dict, Any, List, Optional
 from pathlib import Path
+import numpy as np
 from loguru import logger
 
 from .embedder import GeminiEmbedder
@@ -107,6 +108,7 @@ class RAGPipeline:
         top_k: int = 5,
         category: Optional[str] = None,
         include_context: bool = False,
+        query_embedding: Optional[List[float]] = None,
     ) -> Dict[str, Any]:
         """
         사용자 쿼리에 대한 PC 부품 추천 생성
@@ -116,6 +118,7 @@ class RAGPipeline:
             top_k: 검색할 부품 수
             category: 특정 카테고리로 제한
             include_context: 검색된 원본 데이터 포함 여부
+            query_embedding: 미리 계산된 쿼리 임베딩 (없으면 새로 생성)
 
         Returns:
             추천 결과 딕셔너리
@@ -127,6 +130,7 @@ class RAGPipeline:
             query=user_query,
             top_k=top_k,
             category=category,
+            query_embedding=query_embedding,
         )
 
         if not retrieved_components:
@@ -222,29 +226,83 @@ class RAGPipeline:
         """
         logger.info(f"부품 비교: {len(component_ids)}개")
 
-        # ChromaDB에서 부품 조회
-        components = []
-        for comp_id in component_ids:
-            result = self.vector_store.collection.get(ids=[comp_id])
-            if result["ids"]:
-                components.append({
-                    "id": result["ids"][0],
-                    "document": result["documents"][0],
-                    "metadata": result["metadatas"][0],
-                })
+        # ChromaDB에서 부품 일괄 조회 (1회 왕복)
+        components = self.fetch_components_batch(component_ids)
 
         if len(components) < 2:
             raise ValueError("비교하려면 최소 2개의 부품이 필요합니다.")
 
+        # 부품 간 코사인 유사도 행렬 (N x N)
+        similarity_matrix = None
+        embeddings = [c["embedding"] for c in components]
+        if all(e is not None for e in embeddings):
+            matrix = np.asarray(embeddings, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix = matrix / np.where(norms == 0, 1.0, norms)
+            similarity_matrix = matrix @ matrix.T
+
         # 비교 분석 생성
-        comparison = self.generator.generate_comparison(components)
+        comparison = self.generator.generate_comparison(
+            components, similarity_matrix=similarity_matrix
+        )
 
-        return {
+        result = {
             "compared_components": [c["metadata"]["name"] for c in components],
             "comparison": comparison,
         }
+        if similarity_matrix is not None:
+            result["similarity_matrix"] = np.round(similarity_matrix, 4).tolist()
+
+        return result
+
+    def fetch_components_batch(
+        self,
+        component_ids: List[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 부품을 한 번의 조회로 가져오기
+
+        Args:
+            component_ids: 부품 ID 리스트
+
+        Returns:
+            요청한 순서대로 정렬된 부품 리스트 (존재하지 않는 ID는 제외)
+        """
+        result = self.vector_store.collection.get(
+            ids=list(dict.fromkeys(component_ids)),
+            include=["documents", "metadatas", "embeddings"],
+        )
+
+        embeddings = result.get("embeddings")
+        by_id = {}
+        for i, comp_id in enumerate(result["ids"]):
+            by_id[comp_id] = {
+                "id": comp_id,
+                "document": result["documents"][i],
+                "metadata": result["metadatas"][i],
+                "embedding": embeddings[i] if embeddings is not None else None,
+            }
+
+        return [by_id[comp_id] for comp_id in dict.fromkeys(component_ids) if comp_id in by_id]
 
     def get_stats(self) -> Dict[str, Any]:
         """시스템 통계 조회"""
         return self.vector_store.get_stats()
 
+    def warmup(self, query: str = "게이밍 PC CPU") -> None:
+        """
+        첫 요청의 콜드 스타트 비용을 시작 시점에 미리 지불
+
+        임베딩 API 연결(TCP/TLS)을 열고, 벡터 인덱스를 메모리에 올리기 위해
+        검색을 한 번 수행한다. LLM 생성은 비용이 들므로 호출하지 않는다.
+
+        Args:
+            query: 워밍업에 사용할 쿼리
+        """
+        try:
+            query_embedding = self.embedder.embed_query(query)
+            self.vector_store.search(query=query, top_k=1, query_embedding=query_embedding)
+            logger.info("RAGPipeline 워밍업 완료")
+        except Exception as e:
+            logger.warning(f"RAGPipeline 워밍업 실패 (첫 요청이 느릴 수 있음): {str(e)}")
+
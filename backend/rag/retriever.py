@@ -32,6 +32,7 @@ class PCComponentRetriever:
         category: Optional[str] = None,
         min_similarity: float = 0.5,
         filters: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """
         쿼리에 맞는 PC 부품 검색
@@ -42,30 +43,31 @@ class PCComponentRetriever:
             category: 특정 카테고리로 필터링 (예: "gpu")
             min_similarity: 최소 유사도 (0~1)
             filters: 추가 메타데이터 필터 (예: {"socket": "LGA1700"})
+            query_embedding: 미리 계산된 쿼리 임베딩 (없으면 새로 생성)
 
         Returns:
             검색 결과 리스트
         """
         top_k = top_k or self.top_k
 
-        # 메타데이터 필터 구성
-        filter_metadata = filters or {}
+        # 메타데이터 필터 구성 (호출자의 filters는 변경하지 않음)
+        filter_metadata = dict(filters) if filters else {}
         if category:
             filter_metadata["category"] = category
 
         # 벡터 검색 수행
+        # 카테고리/메타데이터 필터는 ChromaDB에서 적용되고 결과는 유사도 내림차순이므로,
+        # 임계값 이상인 상위 k개는 항상 상위 k개 결과 안에 있다 (추가 조회 불필요)
         results = self.vector_store.search(
             query=query,
-            top_k=top_k * 2,  # 필터링을 고려하여 더 많이 검색
+            top_k=top_k,
             filter_metadata=filter_metadata if filter_metadata else None,
+            query_embedding=query_embedding,
         )
 
         # 유사도 필터링
         filtered_results = [r for r in results if r["similarity"] >= min_similarity]
 
-        # 상위 k개만 반환
-        filtered_results = filtered_results[:top_k]
-
         logger.info(
             f"검색 완료: '{query}' -> {len(filtered_results)}개 부품 "
             f"(category={category}, filters={filters}, min_similarity={min_similarity})"
@@ -163,6 +165,24 @@ class PCComponentRetriever:
 
         return results
 
+    def get_component(
+        self,
+        category: str,
+        component_id: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        카테고리와 부품 ID로 부품 한 건 조회
+
+        Args:
+            category: 부품 카테고리 (벡터 DB 기준, 예: "cpu", "video_card")
+            component_id: 부품 ID
+
+        Returns:
+            부품 정보 (없으면 None)
+        """
+        results = self.vector_store.get_by_ids([f"{category}_{component_id}"])
+        return results[0] if results else None
+
     def get_popular_components(
         self,
         category: str,
@@ -0,0 +1,156 @@
+"""
+쿼리 임베딩 기반 시맨틱 응답 캐시
+"""
+from typing import Dict, Any, List, Optional, Hashable
+import time
+import numpy as np
+from loguru import logger
+
+from .config import SEMANTIC_CACHE_SIZE, SEMANTIC_CACHE_THRESHOLD, SEMANTIC_CACHE_TTL
+
+
+class SemanticResponseCache:
+    """
+    의미적으로 거의 같은 쿼리에 대해 이전 응답을 재사용하는 인메모리 캐시
+
+    정규화된 쿼리 임베딩을 (N, d) float32 행렬에 링 버퍼 형태로 저장하고,
+    새 쿼리와의 코사인 유사도가 임계값 이상이면 저장된 응답을 반환한다.
+    top_k, category 등 응답에 영향을 주는 파라미터는 key로 분리하여
+    서로 다른 요청 간 응답이 섞이지 않도록 한다. 저장 후 ttl초가 지난 항목은
+    재고/가격 변동을 반영하기 위해 적중으로 보지 않는다.
+    """
+
+    def __init__(
+        self,
+        capacity: int = SEMANTIC_CACHE_SIZE,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        ttl: float = SEMANTIC_CACHE_TTL,
+    ):
+        """
+        Args:
+            capacity: 최대 캐시 항목 수 (초과 시 FIFO 방식으로 제거, 0 이하이면 캐시 비활성화)
+            threshold: 캐시 적중으로 판단할 최소 코사인 유사도
+            ttl: 항목 유효 시간 (초, 0 이하이면 만료 없음)
+        """
+        self.capacity = max(0, capacity)
+        self.threshold = threshold
+        self.ttl = ttl
+
+        # 임베딩 차원은 첫 저장 시점에 결정
+        self._matrix: Optional[np.ndarray] = None
+        self._key_slots = np.full(self.capacity, -1, dtype=np.int64)
+        self._stored_at = np.zeros(self.capacity, dtype=np.float64)
+        self._responses: List[Optional[Dict[str, Any]]] = [None] * self.capacity
+        # key -> (key ID, 해당 key를 가진 슬롯 수), 마지막 슬롯이 덮어써지면 제거
+        self._slot_keys: List[Optional[Hashable]] = [None] * self.capacity
+        self._key_ids: Dict[Hashable, List[int]] = {}
+        self._next_key_id = 0
+        self._next = 0
+        self._size = 0
+
+        logger.info(f"SemanticResponseCache 초기화: capacity={capacity}, threshold={threshold}, ttl={ttl}")
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> Optional[np.ndarray]:
+        """임베딩을 L2 정규화된 float32 벡터로 변환"""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if vector.ndim != 1 or norm == 0:
+            return None
+        return vector / norm
+
+    def lookup(self, embedding: List[float], key: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        유사한 쿼리의 캐시된 응답 조회
+
+        Args:
+            embedding: 쿼리 임베딩
+            key: 요청 파라미터 키 (예: ("query", top_k, category))
+
+        Returns:
+            캐시된 응답 (없으면 None)
+        """
+        entry = self._key_ids.get(key)
+        if entry is None or self._matrix is None:
+            return None
+        key_id = entry[0]
+
+        query = self._normalize(embedding)
+        if query is None or query.shape[0] != self._matrix.shape[1]:
+            return None
+
+        scores = self._matrix[: self._size] @ query
+        scores[self._key_slots[: self._size] != key_id] = -np.inf
+        if self.ttl > 0:
+            scores[self._stored_at[: self._size] < time.monotonic() - self.ttl] = -np.inf
+
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+
+        logger.debug(f"시맨틱 캐시 적중: similarity={scores[best]:.4f}")
+        return self._responses[best]
+
+    def store(self, embedding: List[float], key: Hashable, response: Dict[str, Any]) -> None:
+        """
+        쿼리 임베딩과 응답을 캐시에 저장
+
+        Args:
+            embedding: 쿼리 임베딩
+            key: 요청 파라미터 키
+            response: 저장할 응답
+        """
+        if self.capacity == 0:
+            return
+
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+
+        if self._matrix is None:
+            self._matrix = np.zeros((self.capacity, vector.shape[0]), dtype=np.float32)
+        elif vector.shape[0] != self._matrix.shape[1]:
+            return
+
+        slot = self._next
+        self._release_slot_key(slot)
+
+        entry = self._key_ids.get(key)
+        if entry is None:
+            entry = self._key_ids[key] = [self._next_key_id, 0]
+            self._next_key_id += 1
+        entry[1] += 1
+
+        self._matrix[slot] = vector
+        self._key_slots[slot] = entry[0]
+        self._slot_keys[slot] = key
+        self._stored_at[slot] = time.monotonic()
+        self._responses[slot] = response
+
+        self._next = (slot + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def _release_slot_key(self, slot: int) -> None:
+        """덮어쓸 슬롯의 key 참조를 해제 (더 이상 쓰는 슬롯이 없으면 key 제거)"""
+        old_key = self._slot_keys[slot]
+        if old_key is None:
+            return
+        entry = self._key_ids[old_key]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self._key_ids[old_key]
+
+    def clear(self) -> None:
+        """캐시 초기화"""
+        self._matrix = None
+        self._key_slots.fill(-1)
+        self._stored_at.fill(0.0)
+        self._responses = [None] * self.capacity
+        self._slot_keys = [None] * self.capacity
+        self._key_ids.clear()
+        self._next_key_id = 0
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,105 @@
+"""
+Step-by-Step 선택 세션 저장소
+
+REDIS_URL이 설정되어 있으면 Redis에 세션을 저장하여 여러 uvicorn 워커/서버가
+같은 세션을 공유할 수 있게 하고, 없으면 프로세스 내 메모리에 저장한다.
+"""
+from typing import Dict, Optional, TYPE_CHECKING
+from loguru import logger
+
+from .config import REDIS_URL, SESSION_TTL
+
+if TYPE_CHECKING:
+    from .step_by_step import SelectionSession
+
+
+class SessionConflictError(RuntimeError):
+    """다른 요청(워커)이 먼저 세션을 변경하여 저장이 거부됨"""
+
+
+class InMemorySessionStore:
+    """프로세스 내 딕셔너리 기반 세션 저장소 (단일 워커용)"""
+
+    def __init__(self):
+        self._sessions: Dict[str, "SelectionSession"] = {}
+
+    def get(self, session_id: str) -> Optional["SelectionSession"]:
+        return self._sessions.get(session_id)
+
+    def save(self, session: "SelectionSession") -> None:
+        self._sessions[session.session_id] = session
+
+    def delete(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+
+class RedisSessionStore:
+    """
+    Redis 기반 세션 저장소
+
+    세션은 JSON으로 직렬화하여 `spckit:session:{session_id}` 키에 저장하고,
+    저장할 때마다 TTL을 갱신한다.
+
+    여러 워커가 같은 세션을 동시에 변경하는 경우(중복 클릭 등)를 막기 위해,
+    저장된 세션의 version이 저장하려는 version 이상이면 덮어쓰지 않고
+    SessionConflictError를 발생시킨다 (비교와 저장은 Lua 스크립트로 한 번에 수행).
+    """
+
+    KEY_PREFIX = "spckit:session:"
+
+    # KEYS[1]: 세션 키, ARGV: (세션 JSON, version, TTL)
+    SAVE_SCRIPT = """
+    local current = redis.call('GET', KEYS[1])
+    if current and cjson.decode(current)['version'] >= tonumber(ARGV[2]) then
+        return 0
+    end
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+    return 1
+    """
+
+    def __init__(self, url: str = REDIS_URL, ttl: int = SESSION_TTL):
+        """
+        Args:
+            url: Redis 접속 URL (예: redis://localhost:6379/0)
+            ttl: 세션 만료 시간 (초)
+        """
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError("Redis 세션 저장소를 사용하려면 redis 패키지가 필요합니다: pip install redis") from e
+
+        self._client = redis.Redis.from_url(url)
+        self._save_script = self._client.register_script(self.SAVE_SCRIPT)
+        self.ttl = ttl
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.KEY_PREFIX}{session_id}"
+
+    def get(self, session_id: str) -> Optional["SelectionSession"]:
+        from .step_by_step import SelectionSession
+
+        raw = self._client.get(self._key(session_id))
+        if raw is None:
+            return None
+        return SelectionSession.model_validate_json(raw)
+
+    def save(self, session: "SelectionSession") -> None:
+        saved = self._save_script(
+            keys=[self._key(session.session_id)],
+            args=[session.model_dump_json(), session.version, self.ttl],
+        )
+        if not saved:
+            raise SessionConflictError(f"세션이 다른 요청에 의해 변경되었습니다: {session.session_id}")
+
+    def delete(self, session_id: str) -> None:
+        self._client.delete(self._key(session_id))
+
+
+def create_session_store():
+    """환경 설정에 맞는 세션 저장소 생성"""
+    if REDIS_URL:
+        logger.info(f"Redis 세션 저장소 사용 (TTL: {SESSION_TTL}초)")
+        return RedisSessionStore()
+
+    logger.info("인메모리 세션 저장소 사용")
+    return InMemorySessionStore()
@@ -131,15 +131,21 @@ backend/tests/test_step_by_step.py 참조
 """
 
 from typing import Dict, Any, List, Optional, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 import json
 import re
+import threading
+import uuid
+import numpy as np
 from loguru import logger
 from pydantic import BaseModel, Field
 from langchain_core.messages import HumanMessage, SystemMessage
 
+from .session_store import create_session_store
+
 # 모듈 임포트 (상대 경로)
 # from .retriever import PCComponentRetriever
 # from ..modules.compatibility import CompatibilityEngine
@@ -221,6 +227,17 @@ BUDGET_ALLOCATION = {
     },
 }
 
+# 시작 시 첫 단계(CPU) 검색 결과를 미리 조회할 목적
+# (첫 단계 검색 쿼리는 목적으로만 정해지므로 예산별로 나눌 필요 없음)
+FIRST_STEP_PRELOAD_PURPOSES = ("gaming", "workstation", "general", "streaming")
+
+# 세션별로 마지막에 제시한 후보 보관 수 ((세션, 단계) 단위 LRU, 선택 시 부품 정보 조회용)
+OFFERED_CANDIDATES_CACHE_SIZE = 10000
+
+# 후보 정렬 가중치 (검색 유사도 vs 할당 예산 적합도)
+RANK_SIMILARITY_WEIGHT = 0.7
+RANK_BUDGET_WEIGHT = 0.3
+
 # 카테고리별 설명 및 주요 스펙
 CATEGORY_INFO = {
     "cpu": {
@@ -386,6 +403,7 @@ class SelectionSession(BaseModel):
     current_step: int = 1
     selections: List[SelectedComponent] = Field(default_factory=list)
     context: StepContext
+    version: int = 0  # 선택/건너뛰기/취소 시마다 증가 (후보 응답 ETag 용)
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
@@ -428,19 +446,28 @@ class StepByStepRAGPipeline:
         retriever=None,
         compatibility_engine=None,
         llm=None,
+        session_store=None,
     ):
         """
         Args:
             retriever: PCComponentRetriever 인스턴스
             compatibility_engine: CompatibilityEngine 인스턴스
             llm: LangChain Chat Model 인스턴스 (Option)
+            session_store: 세션 저장소 (없으면 REDIS_URL 설정에 따라 생성)
         """
         self.retriever = retriever
         self.compatibility_engine = compatibility_engine
         self.llm = llm
         
-        # 세션 저장소 (실제로는 Redis/DB 사용)
-        self._sessions: Dict[str, SelectionSession] = {}
+        # 세션 저장소 (REDIS_URL 설정 시 Redis, 아니면 인메모리)
+        self.session_store = session_store or create_session_store()
+        
+        # 미리 조회한 첫 단계 검색 결과: (목적, top_k) -> 정렬 전 후보
+        self._first_step_cache: Dict[Tuple[str, int], List[CandidateComponent]] = {}
+        
+        # 제시한 후보: (세션 ID, 단계) -> {부품 ID: 후보} (요청 스레드 간 공유되므로 락 사용)
+        self._offered_candidates: "OrderedDict[Tuple[str, int], Dict[str, CandidateComponent]]" = OrderedDict()
+        self._offered_lock = threading.Lock()
         
         logger.info("StepByStepRAGPipeline 초기화")
     
@@ -459,13 +486,20 @@ class StepByStepRAGPipeline:
         Returns:
             SelectionSession: 생성된 세션
         """
-        import uuid
+        session = self._new_session(budget, purpose)
+        self.session_store.save(session)
+        
+        logger.info(f"세션 시작: {session.session_id}, 예산: {budget:,}원, 목적: {purpose}")
+        return session
+    
+    def _new_session(self, budget: int, purpose: str) -> SelectionSession:
+        """저장하지 않은 새 세션 객체 생성"""
         session_id = str(uuid.uuid4())[:8]
         
         # 목적에 맞는 키워드 생성
         purpose_keywords = self._get_purpose_keywords(purpose)
         
-        session = SelectionSession(
+        return SelectionSession(
             session_id=session_id,
             total_budget=budget,
             purpose=purpose,
@@ -474,15 +508,10 @@ class StepByStepRAGPipeline:
                 purpose_keywords=purpose_keywords,
             ),
         )
-        
-        self._sessions[session_id] = session
-        
-        logger.info(f"세션 시작: {session_id}, 예산: {budget:,}원, 목적: {purpose}")
-        return session
     
     def get_session(self, session_id: str) -> Optional[SelectionSession]:
         """세션 조회"""
-        return self._sessions.get(session_id)
+        return self.session_store.get(session_id)
     
     def get_step_candidates(
         self,
@@ -501,10 +530,20 @@ class StepByStepRAGPipeline:
         Returns:
             StepResult: 단계 결과
         """
-        session = self._sessions.get(session_id)
+        session = self.session_store.get(session_id)
         if not session:
             raise ValueError(f"세션을 찾을 수 없습니다: {session_id}")
         
+        return self._build_step_result(session, step, top_k)
+    
+    def _build_step_result(
+        self,
+        session: SelectionSession,
+        step: Optional[int] = None,
+        top_k: int = 5,
+    ) -> StepResult:
+        """이미 로드된 세션으로 단계별 후보 조회 (세션 저장소 재조회 없음)"""
+        session_id = session.session_id
         step = step or session.current_step
         category = STEP_CATEGORIES.get(SelectionStep(step), "unknown")
         
@@ -521,22 +560,67 @@ class StepByStepRAGPipeline:
         # 할당 예산 조정 (남은 예산 고려)
         allocated_budget = min(allocated_budget, remaining_budget)
         
-        # RAG 검색 쿼리 생성
-        query = self._build_search_query(session, step, category)
+        # 첫 단계는 시작 시 미리 조회해 둔 검색 결과가 있으면 재사용
+        # (검색만 생략하고, 정렬과 LLM 분석은 이 세션의 예산으로 수행)
+        cached = None
+        if step == 1 and not session.selections:
+            cached = self._first_step_cache.get((session.purpose, top_k))
         
-        # 후보 검색 (RAG)
-        # [Fix] DB category mapping aligned with pc_data_dump.sql
-        search_category = category
-        extra_filters = {}
+        if cached is not None:
+            candidates = [c.model_copy(deep=True) for c in cached]
+        else:
+            candidates = self._retrieve_candidates(session, step, category, allocated_budget, top_k)
+        candidates, analysis = self._finalize_candidates(
+            session, step, category, candidates, allocated_budget, top_k
+        )
+        
+        self._remember_offered(session_id, step, candidates)
+        
+        # 다음 단계 결정
+        next_step = step + 1 if step < 9 else None
 
+        return StepResult(
+            session_id=session_id,
+            step=step,
+            category=category,
+            candidates=candidates,
+            allocated_budget=allocated_budget,
+            remaining_budget=remaining_budget - allocated_budget,
+            context=session.context,
+            next_step=next_step,
+            is_final_step=(step == 9),
+            analysis=analysis
+        )
+    
+    @staticmethod
+    def _search_category(category: str) -> str:
+        """단계 카테고리를 벡터 DB 카테고리로 변환"""
+        # [Fix] DB category mapping aligned with pc_data_dump.sql
         if category == "gpu":
-            search_category = "video_card"
+            return "video_card"
         elif category == "psu":
-            search_category = "power_supply"
+            return "power_supply"
         elif category in ["ssd", "hdd"]:
-            search_category = "storage"
             # extra_filters["type"] = category.upper() # [Fix] Removed to avoid complex filter error in ChromaDB
             # The query string itself ("... ssd ..." or "... hdd ...") will handle the semantic filtering.
+            return "storage"
+        return category
+    
+    def _retrieve_candidates(
+        self,
+        session: SelectionSession,
+        step: int,
+        category: str,
+        allocated_budget: int,
+        top_k: int,
+    ) -> List[CandidateComponent]:
+        """검색 → 호환성 필터로 정렬 전 후보 풀 생성"""
+        # RAG 검색 쿼리 생성
+        query = self._build_search_query(session, step, category)
+        
+        # 후보 검색 (RAG)
+        search_category = self._search_category(category)
+        extra_filters = {}
 
         candidates = self._search_candidates(
             query=query,
@@ -562,27 +646,93 @@ class StepByStepRAGPipeline:
         else:
              candidates = filtered_candidates
 
-        # 상위 K개 선택
-        candidates = candidates[:top_k]
+        return candidates
+    
+    def _finalize_candidates(
+        self,
+        session: SelectionSession,
+        step: int,
+        category: str,
+        candidates: List[CandidateComponent],
+        allocated_budget: int,
+        top_k: int,
+    ) -> Tuple[List[CandidateComponent], str]:
+        """후보 풀을 세션 예산으로 정렬하고 LLM 분석까지 수행해 후보와 분석 메시지 생성"""
+        search_category = self._search_category(category)
         
-        # 다음 단계 결정
-        next_step = step + 1 if step < 9 else None
+        # 상위 K개 선택 (유사도 + 예산 적합도)
+        candidates = self._rank_candidates(candidates, allocated_budget, top_k)
+        
+        # 해시태그/대표 스펙은 최종 후보에 대해서만 생성
+        for candidate in candidates:
+            candidate.hashtags = self._generate_hashtags(candidate, search_category)
+            candidate.representative_specs = self._extract_representative_specs(candidate, search_category)
         
         # LLM 분석 및 해시태그 생성 (한 번에 수행)
         analysis = self._enrich_candidates_with_llm(session, step, category, candidates)
-
-        return StepResult(
-            session_id=session_id,
-            step=step,
-            category=category,
-            candidates=candidates,
-            allocated_budget=allocated_budget,
-            remaining_budget=remaining_budget - allocated_budget,
-            context=session.context,
-            next_step=next_step,
-            is_final_step=(step == 9),
-            analysis=analysis
-        )
+        
+        return candidates, analysis
+    
+    def _remember_offered(self, session_id: str, step: int, candidates: List[CandidateComponent]) -> None:
+        """선택 시 부품 정보를 다시 조회하지 않도록 제시한 후보를 보관"""
+        with self._offered_lock:
+            self._offered_candidates[(session_id, step)] = {c.component_id: c for c in candidates}
+            self._offered_candidates.move_to_end((session_id, step))
+            if len(self._offered_candidates) > OFFERED_CANDIDATES_CACHE_SIZE:
+                self._offered_candidates.popitem(last=False)
+    
+    def _find_offered(self, session_id: str, step: int, component_id: str) -> Optional[CandidateComponent]:
+        """해당 단계에서 제시했던 후보 중 component_id 조회 (없으면 None)"""
+        with self._offered_lock:
+            offered = self._offered_candidates.get((session_id, step))
+        return offered.get(component_id) if offered else None
+    
+    def _lookup_component(self, category: str, component_id: str) -> Optional[CandidateComponent]:
+        """벡터 DB에서 부품 ID로 후보 정보 조회 (없거나 조회 실패 시 None)"""
+        if not self.retriever:
+            return None
+        
+        search_category = self._search_category(category)
+        try:
+            res = self.retriever.get_component(search_category, component_id)
+        except Exception as e:
+            logger.error(f"부품 조회 중 오류 발생: {e}")
+            return None
+        
+        if res is None:
+            logger.warning(f"선택한 부품을 찾을 수 없습니다: {search_category}, {component_id}")
+            return None
+        return self._to_candidate(res, search_category)
+    
+    def preload_first_step(
+        self,
+        purposes: Tuple[str, ...] = FIRST_STEP_PRELOAD_PURPOSES,
+        top_k: int = 5,
+    ) -> int:
+        """
+        자주 쓰이는 목적의 첫 단계(CPU) 검색 결과를 미리 조회
+        
+        검색 결과만 보관하고 정렬/LLM 분석은 세션마다 실제 예산으로 수행하므로
+        예산과 무관하게 재사용할 수 있으며, 미리 조회할 때 LLM은 호출하지 않는다.
+        
+        Returns:
+            캐시된 목적 수
+        """
+        category = STEP_CATEGORIES[SelectionStep.CPU]
+        for purpose in purposes:
+            session = self._new_session(0, purpose)
+            try:
+                candidates = self._retrieve_candidates(
+                    session, SelectionStep.CPU, category, 0, top_k
+                )
+            except Exception as e:
+                logger.warning(f"첫 단계 검색 결과 미리 조회 실패 ({purpose}): {str(e)}")
+                continue
+            if candidates:
+                self._first_step_cache[(purpose, top_k)] = candidates
+        
+        logger.info(f"첫 단계 검색 결과 미리 조회 완료: {len(self._first_step_cache)}개 목적")
+        return len(self._first_step_cache)
     
     def select_component(
         self,
@@ -603,14 +753,63 @@ class StepByStepRAGPipeline:
         Returns:
             업데이트된 세션
         """
-        session = self._sessions.get(session_id)
+        session = self.session_store.get(session_id)
+        if not session:
+            raise ValueError(f"세션을 찾을 수 없습니다: {session_id}")
+        
+        return self._apply_selection(session, step, component_id, component_data)
+    
+    def select_and_advance(
+        self,
+        session_id: str,
+        step: int,
+        component_id: str,
+        component_data: Optional[Dict[str, Any]] = None,
+        top_k: int = 5,
+    ) -> Tuple[SelectionSession, Optional[StepResult]]:
+        """
+        부품 선택 후 다음 단계 후보까지 한 번에 조회
+        
+        select_component + get_step_candidates와 같지만 세션을 한 번만 로드한다.
+        
+        Returns:
+            (업데이트된 세션, 다음 단계 결과 - 모든 단계 완료 시 None)
+        """
+        session = self.session_store.get(session_id)
         if not session:
             raise ValueError(f"세션을 찾을 수 없습니다: {session_id}")
         
+        session = self._apply_selection(session, step, component_id, component_data)
+        if session.current_step > 8:
+            return session, None
+        
+        return session, self._build_step_result(session, session.current_step, top_k)
+    
+    def _apply_selection(
+        self,
+        session: SelectionSession,
+        step: int,
+        component_id: str,
+        component_data: Optional[Dict[str, Any]] = None,
+    ) -> SelectionSession:
+        """세션에 선택 결과를 반영하고 저장"""
+        session_id = session.session_id
         category = STEP_CATEGORIES.get(SelectionStep(step), "unknown")
         
-        # 부품 정보 (실제로는 DB에서 조회)
+        # 부품 정보: ID만 전달된 경우 해당 단계에서 제시했던 후보에서 가져오고,
+        # 다른 워커가 제시한 후보라 이 프로세스에 없으면 벡터 DB에서 조회
         component_data = component_data or {}
+        if "name" not in component_data:
+            offered = self._find_offered(session_id, step, component_id)
+            if offered is None:
+                offered = self._lookup_component(category, component_id)
+            if offered is not None:
+                component_data = {
+                    "id": component_id,
+                    "name": offered.name,
+                    "price": offered.price,
+                    "specs": offered.specs,
+                }
         
         selection = SelectedComponent(
             step=step,
@@ -624,9 +823,11 @@ class StepByStepRAGPipeline:
         session.selections.append(selection)
         session.current_step = step + 1
         session.updated_at = datetime.now()
+        session.version += 1
         
         # 컨텍스트 업데이트
         self._update_context(session, selection)
+        self.session_store.save(session)
         
         logger.info(f"부품 선택: {session_id}, 단계 {step}, {component_id}")
         
@@ -640,15 +841,44 @@ class StepByStepRAGPipeline:
         """
         단계 건너뛰기
         """
-        session = self._sessions.get(session_id)
+        session = self.session_store.get(session_id)
         if not session:
             raise ValueError(f"세션을 찾을 수 없습니다: {session_id}")
-            
-        # 선택 없이 단계만 증가
+        
+        return self._apply_skip(session, step)
+    
+    def skip_and_advance(
+        self,
+        session_id: str,
+        step: int,
+        top_k: int = 5,
+    ) -> Tuple[SelectionSession, Optional[StepResult]]:
+        """
+        단계 건너뛰기 후 다음 단계 후보까지 한 번에 조회
+        
+        skip_step + get_step_candidates와 같지만 세션을 한 번만 로드한다.
+        
+        Returns:
+            (업데이트된 세션, 다음 단계 결과 - 모든 단계 완료 시 None)
+        """
+        session = self.session_store.get(session_id)
+        if not session:
+            raise ValueError(f"세션을 찾을 수 없습니다: {session_id}")
+        
+        session = self._apply_skip(session, step)
+        if session.current_step > 8:
+            return session, None
+        
+        return session, self._build_step_result(session, session.current_step, top_k)
+    
+    def _apply_skip(self, session: SelectionSession, step: int) -> SelectionSession:
+        """선택 없이 단계만 증가시키고 저장"""
         session.current_step = step + 1
         session.updated_at = datetime.now()
+        session.version += 1
+        self.session_store.save(session)
         
-        logger.info(f"단계 건너뛰기: {session_id}, 단계 {step}")
+        logger.info(f"단계 건너뛰기: {session.session_id}, 단계 {step}")
         
         return session
     
@@ -754,7 +984,6 @@ class StepByStepRAGPipeline:
         """
         RAG 검색으로 후보 부품 조회
         """
-        import uuid
         if not self.retriever:
             logger.warning("Retriever가 설정되지 않았습니다. 빈 리스트 반환.")
             return []
@@ -797,78 +1026,7 @@ class StepByStepRAGPipeline:
             return []
 
         # CandidateComponent로 변환
-        candidates = []
-        for res in results:
-            metadata = res.get("metadata", {})
-            
-            # [Fix] 스펙 매핑 적용
-            metadata = self._map_specs(category, metadata)
-
-            # 필수 필드 확인 (가격 등)
-            try:
-                price = int(float(metadata.get("price", 0)))
-            except (ValueError, TypeError):
-                price = 0
-                
-            # ID 보정 (field_0가 ID일 가능성 높음)
-            comp_id = metadata.get("id", str(res.get("id")))
-            if not comp_id or comp_id == "None":
-                 comp_id = metadata.get("field_0", str(uuid.uuid4()))
-
-            candidate = CandidateComponent(
-                component_id=comp_id,
-                name=metadata.get("name", metadata.get("field_1", "Unknown Component")),
-                price=price,
-                match_score=res.get("similarity", 0.0),
-                compatibility_status="compatible", # 나중에 필터링됨
-                reasons=[], 
-                specs=metadata
-            )
-            
-            # 다나와 URL 및 가격 설정
-            danawa_info = None
-            
-            # [Fix] Danawa 서비스용 카테고리 매핑
-            danawa_category = category
-            if category == "video_card":
-                danawa_category = "gpu"
-            elif category == "power_supply":
-                danawa_category = "psu"
-            elif category == "storage":
-                if extra_filters and extra_filters.get("type") == "SSD":
-                    danawa_category = "ssd"
-                elif extra_filters and extra_filters.get("type") == "HDD":
-                    danawa_category = "hdd"
-
-            if _danawa_service:
-                # 1차: ID 기반 조회 시도
-                if comp_id:
-                    danawa_info = _danawa_service.get_product_info(comp_id, danawa_category)
-                
-                # 2차: ID로 못 찾으면 이름 기반 fuzzy 매칭
-                if not danawa_info:
-                    comp_name = metadata.get("name", metadata.get("field_1", ""))
-                    danawa_info = _danawa_service.get_product_by_name_with_url(comp_name, danawa_category)
-                
-                # 다나와 정보가 있으면 적용
-                if danawa_info:
-                    candidate.danawa_url = danawa_info.get("danawa_url")
-                    candidate.image_url = danawa_info.get("image_url")
-                    # 기존 가격이 0이면 다나와 가격 사용
-                    if price == 0 and danawa_info.get("price"):
-                        candidate.price = danawa_info.get("price")
-                elif comp_id:
-                    # fallback: ID로 URL만 생성
-                    candidate.danawa_url = _danawa_service.get_danawa_url(comp_id)
-                    candidate.danawa_url = _danawa_service.get_danawa_url(comp_id)
-            
-            # 해시태그 생성
-            candidate.hashtags = self._generate_hashtags(candidate, category)
-            
-            # 대표 스펙 추출
-            candidate.representative_specs = self._extract_representative_specs(candidate, category)
-            
-            candidates.append(candidate)
+        candidates = [self._to_candidate(res, category, extra_filters) for res in results]
         
         # 중복 제거: component_id 기준
         seen_ids = set()
@@ -904,6 +1062,105 @@ class StepByStepRAGPipeline:
             logger.warning(f"유효한 가격 정보가 있는 제품이 없습니다. 원래 목록 반환.")
             return candidates
     
+    def _to_candidate(
+        self,
+        res: Dict[str, Any],
+        category: str,
+        extra_filters: Optional[Dict[str, Any]] = None,
+    ) -> CandidateComponent:
+        """벡터 DB 조회 결과 한 건을 CandidateComponent로 변환 (스펙 매핑, 다나와 정보 적용)"""
+        metadata = res.get("metadata", {})
+
+        # [Fix] 스펙 매핑 적용
+        metadata = self._map_specs(category, metadata)
+
+        # 필수 필드 확인 (가격 등)
+        try:
+            price = int(float(metadata.get("price", 0)))
+        except (ValueError, TypeError):
+            price = 0
+
+        # ID 보정 (field_0가 ID일 가능성 높음)
+        comp_id = metadata.get("id", str(res.get("id")))
+        if not comp_id or comp_id == "None":
+             comp_id = metadata.get("field_0", str(uuid.uuid4()))
+
+        candidate = CandidateComponent(
+            component_id=comp_id,
+            name=metadata.get("name", metadata.get("field_1", "Unknown Component")),
+            price=price,
+            match_score=res.get("similarity", 0.0),
+            compatibility_status="compatible", # 나중에 필터링됨
+            reasons=[], 
+            specs=metadata
+        )
+
+        # 다나와 URL 및 가격 설정
+        danawa_info = None
+
+        # [Fix] Danawa 서비스용 카테고리 매핑
+        danawa_category = category
+        if category == "video_card":
+            danawa_category = "gpu"
+        elif category == "power_supply":
+            danawa_category = "psu"
+        elif category == "storage":
+            if extra_filters and extra_filters.get("type") == "SSD":
+                danawa_category = "ssd"
+            elif extra_filters and extra_filters.get("type") == "HDD":
+                danawa_category = "hdd"
+
+        if _danawa_service:
+            # 1차: ID 기반 조회 시도
+            if comp_id:
+                danawa_info = _danawa_service.get_product_info(comp_id, danawa_category)
+
+            # 2차: ID로 못 찾으면 이름 기반 fuzzy 매칭
+            if not danawa_info:
+                comp_name = metadata.get("name", metadata.get("field_1", ""))
+                danawa_info = _danawa_service.get_product_by_name_with_url(comp_name, danawa_category)
+
+            # 다나와 정보가 있으면 적용
+            if danawa_info:
+                candidate.danawa_url = danawa_info.get("danawa_url")
+                candidate.image_url = danawa_info.get("image_url")
+                # 기존 가격이 0이면 다나와 가격 사용
+                if price == 0 and danawa_info.get("price"):
+                    candidate.price = danawa_info.get("price")
+            elif comp_id:
+                # fallback: ID로 URL만 생성
+                candidate.danawa_url = _danawa_service.get_danawa_url(comp_id)
+                candidate.danawa_url = _danawa_service.get_danawa_url(comp_id)
+
+        return candidate
+    
+    def _rank_candidates(
+        self,
+        candidates: List[CandidateComponent],
+        budget: int,
+        top_k: int,
+    ) -> List[CandidateComponent]:
+        """
+        유사도와 예산 적합도를 가중합하여 상위 top_k 후보 선택
+        
+        예산 적합도는 할당 예산과 가격의 차이를 예산 대비 비율로 계산한다
+        (할당 예산과 같으면 1, 두 배 이상 차이 나면 0).
+        """
+        if len(candidates) <= 1:
+            return candidates[:top_k]
+        
+        similarities = np.fromiter((c.match_score for c in candidates), dtype=np.float32, count=len(candidates))
+        scores = RANK_SIMILARITY_WEIGHT * similarities
+        
+        if budget > 0:
+            prices = np.fromiter((c.price for c in candidates), dtype=np.float32, count=len(candidates))
+            budget_fit = np.clip(1.0 - np.abs(prices - budget) / budget, 0.0, 1.0)
+            scores += RANK_BUDGET_WEIGHT * budget_fit
+        
+        # 동점이면 기존(유사도) 순서 유지
+        order = np.argsort(-scores, kind="stable")[:top_k]
+        return [candidates[i] for i in order]
+    
     def _filter_by_compatibility(
         self,
         candidates: List[CandidateComponent],
@@ -987,7 +1244,7 @@ class StepByStepRAGPipeline:
     
     def get_summary(self, session_id: str) -> Dict[str, Any]:
         """세션 요약 조회"""
-        session = self._sessions.get(session_id)
+        session = self.session_store.get(session_id)
         if not session:
             return {}
         
@@ -1027,7 +1284,7 @@ class StepByStepRAGPipeline:
         Returns:
             업데이트된 세션
         """
-        session = self._sessions.get(session_id)
+        session = self.session_store.get(session_id)
         if not session:
             raise ValueError(f"세션을 찾을 수 없습니다: {session_id}")
         
@@ -1035,9 +1292,11 @@ class StepByStepRAGPipeline:
         session.selections = [s for s in session.selections if s.step < step]
         session.current_step = step
         session.updated_at = datetime.now()
+        session.version += 1
         
         # 컨텍스트 재계산
         self._recalculate_context(session)
+        self.session_store.save(session)
         
         logger.info(f"부품 선택 취소: {session_id}, 단계 {step} 이후 초기화")
         return session
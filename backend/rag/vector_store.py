@@ -3,11 +3,13 @@ ChromaDB를 사용한 벡터 데이터베이스 관리
 """
 import chromadb
 from chromadb.config import Settings
-from typing import List, Dict, Any, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from loguru import logger
 
-from .config import CHROMA_PERSIST_DIRECTORY, CHROMA_COLLECTION_NAME
+from .config import CHROMA_PERSIST_DIRECTORY, CHROMA_COLLECTION_NAME, INGEST_EMBED_WORKERS
 from .embedder import GeminiEmbedder
 
 
@@ -64,68 +66,108 @@ class PCComponentVectorStore:
         self,
         documents: List[Dict[str, Any]],
         batch_size: int = 500,
+        embed_workers: int = INGEST_EMBED_WORKERS,
     ) -> None:
         """
         문서들을 벡터 데이터베이스에 추가
 
+        배치 임베딩은 embed_workers개 스레드에서 동시에 생성하고, 완료된 배치를
+        순서대로 ChromaDB에 저장하여 임베딩 API 대기와 DB 저장이 겹치도록 한다.
+        진행 중인 배치는 embed_workers * 2개로 제한하여, DB 저장이 느려도
+        임베딩 결과가 메모리에 무한정 쌓이지 않도록 한다.
+
         Args:
             documents: 문서 리스트 (각 문서는 'text'와 'metadata' 키 포함)
             batch_size: 배치 크기
+            embed_workers: 동시에 임베딩할 배치 수
         """
         logger.info(f"{len(documents)}개의 문서를 추가 중...")
 
-        for i in range(0, len(documents), batch_size):
-            batch = documents[i : i + batch_size]
-            
-            # 텍스트 추출
-            texts = [doc["text"] for doc in batch]
-            
-            # 메타데이터 정제: None 값 제거
-            cleaned_metadatas = []
-            for doc in batch:
-                metadata = {}
-                for k, v in doc["metadata"].items():
-                    # None 값 또는 빈 값 건너뛰기
-                    if v is None or v == "":
-                        continue
-                    # 지원되는 타입만 추가 (bool, int, float, str)
-                    if isinstance(v, (bool, int, float)):
-                        metadata[k] = v
-                    else:
-                        # 기타 타입은 문자열로 변환
-                        metadata[k] = str(v)
-                cleaned_metadatas.append(metadata)
-            
-            # ID 생성 (카테고리 + 인덱스)
-            ids = [
-                f"{doc['metadata'].get('category', 'unknown')}_{doc['metadata'].get('id', i + j)}"
-                for j, doc in enumerate(batch)
-            ]
-
-            # 임베딩 생성
-            logger.debug(f"배치 {i // batch_size + 1}: 임베딩 생성 중...")
-            embeddings = self.embedder.embed_batch(texts, task_type="RETRIEVAL_DOCUMENT")
-
-            # ChromaDB에 추가
-            self.collection.add(
-                ids=ids,
-                embeddings=embeddings,
-                documents=texts,
-                metadatas=cleaned_metadatas,
-            )
+        batches = (
+            self._prepare_batch(documents[i : i + batch_size], i)
+            for i in range(0, len(documents), batch_size)
+        )
 
-            logger.info(
-                f"진행: {min(i + batch_size, len(documents))}/{len(documents)} "
-                f"({(min(i + batch_size, len(documents)) / len(documents) * 100):.1f}%)"
-            )
+        def embed(batch):
+            return batch, self.embedder.embed_batch(batch[1], task_type="RETRIEVAL_DOCUMENT")
+
+        workers = max(1, embed_workers)
+        pending: Deque[Future] = deque()
+        done = 0
+
+        def drain(limit: int) -> None:
+            # 제출 순서대로 꺼내 저장하므로 진행 로그와 ID 순서가 유지됨
+            nonlocal done
+            while len(pending) > limit:
+                (ids, texts, metadatas), embeddings = pending.popleft().result()
+
+                # ChromaDB에 추가
+                self.collection.add(
+                    ids=ids,
+                    embeddings=embeddings,
+                    documents=texts,
+                    metadatas=metadatas,
+                )
+
+                done += len(ids)
+                logger.info(
+                    f"진행: {done}/{len(documents)} "
+                    f"({(done / len(documents) * 100):.1f}%)"
+                )
+
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for batch in batches:
+                pending.append(pool.submit(embed, batch))
+                drain(workers * 2 - 1)
+            drain(0)
+        except BaseException:
+            # 실패 시 아직 시작하지 않은 배치의 임베딩 API 호출은 취소
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        else:
+            pool.shutdown()
 
         logger.info(f"문서 추가 완료. 총 아이템 수: {self.collection.count()}")
 
+    @staticmethod
+    def _prepare_batch(
+        batch: List[Dict[str, Any]], offset: int
+    ) -> Tuple[List[str], List[str], List[Dict[str, Any]]]:
+        """배치 문서에서 (ID, 텍스트, 정제된 메타데이터) 추출"""
+        # 텍스트 추출
+        texts = [doc["text"] for doc in batch]
+
+        # 메타데이터 정제: None 값 제거
+        cleaned_metadatas = []
+        for doc in batch:
+            metadata = {}
+            for k, v in doc["metadata"].items():
+                # None 값 또는 빈 값 건너뛰기
+                if v is None or v == "":
+                    continue
+                # 지원되는 타입만 추가 (bool, int, float, str)
+                if isinstance(v, (bool, int, float)):
+                    metadata[k] = v
+                else:
+                    # 기타 타입은 문자열로 변환
+                    metadata[k] = str(v)
+            cleaned_metadatas.append(metadata)
+
+        # ID 생성 (카테고리 + 인덱스)
+        ids = [
+            f"{doc['metadata'].get('category', 'unknown')}_{doc['metadata'].get('id', offset + j)}"
+            for j, doc in enumerate(batch)
+        ]
+
+        return ids, texts, cleaned_metadatas
+
     def search(
         self,
         query: str,
         top_k: int = 5,
         filter_metadata: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> List[Dict[str, Any]]:
         """
         쿼리와 유사한 문서 검색
@@ -134,18 +176,20 @@ class PCComponentVectorStore:
             query: 검색 쿼리
             top_k: 반환할 결과 수
             filter_metadata: 메타데이터 필터 (예: {"category": "cpu"})
+            query_embedding: 미리 계산된 쿼리 임베딩 (없으면 새로 생성)
 
         Returns:
             검색 결과 리스트
         """
         # 쿼리 임베딩 생성
-        query_embedding = self.embedder.embed_query(query)
+        if query_embedding is None:
+            query_embedding = self.embedder.embed_query(query)
 
-        # 검색 수행
+        # 검색 수행 (필터와 top_k를 모두 ChromaDB에 전달하여 필요한 만큼만 조회)
         results = self.collection.query(
             query_embeddings=[query_embedding],
             n_results=top_k,
-            where=filter_metadata,
+            where=self._build_where(filter_metadata),
             include=["documents", "metadatas", "distances"],
         )
 
@@ -165,6 +209,19 @@ class PCComponentVectorStore:
         logger.info(f"검색 완료: '{query}' -> {len(formatted_results)}개 결과")
         return formatted_results
 
+    @staticmethod
+    def _build_where(filter_metadata: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        메타데이터 필터를 ChromaDB where 절로 변환
+
+        ChromaDB는 최상위에 조건이 2개 이상이면 $and로 묶어야 한다.
+        """
+        if not filter_metadata:
+            return None
+        if len(filter_metadata) == 1:
+            return dict(filter_metadata)
+        return {"$and": [{key: value} for key, value in filter_metadata.items()]}
+
     def get_by_category(self, category: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         특정 카테고리의 부품 조회
@@ -194,6 +251,33 @@ class PCComponentVectorStore:
 
         return formatted_results
 
+    def get_by_ids(self, ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        문서 ID로 부품 조회 (ID는 add_documents와 같은 "카테고리_부품ID" 형식)
+
+        Args:
+            ids: 조회할 문서 ID 리스트
+
+        Returns:
+            부품 리스트 (없는 ID는 제외)
+        """
+        results = self.collection.get(
+            ids=ids,
+            include=["documents", "metadatas"],
+        )
+
+        formatted_results = []
+        for i in range(len(results["ids"])):
+            formatted_results.append(
+                {
+                    "id": results["ids"][i],
+                    "document": results["documents"][i],
+                    "metadata": results["metadatas"][i],
+                }
+            )
+
+        return formatted_results
+
     def delete_collection(self) -> None:
         """컬렉션 삭제 (데이터 초기화)"""
         self.client.delete_collection(name=self.collection_name)
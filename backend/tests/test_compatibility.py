@@ -93,6 +93,16 @@ class TestCompatibilityEngine:
         failed_checks = [c for c in result.checks if c.status.value == "fail"]
         assert len(failed_checks) > 0
     
+    def test_fast_reject(self, engine, compatible_build, incompatible_build):
+        """조기 종료 모드 테스트"""
+        # 호환 빌드는 일반 모드와 동일한 판정
+        assert engine.check_all(compatible_build, fast_reject=True).is_compatible == True
+        
+        result = engine.check_all(incompatible_build, fast_reject=True)
+        assert result.is_compatible == False
+        assert result.checks[-1].status.value == "fail"
+        assert result.power_summary is None
+    
     def test_power_calculation(self, engine, compatible_build):
         """전력 계산 테스트"""
         result = engine.check_all(compatible_build)
@@ -105,8 +115,20 @@ class TestCompatibilityEngine:
         """권장사항 생성 테스트"""
         result = engine.check_all(compatible_build)
         
-        # 권장사항은 리스트
-        assert isinstance(result.recommendations, list)
+        # 권장사항은 튜플 (캐시된 결과를 공유하므로 불변)
+        assert isinstance(result.recommendations, tuple)
+
+    def test_cached_result_isolated(self, engine, incompatible_build):
+        """호출자가 결과를 수정해도 캐시된 결과에 영향이 없는지 테스트"""
+        first = engine.check_all(incompatible_build)
+
+        with pytest.raises(AttributeError):
+            first.checks.append(first.checks[0])
+        first.checks[0].details["cpu_socket"] = "AM4"
+
+        second = engine.check_all(incompatible_build)
+        assert second.checks[0].details["cpu_socket"] == "LGA1700"
+        assert second == engine.check_all(incompatible_build)
 
 
 class TestCompatibilityRules:
@@ -178,6 +200,25 @@ class TestCompatibilityRules:
         mem_check = next((r for r in results if "memory" in r.rule_id), None)
         assert mem_check is not None
         assert mem_check.passed == True
+    
+    def test_find_failures(self, rules):
+        """배치 실패 검사 테스트 (check_all의 실패 결과와 동일)"""
+        components = [
+            {"category": "cpu", "name": "Intel Core i5-14600K", "specs": {"socket": "LGA1700"}},
+            {"category": "motherboard", "name": "MSI B650", "specs": {"form_factor": "ATX"}},
+            {"category": "motherboard", "name": "ASUS Z790", "specs": {"socket": "LGA1700"}},
+            {"category": "memory", "name": "DDR4-3200", "specs": {}},
+            {"category": "case", "name": "mini", "specs": {"form_factor": "Mini-ITX", "max_gpu_length": 300}},
+            {"category": "gpu", "name": "RTX 4090", "specs": {"length": 336}},
+        ]
+        
+        failures = rules.find_failures(rules.build_index(components))
+        expected = [r for r in rules.check_all(components) if not r.passed]
+        
+        assert [(r.rule_id, r.message) for r in failures] == [(r.rule_id, r.message) for r in expected]
+        assert {r.rule_id for r in failures} == {
+            "cpu_mb_socket", "memory_mb_type", "mb_case_form", "gpu_case_length",
+        }
 
 
 class TestPCOntology:
@@ -230,6 +271,41 @@ class TestPCOntology:
         assert ind is not None
         assert ind.properties["name"] == "Intel Core i5-14600K"
     
+    def test_get_individuals_by_class(self, ontology):
+        """클래스별 개체 조회 테스트 (하위 클래스 포함, 재등록)"""
+        from backend.modules.compatibility.ontology import ComponentClass
+        
+        ontology.add_individual(
+            id="gpu_rtx_4070",
+            class_type=ComponentClass.GPU,
+            properties={"name": "RTX 4070"},
+        )
+        
+        # Processor 하위 클래스(CPU, GPU)를 추가 순서대로 반환
+        processors = ontology.get_individuals_by_class(ComponentClass.PROCESSOR)
+        assert [ind.id for ind in processors] == ["cpu_i5_14600k", "gpu_rtx_4070"]
+        assert ontology.get_individuals_by_class(ComponentClass.PROCESSOR, include_subclasses=False) == []
+        
+        # 다른 클래스로 재등록하면 기존 클래스 조회에서 빠짐
+        ontology.add_individual(
+            id="gpu_rtx_4070",
+            class_type=ComponentClass.CASE,
+            properties={"name": "RTX 4070"},
+        )
+        assert [ind.id for ind in ontology.get_individuals_by_class(ComponentClass.GPU)] == []
+        assert [ind.id for ind in ontology.get_individuals_by_class(ComponentClass.ENCLOSURE)] == ["gpu_rtx_4070"]
+    
+    def test_cyclic_hierarchy_rejected(self):
+        """순환 클래스 계층 검출 테스트"""
+        from backend.modules.compatibility.ontology import ComponentClass, _build_subclass_index
+        
+        with pytest.raises(ValueError):
+            _build_subclass_index({
+                ComponentClass.COMPONENT: ComponentClass.CPU,
+                ComponentClass.PROCESSOR: ComponentClass.COMPONENT,
+                ComponentClass.CPU: ComponentClass.PROCESSOR,
+            })
+    
     def test_query_compatible(self, ontology):
         """호환 부품 질의 테스트"""
         from backend.modules.compatibility.ontology import ComponentClass
@@ -241,6 +317,45 @@ class TestPCOntology:
         assert compatible[0].id == "mb_asus_z790"
 
 
+
+class TestComponentCatalog:
+    """ComponentCatalog 테스트"""
+    
+    @pytest.fixture
+    def catalog(self):
+        from backend.modules.compatibility.catalog import ComponentCatalog
+        return ComponentCatalog([
+            {"category": "cpu", "name": "i5", "specs": {"socket": "LGA1700"}},
+            {"category": "cpu", "name": "r7", "specs": {"socket": "AM5"}},
+            {"category": "cpu", "name": "unknown", "specs": {}},
+            {"category": "motherboard", "name": "z790", "specs": {"socket": "LGA1700", "form_factor": "ATX"}},
+            {"category": "motherboard", "name": "b650i", "specs": {"socket": "AM5", "form_factor": "Mini-ITX"}},
+            {"category": "gpu", "name": "long", "specs": {"length": 340}},
+            {"category": "gpu", "name": "short", "specs": {"length": 250}},
+            {"category": "case", "name": "mid", "specs": {"form_factor": "Micro-ATX", "max_gpu_length": 300}},
+            {"category": "case", "name": "big", "specs": {"form_factor": "ATX"}},
+        ])
+    
+    def test_socket_mask(self, catalog):
+        """소켓 마스크 테스트 (전체 쌍 행렬)"""
+        import numpy as np
+        
+        mask = catalog.socket_mask(np.arange(3)[:, None], np.arange(2)[None, :])
+        
+        # 소켓 정보가 없는 CPU는 걸러내지 않음
+        assert mask.tolist() == [[True, False], [False, True], [True, True]]
+    
+    def test_gpu_case_and_form_factor_mask(self, catalog):
+        """GPU 길이 / 폼팩터 마스크 테스트"""
+        import numpy as np
+        
+        gpu_mask = catalog.gpu_case_mask(np.arange(2)[:, None], np.arange(2)[None, :])
+        assert gpu_mask.tolist() == [[False, True], [True, True]]
+        
+        form_mask = catalog.form_factor_mask(np.arange(2)[:, None], np.arange(2)[None, :])
+        assert form_mask.tolist() == [[False, True], [True, True]]
+
+
 # pytest 실행
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,106 @@
+"""
+시맨틱 응답 캐시 테스트
+======================
+
+테스트 실행:
+```bash
+pytest backend/tests/test_semantic_cache.py -v
+```
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+
+class TestSemanticResponseCache:
+    """SemanticResponseCache 테스트"""
+
+    @pytest.fixture
+    def cache_cls(self):
+        from backend.rag.semantic_cache import SemanticResponseCache
+        return SemanticResponseCache
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """time.monotonic을 고정된 시계로 대체"""
+        from backend.rag import semantic_cache
+        now = [1000.0]
+        monkeypatch.setattr(semantic_cache.time, "monotonic", lambda: now[0])
+        return now
+
+    def test_hit_same_key(self, cache_cls):
+        """같은 key의 유사한 임베딩은 적중"""
+        cache = cache_cls(capacity=4, threshold=0.95, ttl=0)
+        cache.store([1.0, 0.0, 0.0], ("query", 5), {"answer": "a"})
+
+        assert cache.lookup([0.99, 0.01, 0.0], ("query", 5)) == {"answer": "a"}
+
+    def test_miss_different_key(self, cache_cls):
+        """임베딩이 같아도 key가 다르면 적중하지 않음"""
+        cache = cache_cls(capacity=4, threshold=0.95, ttl=0)
+        cache.store([1.0, 0.0, 0.0], ("query", 5), {"answer": "a"})
+
+        assert cache.lookup([1.0, 0.0, 0.0], ("query", 10)) is None
+
+    def test_miss_dissimilar_embedding(self, cache_cls):
+        """유사도가 임계값 미만이면 적중하지 않음"""
+        cache = cache_cls(capacity=4, threshold=0.95, ttl=0)
+        cache.store([1.0, 0.0, 0.0], ("query", 5), {"answer": "a"})
+
+        assert cache.lookup([0.0, 1.0, 0.0], ("query", 5)) is None
+
+    def test_ttl_expiry(self, cache_cls, clock):
+        """ttl이 지난 항목은 적중으로 보지 않음"""
+        cache = cache_cls(capacity=4, threshold=0.95, ttl=60)
+        cache.store([1.0, 0.0], ("query", 5), {"answer": "a"})
+
+        clock[0] += 59
+        assert cache.lookup([1.0, 0.0], ("query", 5)) == {"answer": "a"}
+
+        clock[0] += 2
+        assert cache.lookup([1.0, 0.0], ("query", 5)) is None
+
+    def test_wrap_around(self, cache_cls):
+        """용량을 넘으면 가장 오래된 항목부터 덮어씀"""
+        cache = cache_cls(capacity=2, threshold=0.95, ttl=0)
+        cache.store([1.0, 0.0, 0.0], "a", {"answer": "a"})
+        cache.store([0.0, 1.0, 0.0], "b", {"answer": "b"})
+        cache.store([0.0, 0.0, 1.0], "c", {"answer": "c"})
+
+        assert len(cache) == 2
+        assert cache.lookup([1.0, 0.0, 0.0], "a") is None
+        assert cache.lookup([0.0, 1.0, 0.0], "b") == {"answer": "b"}
+        assert cache.lookup([0.0, 0.0, 1.0], "c") == {"answer": "c"}
+
+    def test_overwritten_keys_are_pruned(self, cache_cls):
+        """덮어써진 슬롯의 key는 더 이상 보관하지 않음"""
+        cache = cache_cls(capacity=4, threshold=0.95, ttl=0)
+        for budget in range(10000):
+            cache.store([1.0, 0.0], ("query-by-specs", budget), {"budget": budget})
+
+        assert len(cache._key_ids) == 4
+        assert cache.lookup([1.0, 0.0], ("query-by-specs", 9999)) == {"budget": 9999}
+        assert cache.lookup([1.0, 0.0], ("query-by-specs", 0)) is None
+
+    def test_shared_key_survives_partial_overwrite(self, cache_cls):
+        """같은 key의 다른 슬롯이 남아 있으면 key도 유지"""
+        cache = cache_cls(capacity=3, threshold=0.95, ttl=0)
+        cache.store([1.0, 0.0], "a", {"answer": "a1"})
+        cache.store([0.0, 1.0], "a", {"answer": "a2"})
+        cache.store([1.0, 1.0], "b", {"answer": "b"})
+        cache.store([1.0, 1.0], "c", {"answer": "c"})  # "a"의 첫 슬롯 덮어씀
+
+        assert cache.lookup([1.0, 0.0], "a") is None
+        assert cache.lookup([0.0, 1.0], "a") == {"answer": "a2"}
+
+    @pytest.mark.parametrize("capacity", [0, -1])
+    def test_zero_capacity_disables_cache(self, cache_cls, capacity):
+        """용량이 0 이하이면 저장/조회 모두 아무 동작도 하지 않음"""
+        cache = cache_cls(capacity=capacity, threshold=0.95, ttl=0)
+        cache.store([1.0, 0.0], "a", {"answer": "a"})
+
+        assert len(cache) == 0
+        assert cache.lookup([1.0, 0.0], "a") is None